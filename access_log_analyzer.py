@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+액세스 로그 분석기
+uvicorn / nginx 액세스 로그를 한 줄씩 읽어 각 요청을 API 카탈로그의 API ID로 분류하고,
+API별 지연시간 p50/p95/p99와 상태 코드 분포를 고정 크기 스케치로 집계한다
+
+지연시간은 명시적인 지연시간 필드에서만 읽는다 (common 형식 줄 끝의 숫자는 $body_bytes_sent이므로 쓰지 않는다).
+- nginx: 기본 combined 형식의 user-agent 따옴표 필드 바로 뒤에 $request_time(초)을 붙인 형식
+    log_format timed '$remote_addr - $remote_user [$time_local] "$request" '
+                     '$status $body_bytes_sent "$http_referer" "$http_user_agent" $request_time';
+- 키 형식: 줄 어디든 rt=0.123 또는 request_time=0.123 (초)
+- uvicorn: 기본 액세스 로그 뒤에 "12.3ms" 처럼 단위를 붙인 밀리초
+지연시간 필드가 없는 줄도 요청 수와 상태 코드는 집계되고, 그런 줄 수는 결과의 no_latency에 남는다.
+
+사용법:
+    python access_log_analyzer.py access.log [access.log.1.gz ...] -o traffic.json
+    python generate_api_docs.py --traffic traffic.json
+"""
+
+import argparse
+import contextlib
+import gzip
+import json
+import math
+import re
+import sys
+from collections import Counter
+from datetime import datetime
+
+from api_catalog import load_catalog
+
+# "GET /api/posts HTTP/1.1" 200  (nginx, uvicorn 공통)
+REQUEST_RE = re.compile(r'"(?P<method>[A-Z]+) (?P<target>\S+) HTTP/[\d.]+" (?P<status>\d{3})')
+# 지연시간 필드 (모두 명시적인 위치/이름/단위가 있는 것만 - 줄 끝의 아무 숫자나 읽지 않는다)
+# rt=0.123 / request_time=0.123 (초)
+LATENCY_KEY_RE = re.compile(r'(?<![\w.])(?:rt|request_time)=(?P<value>\d+(?:\.\d+)?)')
+# 상태 코드 뒤 $body_bytes_sent "$http_referer" "$http_user_agent" $request_time (초)
+LATENCY_AFTER_AGENT_RE = re.compile(
+    r'\s+\S+\s+"(?:[^"\\]|\\.)*"\s+"(?:[^"\\]|\\.)*"\s+(?P<value>\d+(?:\.\d+)?)(?=\s|$)')
+# 줄 끝 "12.3ms" (uvicorn, 밀리초)
+LATENCY_MS_RE = re.compile(r'\s(?P<value>\d+(?:\.\d+)?)ms\s*$')
+
+# 분석 결과에 남길 미분류 요청 예시 개수
+UNMATCHED_SAMPLE_SIZE = 20
+
+
+class LatencySketch:
+    """상대 오차가 보장되는 로그 버킷 분위수 스케치 (DDSketch 방식)
+
+    값 x는 ceil(log_gamma(x)) 버킷에 들어가고, 분위수 추정값의 상대 오차는 relative_accuracy 이내다.
+    버킷 수가 max_buckets를 넘으면 가장 작은 버킷들을 합쳐 메모리를 고정한다.
+    """
+    __slots__ = ('gamma', 'log_gamma', 'max_buckets', 'buckets', 'zero_count', 'count', 'total')
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        lowest, second = sorted(self.buckets)[:2]
+        self.buckets[second] += self.buckets.pop(lowest)
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.zero_count += other.zero_count
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q):
+        """q(0~1) 분위수 추정값, 데이터가 없으면 None"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+
+class EndpointStats:
+    """API 하나의 요청 수, 상태 코드 분포, 지연시간 스케치"""
+    __slots__ = ('requests', 'statuses', 'latency')
+
+    def __init__(self):
+        self.requests = 0
+        self.statuses = Counter()
+        self.latency = LatencySketch()
+
+    def to_dict(self):
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+        return {
+            "requests": self.requests,
+            "status_codes": {str(code): n for code, n in sorted(self.statuses.items())},
+            "latency_samples": self.latency.count,
+            "latency_ms": {
+                "p50": ms(self.latency.quantile(0.50)),
+                "p95": ms(self.latency.quantile(0.95)),
+                "p99": ms(self.latency.quantile(0.99)),
+                "mean": ms(self.latency.mean),
+            },
+        }
+
+
+def parse_line(line):
+    """로그 한 줄 -> (메서드, 요청 대상, 상태 코드, 지연시간(초) 또는 None), 요청 줄이 아니면 None"""
+    match = REQUEST_RE.search(line)
+    if match is None:
+        return None
+    latency = None
+    field = LATENCY_KEY_RE.search(line, match.end()) or LATENCY_AFTER_AGENT_RE.match(line, match.end())
+    if field is not None:
+        latency = float(field.group('value'))
+    else:
+        field = LATENCY_MS_RE.search(line, match.end())
+        if field is not None:
+            latency = float(field.group('value')) / 1000
+    return match.group('method'), match.group('target'), int(match.group('status')), latency
+
+
+class AccessLogAnalyzer:
+    """로그 줄을 스트리밍으로 받아 API별 통계를 누적 (메모리는 API 수에만 비례)"""
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog or load_catalog()
+        self.router = self.catalog.router
+        self.stats = {}
+        self.lines = 0
+        self.skipped = 0
+        self.unmatched = 0
+        self.no_latency = 0
+        self.unmatched_samples = []
+
+    def feed(self, line):
+        self.lines += 1
+        parsed = parse_line(line)
+        if parsed is None:
+            self.skipped += 1
+            return
+        method, target, status, latency = parsed
+        if latency is None:
+            self.no_latency += 1
+        match = self.router.classify(f"{method} {target}")
+        if match is None:
+            self.unmatched += 1
+            if len(self.unmatched_samples) < UNMATCHED_SAMPLE_SIZE:
+                self.unmatched_samples.append(f"{method} {target}")
+            return
+        stats = self.stats.get(match.endpoint.id)
+        if stats is None:
+            stats = self.stats[match.endpoint.id] = EndpointStats()
+        stats.requests += 1
+        stats.statuses[status] += 1
+        if latency is not None:
+            stats.latency.add(latency)
+
+    def feed_lines(self, lines):
+        for line in lines:
+            self.feed(line)
+
+    def report(self):
+        """generate_api_docs.py --traffic 으로 넘길 수 있는 JSON 호환 dict"""
+        endpoints = {}
+        for endpoint in self.catalog:
+            if endpoint.id in self.stats:
+                entry = self.stats[endpoint.id].to_dict()
+                entry["method"] = endpoint.method
+                entry["path"] = endpoint.path
+                endpoints[endpoint.id] = entry
+        return {
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "lines": self.lines,
+            "skipped": self.skipped,
+            "matched": self.lines - self.skipped - self.unmatched,
+            "unmatched": self.unmatched,
+            "no_latency": self.no_latency,
+            "unmatched_samples": self.unmatched_samples,
+            "endpoints": endpoints,
+        }
+
+
+def open_log(path):
+    """로그 파일 열기 ('-'는 표준 입력, .gz는 압축 해제하며 읽기)"""
+    if path == '-':
+        return contextlib.nullcontext(sys.stdin)  # with 블록이 표준 입력을 닫지 않도록
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def print_summary(report, top=15):
+    print(f"전체 {report['lines']}줄, 분류 {report['matched']}건, "
+          f"미분류 {report['unmatched']}건, 요청 외 {report['skipped']}줄")
+    if report.get('no_latency'):
+        print(f"  지연시간 필드 없는 요청 {report['no_latency']}줄 (요청 수/상태 코드만 집계)")
+    hot = sorted(report['endpoints'].items(), key=lambda item: -item[1]['requests'])[:top]
+    for api_id, entry in hot:
+        latency = entry['latency_ms']
+        print(f"  {api_id:>6} {entry['method']:<6} {entry['path']:<55} {entry['requests']:>9}건"
+              f"  p50={latency['p50']}ms p95={latency['p95']}ms p99={latency['p99']}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="액세스 로그를 API별 트래픽 통계로 집계")
+    parser.add_argument('logs', nargs='*', default=['-'], help="로그 파일 (.gz 가능, 생략하면 표준 입력)")
+    parser.add_argument('-o', '--output', help="결과 JSON 파일 경로 (생략하면 요약만 출력)")
+    parser.add_argument('--top', type=int, default=15, help="요약에 출력할 상위 API 수")
+    args = parser.parse_args(argv)
+
+    analyzer = AccessLogAnalyzer()
+    for path in args.logs:
+        with open_log(path) as f:
+            analyzer.feed_lines(f)
+    report = analyzer.report()
+    print_summary(report, top=args.top)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ 트래픽 통계 저장 완료: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Wedding OS API 카탈로그
+API_DATA(섹션 → API 중첩 dict/list)를 한 번 컴파일해서
+ID, (메서드, 경로), 섹션, 응답 모델 이름으로 바로 찾을 수 있는 읽기 전용 구조로 만든다
+
+API_DATA 원본은 api_data.json이다. load_api_data는 처음 읽을 때 pickle 사본을 __pycache__에 만들어 두고,
+원본의 수정 시각/크기가 같으면 사본을 mmap으로 읽는다 (JSON 파서 import/파싱 없이 약 1ms).
+load_catalog는 컴파일된 ApiCatalog(라우팅 트라이 포함)도 같은 방식으로 따로 저장해 두고 다시 컴파일하지 않는다.
+이 사본은 원본뿐 아니라 api_catalog.py / route_trie.py가 바뀌어도 무효가 된다.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+
+from route_trie import RouteTrie
+
+API_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'api_data.json')
+
+# pickle 사본 머리: 매직, 형식 버전, 원본 st_mtime_ns, 원본 st_size
+_CACHE_MAGIC = b'APIC'
+_CACHE_VERSION = 1
+_CACHE_HEADER = struct.Struct('<4sIqq')
+
+# 컴파일된 카탈로그 사본이 의존하는 코드 파일 (바뀌면 사본을 다시 만든다)
+_CATALOG_CODE_FILES = tuple(os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+                            for name in ('api_catalog.py', 'route_trie.py'))
+
+
+def api_sort_key(api):
+    """API ID 정렬 키: "9.1" -> (9, 1), "12.10" -> (12, 10)"""
+    try:
+        parts = api['id'].split('.')
+        return (int(parts[0]), int(parts[1]) if len(parts) > 1 else 0)
+    except (ValueError, AttributeError, KeyError):
+        return (999, 999)
+
+
+def section_sort_key(section):
+    """섹션 ID 정렬 키 (숫자가 아니면 맨 뒤로)"""
+    return int(section['id']) if section['id'].isdigit() else 999
+
+
+class _Frozen:
+    """__slots__ 기반 읽기 전용 레코드 공통 동작"""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 레코드는 수정할 수 없습니다")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} 레코드는 수정할 수 없습니다")
+
+    def _init(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        # 컴파일된 필드를 그대로 저장 (복원할 때 다시 컴파일하지 않고, raw dict는 pickle memo로 공유된다)
+        return (_restore_record, (type(self), tuple(getattr(self, name) for name in self.__slots__)))
+
+
+def _restore_record(cls, values):
+    record = object.__new__(cls)
+    for name, value in zip(cls.__slots__, values, strict=True):
+        object.__setattr__(record, name, value)
+    return record
+
+
+class Endpoint(_Frozen):
+    """API 하나 (raw는 원본 dict - 렌더러가 그대로 사용하므로 수정하지 말 것)"""
+    __slots__ = ('id', 'name', 'method', 'path', 'request', 'response', 'auth', 'description',
+                 'query_params', 'path_params', 'headers', 'body', 'body_required',
+                 'body_optional', 'status_codes', 'section_id', 'sort_key', 'raw')
+
+    def __init__(self, raw, section_id):
+        self._init(
+            id=raw['id'],
+            name=raw['name'],
+            method=raw['method'].upper(),
+            path=raw['path'],
+            request=raw.get('request'),
+            response=raw.get('response'),
+            auth=bool(raw.get('auth')),
+            description=raw.get('description', ''),
+            query_params=tuple(raw.get('query_params') or ()),
+            path_params=tuple(raw.get('path_params') or ()),
+            headers=tuple(raw.get('headers') or ()),
+            body=raw.get('body'),
+            body_required=tuple(raw.get('body_required') or ()),
+            body_optional=tuple(raw.get('body_optional') or ()),
+            status_codes=tuple(raw.get('status_codes') or ()),
+            section_id=section_id,
+            sort_key=api_sort_key(raw),
+            raw=raw,
+        )
+
+    def __repr__(self):
+        return f"<Endpoint {self.id} {self.method} {self.path}>"
+
+
+class Section(_Frozen):
+    """섹션 하나 - endpoints는 원본 순서, sorted_endpoints는 ID 순서"""
+    __slots__ = ('id', 'name', 'endpoints', 'sorted_endpoints', 'sort_key', 'raw')
+
+    def __init__(self, raw):
+        endpoints = tuple(Endpoint(api, raw['id']) for api in raw['apis'])
+        self._init(
+            id=raw['id'],
+            name=raw['name'],
+            endpoints=endpoints,
+            sorted_endpoints=tuple(sorted(endpoints, key=lambda e: e.sort_key)),
+            sort_key=section_sort_key(raw),
+            raw=raw,
+        )
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    def __repr__(self):
+        return f"<Section {self.id} {self.name} ({len(self.endpoints)}개 API)>"
+
+
+class ApiCatalog:
+    """API_DATA를 컴파일한 읽기 전용 카탈로그"""
+
+    def __init__(self, api_data):
+        self.base_url = api_data.get('base_url', '')
+        self.sections = tuple(sorted((Section(raw) for raw in api_data['sections']),
+                                     key=lambda s: s.sort_key))
+        self.endpoints = tuple(e for s in self.sections for e in s.sorted_endpoints)
+
+        by_id, by_route, by_response = {}, {}, {}
+        for endpoint in self.endpoints:
+            if endpoint.id in by_id:
+                raise ValueError(f"중복된 API ID: {endpoint.id}")
+            route = (endpoint.method, endpoint.path)
+            if route in by_route:
+                raise ValueError(f"중복된 API 경로: {endpoint.method} {endpoint.path} "
+                                 f"({by_route[route].id}, {endpoint.id})")
+            by_id[endpoint.id] = endpoint
+            by_route[route] = endpoint
+            if endpoint.response:
+                by_response.setdefault(endpoint.response, []).append(endpoint)
+
+        self.by_id = MappingProxyType(by_id)
+        self.by_route = MappingProxyType(by_route)
+        self.by_section = MappingProxyType({s.id: s for s in self.sections})
+        self.by_response = MappingProxyType({k: tuple(v) for k, v in by_response.items()})
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for name, value in state.items():
+            if isinstance(value, MappingProxyType):
+                state[name] = dict(value)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            self.__dict__[name] = MappingProxyType(value) if name.startswith('by_') else value
+
+    @classmethod
+    def ensure(cls, api_data):
+        """이미 컴파일된 카탈로그면 그대로, API_DATA dict면 컴파일해서 반환"""
+        return api_data if isinstance(api_data, cls) else cls(api_data)
+
+    def get(self, api_id):
+        """API ID("9.6")로 조회, 없으면 None"""
+        return self.by_id.get(api_id)
+
+    def find(self, method, path):
+        """(메서드, 템플릿 경로)로 조회, 없으면 None"""
+        return self.by_route.get((method.upper(), path))
+
+    def section(self, section_id):
+        return self.by_section.get(section_id)
+
+    def resolve(self, key):
+        """API ID("3.8"), "메서드 경로"("POST /api/posts/upload"), API 이름 중 하나로 조회
+
+        설정 파일처럼 사람이 쓰는 키를 받을 때 사용한다. 찾지 못하거나 이름이 겹치면 ValueError.
+        """
+        endpoint = self.by_id.get(key)
+        if endpoint is None and ' ' in key:
+            method, _, path = key.partition(' ')
+            endpoint = self.find(method, path.strip())
+        if endpoint is None:
+            named = [e for e in self.endpoints if e.name == key]
+            if len(named) > 1:
+                raise ValueError(f"API 이름이 여러 API와 겹칩니다: {key} ({', '.join(e.id for e in named)})")
+            endpoint = named[0] if named else None
+        if endpoint is None:
+            raise ValueError(f"알 수 없는 API: {key}")
+        return endpoint
+
+    def responding_with(self, model_name):
+        """응답 모델 이름으로 API 목록 조회"""
+        return self.by_response.get(model_name, ())
+
+    @cached_property
+    def router(self):
+        """실제 요청 경로 -> API 매칭용 트라이 (처음 쓸 때 한 번 컴파일)"""
+        return RouteTrie(self.endpoints)
+
+    def match(self, method, path):
+        """실제 요청 경로("/api/posts/3")로 RouteMatch(endpoint, params) 조회, 없으면 None"""
+        return self.router.match(method, path)
+
+    def __iter__(self):
+        return iter(self.endpoints)
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    def __contains__(self, api_id):
+        return api_id in self.by_id
+
+    def __repr__(self):
+        return f"<ApiCatalog 섹션 {len(self.sections)}개, API {len(self.endpoints)}개>"
+
+
+def _cache_path(path, kind=''):
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, '__pycache__', f"{name}{kind}.pickle")
+
+
+def _read_cache(cache_path, key):
+    try:
+        with open(cache_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < _CACHE_HEADER.size:
+                return None
+            magic, version, mtime_ns, size = _CACHE_HEADER.unpack_from(mm)
+            if (magic, version, mtime_ns, size) != (_CACHE_MAGIC, _CACHE_VERSION, *key):
+                return None
+            with memoryview(mm)[_CACHE_HEADER.size:] as view:
+                return pickle.loads(view)
+    except (OSError, ValueError, EOFError, AttributeError, ImportError, TypeError, pickle.UnpicklingError):
+        # 사본이 없거나 깨졌거나 이전 코드로 만든 것이면 다시 만든다
+        return None
+
+
+def _write_cache(cache_path, key, value):
+    """pickle 사본 기록 (읽기 전용 디렉토리 등으로 실패하면 조용히 넘어간다)"""
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, *key))
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def load_api_data(path=API_DATA_PATH):
+    """API_DATA 원본 파일(JSON) 읽기 - 바뀌지 않았으면 __pycache__의 pickle 사본 사용
+
+    호출할 때마다 새 dict를 반환한다.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cache_path = _cache_path(path)
+    api_data = _read_cache(cache_path, key)
+    if api_data is not None:
+        return api_data
+    # JSON 파서(orjson이 있으면 사용)는 사본이 없을 때만 필요하므로 여기서 import (시작 시간 절약)
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    with open(path, 'rb') as f:
+        api_data = loads(f.read())
+    _write_cache(cache_path, key, api_data)
+    return api_data
+
+
+@lru_cache(maxsize=None)
+def load_catalog(path=API_DATA_PATH):
+    """API_DATA 원본 파일을 컴파일한 공용 카탈로그 (프로세스당 한 번)
+
+    원본과 api_catalog.py / route_trie.py가 바뀌지 않았으면 __pycache__의 컴파일된 사본을 읽는다.
+    """
+    stats = [os.stat(name) for name in (path, *_CATALOG_CODE_FILES)]
+    key = (max(st.st_mtime_ns for st in stats), sum(st.st_size for st in stats))
+    cache_path = _cache_path(path, '.catalog')
+    catalog = _read_cache(cache_path, key)
+    if isinstance(catalog, ApiCatalog):
+        return catalog
+    catalog = ApiCatalog(load_api_data(path))
+    _ = catalog.router  # 라우팅 트라이도 함께 저장
+    _write_cache(cache_path, key, catalog)
+    return catalog
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 명세서 검색 인덱스
+카탈로그의 API 이름, 경로, 설명, 파라미터/본문 필드 이름, 응답 메시지로부터 역색인을 미리 만들어
+생성된 명세서 페이지의 검색창이 DOM을 훑지 않고 바로 조회하게 한다.
+
+토큰 규칙 (페이지의 검색 스크립트와 같아야 한다):
+- 소문자로 바꾼 뒤 "3.2" 같은 점으로 이은 숫자, [a-z0-9_] 단어, 한글 연속 구간으로 나눈다
+- 영문 단어는 밑줄 앞뒤를 떼고 통째로 + 밑줄/camelCase로 나눈 부분(2자 이상)도 색인, 검색은 접두어 일치
+- 한글 구간은 2글자씩 겹쳐 자른 bigram으로 색인 ("게시글" -> "게시", "시글"), 한 글자면 그대로
+
+인덱스 형식 (JSON):
+    {"version": 1,
+     "docs": [[API ID, 이름, 메서드, 경로, 섹션 ID], ...],
+     "terms": [정렬된 토큰, ...],
+     "postings": [[문서 번호 * 4 + 필드 가중치, ...], ...]}   # terms와 같은 순서
+필드 가중치는 이름/API ID 3, 경로 2, 나머지 1 (토큰이 여러 필드에 있으면 가장 큰 값).
+
+페이지에는 apiSearchIndexLoaded(인덱스); 형태의 스크립트 파일로 내보낸다.
+검색창에 처음 포커스할 때 <script>로 불러오므로 file://로 연 페이지에서도 동작한다.
+"""
+
+import json
+import re
+from bisect import bisect_left
+
+INDEX_VERSION = 1
+
+# 필드 가중치 (2비트에 들어가야 한다)
+WEIGHT_NAME = 3
+WEIGHT_PATH = 2
+WEIGHT_TEXT = 1
+
+# 페이지 스크립트의 WORD_RE와 같은 규칙
+WORD_RE = re.compile(r'\d+(?:\.\d+)+|[a-z0-9_]+|[가-힣]+')
+CAMEL_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+HANGUL_RE = re.compile(r'[가-힣]+')
+
+
+def _hangul_grams(run):
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def tokenize(text):
+    """색인용 토큰 목록 (중복 포함)"""
+    if not text:
+        return []
+    text = str(text)
+    tokens = []
+    # 대소문자를 잃기 전에 camelCase 모델 이름(PostDetailResponse)을 나눠 둔다
+    for word in re.findall(r'[A-Za-z0-9]+', text):
+        if word != word.lower() and word != word.upper():
+            tokens.extend(part.lower() for part in CAMEL_RE.findall(word) if len(part) >= 2)
+    for word in WORD_RE.findall(text.lower()):
+        if HANGUL_RE.fullmatch(word):
+            tokens.extend(_hangul_grams(word))
+            continue
+        word = word.strip('_')
+        if len(word) >= 2:
+            tokens.append(word)
+        if '_' in word:
+            tokens.extend(part for part in word.split('_') if len(part) >= 2)
+    return tokens
+
+
+def _endpoint_fields(endpoint):
+    """(가중치, 텍스트) 목록"""
+    yield WEIGHT_NAME, endpoint.id
+    yield WEIGHT_NAME, endpoint.name
+    yield WEIGHT_PATH, endpoint.path
+    yield WEIGHT_TEXT, endpoint.method
+    yield WEIGHT_TEXT, endpoint.description
+    yield WEIGHT_TEXT, endpoint.request
+    yield WEIGHT_TEXT, endpoint.response
+    for param in endpoint.query_params + endpoint.path_params:
+        yield WEIGHT_TEXT, param.get('name')
+    for field in endpoint.body or ():
+        yield WEIGHT_TEXT, field
+    for status in endpoint.status_codes:
+        yield WEIGHT_TEXT, status.get('message')
+        yield WEIGHT_TEXT, status.get('msg')
+
+
+def build_search_index(catalog):
+    """ApiCatalog -> 검색 인덱스 dict (문서 순서는 카탈로그의 정렬 순서)"""
+    docs = []
+    postings = {}
+    tokenized = {}  # 응답 메시지처럼 반복되는 텍스트는 한 번만 토큰화
+    for doc, endpoint in enumerate(catalog):
+        docs.append([endpoint.id, endpoint.name, endpoint.method, endpoint.path, endpoint.section_id])
+        for weight, text in _endpoint_fields(endpoint):
+            if not isinstance(text, str):
+                text = '' if text is None else str(text)
+            tokens = tokenized.get(text)
+            if tokens is None:
+                tokens = tokenized[text] = set(tokenize(text))
+            for token in tokens:
+                entries = postings.setdefault(token, {})
+                if entries.get(doc, 0) < weight:
+                    entries[doc] = weight
+    terms = sorted(postings)
+    return {
+        "version": INDEX_VERSION,
+        "docs": docs,
+        "terms": terms,
+        "postings": [[doc * 4 + weight for doc, weight in sorted(postings[term].items())] for term in terms],
+    }
+
+
+def dump_search_script(index):
+    """페이지가 <script>로 불러갈 수 있는 형태의 인덱스 파일 내용"""
+    payload = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    return f"apiSearchIndexLoaded({payload});\n"
+
+
+def search(index, query, limit=20):
+    """페이지 검색 스크립트와 같은 방식의 검색 (점검용) -> [(점수, API ID), ...]
+
+    모든 검색어가 일치해야 하고(AND), 한글 검색어는 마지막 bigram을 뺀 나머지가 모두 일치하면 일치로 본다 -
+    "예산을"처럼 끝에 조사가 붙어도 "예산"을 찾도록. 마지막 bigram은 일치하면 점수에만 더한다.
+    """
+    terms, postings = index['terms'], index['postings']
+
+    def lookup(word, exact):
+        found = {}
+        i = bisect_left(terms, word)
+        while i < len(terms) and (terms[i] == word if exact else terms[i].startswith(word)):
+            for entry in postings[i]:
+                doc, weight = entry >> 2, entry & 3
+                if found.get(doc, 0) < weight:
+                    found[doc] = weight
+            i += 1
+        return found
+
+    def match(word):
+        if not HANGUL_RE.fullmatch(word):
+            return lookup(word.strip('_'), False)
+        if len(word) == 1:
+            return lookup(word, False)
+        grams = _hangul_grams(word)
+        if len(grams) == 1:
+            return lookup(grams[0], True)
+        scores = None
+        for gram in grams[:-1]:
+            found = lookup(gram, True)
+            scores = found if scores is None else {d: s + found[d] for d, s in scores.items() if d in found}
+            if not scores:
+                return {}
+        last = lookup(grams[-1], True)
+        return {doc: score + last.get(doc, 0) for doc, score in scores.items()}
+
+    scores = None
+    for word in WORD_RE.findall(query.lower()):
+        found = match(word)
+        scores = found if scores is None else {d: s + found[d] for d, s in scores.items() if d in found}
+        if not scores:
+            break
+    ranked = sorted((scores or {}).items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [(score, index['docs'][doc][0]) for doc, score in ranked]
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+부하 테스트/하네스용 최소 asyncio HTTP/1.1 클라이언트
+외부 패키지 없이 keep-alive 연결 풀, Content-Length/chunked 응답, 응답 본문 스트리밍 읽기를 지원한다
+"""
+
+import asyncio
+import json
+import ssl
+from contextlib import asynccontextmanager
+from urllib.parse import urlencode, urlsplit
+
+
+class HttpError(Exception):
+    """연결/프로토콜 오류 (HTTP 상태 코드 오류는 예외가 아니라 응답으로 돌려준다)"""
+
+
+class HttpResponse:
+    __slots__ = ('status', 'headers', 'body')
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class StreamResponse:
+    """본문을 다 읽지 않은 응답 - iter_chunks()/iter_lines()로 도착하는 대로 읽는다"""
+
+    def __init__(self, status, headers, reader, connection, has_body=True):
+        self.status = status
+        self.headers = headers
+        self._reader = reader
+        self._connection = connection
+        self._has_body = has_body
+        self.complete = False
+
+    async def iter_chunks(self):
+        """본문 조각을 도착하는 대로 생성 (chunked / Content-Length / 연결 종료까지)"""
+        reader = self._reader
+        if not self._has_body:
+            pass
+        elif self.headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size_line = await reader.readuntil(b'\r\n')
+                size = int(size_line.split(b';', 1)[0], 16)
+                if size == 0:
+                    # 트레일러 헤더는 무시하고 빈 줄까지 소비
+                    while await reader.readuntil(b'\r\n') != b'\r\n':
+                        pass
+                    break
+                data = await reader.readexactly(size)
+                await reader.readexactly(2)
+                yield data
+        elif 'content-length' in self.headers:
+            remaining = int(self.headers['content-length'])
+            while remaining:
+                data = await reader.read(min(remaining, 65536))
+                if not data:
+                    raise HttpError("응답 본문이 Content-Length보다 짧습니다")
+                remaining -= len(data)
+                yield data
+        else:
+            self._connection.reusable = False
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                yield data
+        self.complete = True
+
+    async def iter_lines(self):
+        """본문을 줄 단위로 생성 (NDJSON 등) - 전체 응답을 버퍼링하지 않는다"""
+        pending = b''
+        async for chunk in self.iter_chunks():
+            pending += chunk
+            *lines, pending = pending.split(b'\n')
+            for line in lines:
+                yield line
+        if pending:
+            yield pending
+
+    async def read(self):
+        return b''.join([chunk async for chunk in self.iter_chunks()])
+
+
+class _Connection:
+    __slots__ = ('reader', 'writer', 'reusable')
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncHttpClient:
+    """한 호스트에 대한 keep-alive 연결 풀 클라이언트
+
+    base_url: "http://localhost:8101" (요청 경로는 "/api/..." 처럼 절대 경로로 넘긴다)
+    """
+
+    def __init__(self, base_url, max_connections=100, timeout=30.0):
+        url = urlsplit(base_url)
+        self.scheme = url.scheme or 'http'
+        self.host = url.hostname or 'localhost'
+        self.port = url.port or (443 if self.scheme == 'https' else 80)
+        self.prefix = url.path.rstrip('/')
+        self.timeout = timeout
+        self._ssl = ssl.create_default_context() if self.scheme == 'https' else None
+        self._idle = []
+        self._slots = asyncio.Semaphore(max_connections)
+        host_header = self.host if self.port in (80, 443) else f"{self.host}:{self.port}"
+        self._host_header = host_header
+
+    async def _acquire(self):
+        while self._idle:
+            connection = self._idle.pop()
+            if not connection.writer.is_closing() and not connection.reader.at_eof():
+                return connection
+            connection.close()
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self._ssl)
+        return _Connection(reader, writer)
+
+    def _release(self, connection, ok):
+        if ok and connection.reusable and not connection.writer.is_closing():
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+    def _encode(self, method, path, params, headers, body):
+        if params:
+            path = f"{path}?{urlencode(params, doseq=True)}"
+        headers = dict(headers or {})
+        if body is not None and not isinstance(body, (bytes, bytearray)):
+            body = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            headers.setdefault('Content-Type', 'application/json')
+        lines = [f"{method} {self.prefix}{path} HTTP/1.1", f"Host: {self._host_header}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8') + (body or b'')
+
+    async def _read_head(self, reader):
+        head = await reader.readuntil(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        try:
+            status = int(status_line.split(' ', 2)[1])
+        except (IndexError, ValueError):
+            raise HttpError(f"잘못된 응답 상태 줄: {status_line!r}") from None
+        headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+        return status, headers
+
+    @asynccontextmanager
+    async def stream(self, method, path, params=None, headers=None, body=None):
+        """응답 헤더까지만 받고 StreamResponse를 넘긴다 (본문은 호출한 쪽에서 읽기)"""
+        async with self._slots:
+            connection = await asyncio.wait_for(self._acquire(), self.timeout)
+            ok = False
+            try:
+                connection.writer.write(self._encode(method, path, params, headers, body))
+                await connection.writer.drain()
+                while True:
+                    status, response_headers = await asyncio.wait_for(
+                        self._read_head(connection.reader), self.timeout)
+                    if status != 100:
+                        break
+                if response_headers.get('connection', '').lower() == 'close':
+                    connection.reusable = False
+                # HEAD, 204, 304 응답에는 본문이 없다
+                has_body = method != 'HEAD' and status not in (204, 304)
+                response = StreamResponse(status, response_headers, connection.reader, connection,
+                                          has_body)
+                yield response
+                ok = response.complete
+            except (asyncio.IncompleteReadError, ConnectionError, asyncio.LimitOverrunError) as exc:
+                raise HttpError(str(exc) or type(exc).__name__) from exc
+            finally:
+                self._release(connection, ok)
+
+    async def request(self, method, path, params=None, headers=None, body=None):
+        """요청 하나를 보내고 본문까지 다 읽은 HttpResponse 반환"""
+        async with self.stream(method, path, params, headers, body) as response:
+            data = await asyncio.wait_for(response.read(), self.timeout)
+            return HttpResponse(response.status, response.headers, data)
+
+    async def close(self):
+        for connection in self._idle:
+            connection.close()
+        self._idle.clear()
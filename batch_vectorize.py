@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+게시글 일괄 벡터화 파이프라인
+"게시글 일괄 벡터화"(POST /api/vector/posts/batch-vectorize)는 호출 한 번에 limit(최대 1000)건만 처리하므로,
+전체 게시판 이력을 다시 색인하려면 수백 번 호출해야 한다. 이 도구는 같은 배치 단위(limit 범위)로
+게시글을 페이지 단위로 읽으며 워커 프로세스 풀에서 임베딩하고, 배치마다 결과와 진행 위치를 기록해
+중단된 지점부터 이어서 실행한다. 끝나면 vector_index.py 인덱스로 합쳐 저장한다.
+
+게시글 원본 (하나 선택):
+- --base-url: 백엔드의 게시글 목록 API(GET /api/posts?board_type=&page=&limit=)를 게시판별로 끝까지 페이지 이동
+- --posts: JSONL 내보내기 파일 ({"post_id", "board_type", "title", "content"} 한 줄에 하나)
+- --synthetic: 합성 게시글 N건 (처리량 측정용)
+
+출력 디렉토리:
+    checkpoint.json     원본/임베더/진행 위치(cursor)/완료 배치 수 - 배치가 기록될 때마다 원자적으로 갱신
+    chunks/00000012.npz 배치 하나의 post_id, board_type, 임베딩
+    vectors.npy ...     모든 배치를 합친 VectorIndex (같은 post_id는 나중 배치 우선)
+
+임베더는 --embedder로 바꿀 수 있다: 기본 'hashing'(vector_index.HashingEmbedder), 또는 'module:Factory' -
+인자 없이 호출하면 .name, .dim, .embed(texts) -> (n, dim) 정규화 float32 행렬을 가진 객체를 돌려주는 callable.
+
+사용법:
+    python batch_vectorize.py --synthetic 200000 -o vector_posts/
+    python batch_vectorize.py --base-url http://localhost:8000 --batch-size 500 -o vector_posts/
+    python batch_vectorize.py --posts posts.jsonl -o vector_posts/ --embedder my_embedders:MiniLM
+    (중단 후 같은 명령을 다시 실행하면 이어서 처리, --restart는 처음부터)
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import random
+import shutil
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from api_catalog import load_catalog
+from async_http import AsyncHttpClient
+from openapi_export import param_schema
+from vector_index import EMBEDDING_DIM, META_FILE, HashingEmbedder, VectorIndex, board_types
+
+CHECKPOINT_FILE = 'checkpoint.json'
+CHUNK_DIR = 'chunks'
+CHECKPOINT_VERSION = 1
+
+BATCH_API = 'POST /api/vector/posts/batch-vectorize'
+LIST_API = 'GET /api/posts'
+
+# 진행 상황 출력 간격 (초)
+PROGRESS_INTERVAL = 5.0
+
+EMBEDDERS = {'hashing': HashingEmbedder}
+
+SYNTHETIC_WORDS = ('웨딩홀', '스드메', '드레스', '메이크업', '스튜디오', '예산', '하객', '식대', '청첩장', '신혼여행',
+                   '플래너', '상견례', '예물', '본식', '리허설', '부케', '주차', '대관료', '계약금', '후기')
+
+
+def batch_limits(catalog):
+    """일괄 벡터화 API 문서의 limit (기본값, 최소, 최대)"""
+    endpoint = catalog.resolve(BATCH_API)
+    for param in endpoint.query_params:
+        if param['name'] == 'limit':
+            schema = param_schema(param)
+            return schema.get('default', 100), schema.get('minimum', 1), schema.get('maximum', 1000)
+    return 100, 1, 1000
+
+
+def load_embedder(spec, dim=EMBEDDING_DIM):
+    """'hashing' 또는 'module:Factory' -> 임베더"""
+    if spec in EMBEDDERS:
+        return EMBEDDERS[spec](dim)
+    module_name, _, attr = spec.partition(':')
+    if not attr:
+        raise ValueError(f"임베더는 {', '.join(EMBEDDERS)} 또는 'module:Factory' 형식이어야 합니다: {spec}")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+def post_text(post):
+    return f"{post.get('title') or ''}\n{post.get('content') or ''}"
+
+
+# 워커 프로세스마다 한 번 만든 임베더 (모델 로딩 비용을 배치마다 치르지 않도록)
+_worker_embedder = None
+
+
+def _init_worker(spec, dim):
+    global _worker_embedder
+    _worker_embedder = load_embedder(spec, dim)
+
+
+def _embed_batch(texts):
+    started = time.perf_counter()
+    vectors = np.asarray(_worker_embedder.embed(texts), dtype=np.float32)
+    return vectors, time.perf_counter() - started
+
+
+class SyntheticSource:
+    """post_id 1..count 합성 게시글 (같은 ID는 항상 같은 글) - cursor: 다음 인덱스"""
+
+    def __init__(self, count, boards):
+        self.count = count
+        self.boards = boards
+
+    def describe(self):
+        return {"type": "synthetic", "count": self.count}
+
+    def _post(self, index):
+        rng = random.Random(index)
+        words = rng.choices(SYNTHETIC_WORDS, k=rng.randint(8, 40))
+        return {"post_id": index + 1, "board_type": self.boards[index % len(self.boards)],
+                "title": ' '.join(words[:4]), "content": ' '.join(words)}
+
+    async def batches(self, cursor, size):
+        start = cursor or 0
+        for lo in range(start, self.count, size):
+            hi = min(lo + size, self.count)
+            yield hi, [self._post(i) for i in range(lo, hi)]
+
+
+class JsonlSource:
+    """JSONL 내보내기 파일 - cursor: 다음 줄의 바이트 위치 (재개할 때 앞부분을 다시 읽지 않는다)"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def describe(self):
+        return {"type": "jsonl", "path": os.path.abspath(self.path)}
+
+    async def batches(self, cursor, size):
+        with open(self.path, 'rb') as f:
+            f.seek(cursor or 0)
+            batch = []
+            while True:
+                line = f.readline()
+                if line.strip():
+                    batch.append(json.loads(line))
+                if len(batch) == size or (not line and batch):
+                    yield f.tell(), batch
+                    batch = []
+                if not line:
+                    return
+
+
+class ApiSource:
+    """백엔드 게시글 목록 API를 게시판별로 페이지 이동 - cursor: {"board": 게시판 순번, "page": 다음 페이지}"""
+
+    def __init__(self, base_url, boards, token=None, timeout=60.0):
+        self.base_url = base_url
+        self.boards = boards
+        self.token = token
+        self.timeout = timeout
+        self.path = load_catalog().resolve(LIST_API).path
+
+    def describe(self):
+        return {"type": "api", "base_url": self.base_url, "boards": list(self.boards)}
+
+    async def batches(self, cursor, size):
+        cursor = cursor or {"board": 0, "page": 1}
+        headers = {'Authorization': f'Bearer {self.token}'} if self.token else {}
+        client = AsyncHttpClient(self.base_url, max_connections=1, timeout=self.timeout)
+        try:
+            for board_index in range(cursor["board"], len(self.boards)):
+                board = self.boards[board_index]
+                page = cursor["page"] if board_index == cursor["board"] else 1
+                while True:
+                    response = await client.request('GET', self.path, {"board_type": board, "page": page,
+                                                                       "limit": size}, headers)
+                    if response.status != 200:
+                        raise RuntimeError(f"게시글 목록 조회 실패: {board} {page}페이지 {response.status}")
+                    posts = (response.json().get('data') or {}).get('posts') or []
+                    for post in posts:
+                        post.setdefault('board_type', board)
+                    last = len(posts) < size
+                    after = {"board": board_index + 1, "page": 1} if last else {"board": board_index, "page": page + 1}
+                    if posts:
+                        yield after, posts
+                    if last:
+                        break
+                    page += 1
+        finally:
+            await client.close()
+
+
+def _write_json_atomic(path, data):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+class BatchVectorizer:
+    """원본 -> 배치 임베딩(워커 풀) -> 순서대로 청크/체크포인트 기록"""
+
+    def __init__(self, source, out_dir, embedder='hashing', dim=EMBEDDING_DIM, batch_size=100, workers=1,
+                 max_posts=None):
+        self.source = source
+        self.out_dir = out_dir
+        self.embedder = embedder
+        self.dim = dim
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_posts = max_posts
+        self.checkpoint_path = os.path.join(out_dir, CHECKPOINT_FILE)
+        self.chunk_dir = os.path.join(out_dir, CHUNK_DIR)
+        self.state = None
+        self.embed_seconds = 0.0
+        self.processed = 0
+
+    def _fresh_state(self):
+        return {"version": CHECKPOINT_VERSION, "source": self.source.describe(), "embedder": self.embedder,
+                "dim": self.dim, "batch_size": self.batch_size, "cursor": None, "batches": 0,
+                "vectorized": 0, "complete": False}
+
+    def load_state(self, restart=False):
+        """체크포인트 읽기 - 원본/임베더가 다르면 섞이지 않도록 ValueError (restart면 지우고 처음부터)"""
+        if restart and os.path.isdir(self.chunk_dir):
+            shutil.rmtree(self.chunk_dir)
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        state = None
+        if not restart and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            fresh = self._fresh_state()
+            for key in ('version', 'source', 'embedder', 'dim', 'batch_size'):
+                if state.get(key) != fresh[key]:
+                    raise ValueError(f"체크포인트의 {key}가 다릅니다 ({state.get(key)!r} != {fresh[key]!r}) "
+                                     f"- 처음부터 하려면 --restart")
+        self.state = state or self._fresh_state()
+        return self.state
+
+    def _commit(self, cursor, ids, boards, vectors):
+        """배치 하나 기록: 청크 파일을 먼저 쓰고 체크포인트를 갱신 (중간에 죽으면 이 배치만 다시 처리)"""
+        seq = self.state["batches"]
+        path = os.path.join(self.chunk_dir, f"{seq:08d}.npz")
+        with open(path + '.tmp', 'wb') as f:
+            np.savez(f, ids=np.asarray(ids, dtype=np.int64), boards=np.asarray(boards), vectors=vectors)
+        os.replace(path + '.tmp', path)
+        self.state.update(cursor=cursor, batches=seq + 1, vectorized=self.state["vectorized"] + len(ids))
+        _write_json_atomic(self.checkpoint_path, self.state)
+        self.processed += len(ids)
+
+    async def run(self, progress=PROGRESS_INTERVAL):
+        loop = asyncio.get_running_loop()
+        executor = None
+        if self.workers > 0:
+            executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.embedder, self.dim))
+        else:
+            _init_worker(self.embedder, self.dim)
+        # 워커가 쉬지 않도록 워커 수의 두 배까지 배치를 미리 넘기고, 완료는 넘긴 순서대로 기록한다
+        window = deque()
+        limit = max(2 * self.workers, 1)
+        started = last_report = time.perf_counter()
+        remaining = None if self.max_posts is None else self.max_posts
+
+        async def commit_head():
+            nonlocal last_report
+            cursor, ids, boards, future = window.popleft()
+            vectors, seconds = await future
+            self.embed_seconds += seconds
+            self._commit(cursor, ids, boards, vectors)
+            now = time.perf_counter()
+            if progress and now - last_report >= progress:
+                last_report = now
+                print(f"  {self.state['vectorized']:>10,}건 (배치 {self.state['batches']:,}개), "
+                      f"{self.processed / (now - started):,.0f}건/s")
+
+        batches = self.source.batches(self.state["cursor"], self.batch_size)
+        try:
+            async for cursor, posts in batches:
+                if remaining is not None:
+                    # 배치 중간에서는 재개 위치(cursor)를 남길 수 없으므로, 한도를 넘기는 배치는 넘기지 않고 멈춘다
+                    if len(posts) > remaining:
+                        break
+                    remaining -= len(posts)
+                texts = [post_text(post) for post in posts]
+                if executor is not None:
+                    future = loop.run_in_executor(executor, _embed_batch, texts)
+                else:
+                    future = loop.create_future()
+                    future.set_result(_embed_batch(texts))
+                window.append((cursor, [int(p['post_id']) for p in posts],
+                               [p.get('board_type') or '' for p in posts], future))
+                if len(window) >= limit:
+                    await commit_head()
+            else:
+                while window:
+                    await commit_head()
+                self.state["complete"] = True
+                _write_json_atomic(self.checkpoint_path, self.state)
+            while window:
+                await commit_head()
+        finally:
+            await batches.aclose()
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return time.perf_counter() - started
+
+    def build_index(self):
+        """모든 청크를 합쳐 out_dir에 VectorIndex로 저장 (같은 post_id는 나중 배치 값)"""
+        ids, boards, vectors = [], [], []
+        for seq in range(self.state["batches"]):
+            with np.load(os.path.join(self.chunk_dir, f"{seq:08d}.npz")) as chunk:
+                ids.append(chunk['ids'])
+                boards.append(chunk['boards'])
+                vectors.append(chunk['vectors'])
+        if not ids:
+            return None
+        ids, boards, vectors = np.concatenate(ids), np.concatenate(boards), np.concatenate(vectors)
+        _, last = np.unique(ids[::-1], return_index=True)
+        keep = np.sort(len(ids) - 1 - last)
+        if len(keep) < len(ids):
+            ids, boards, vectors = ids[keep], boards[keep], vectors[keep]
+        index = VectorIndex.build(ids, vectors, boards, load_embedder(self.embedder, self.dim))
+        index.save(self.out_dir)
+        return index
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="게시글 일괄 벡터화 (배치, 워커 풀, 중단 후 재개)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--base-url', help="백엔드 주소 - 게시글 목록 API를 게시판별로 페이지 이동")
+    source.add_argument('--posts', metavar='JSONL', help="게시글 JSONL 파일")
+    source.add_argument('--synthetic', type=int, metavar='N', help="합성 게시글 N건")
+    parser.add_argument('-o', '--output', required=True, help="출력 디렉토리 (체크포인트, 청크, 인덱스)")
+    parser.add_argument('--batch-size', type=int, help="배치 크기 (기본값: 일괄 벡터화 API의 limit 기본값)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="임베딩 워커 프로세스 수 (0이면 현재 프로세스, 기본값: CPU 수)")
+    parser.add_argument('--embedder', default='hashing', help="임베더 ('hashing' 또는 'module:Factory')")
+    parser.add_argument('--dim', type=int, default=EMBEDDING_DIM, help=f"hashing 임베더 차원 (기본값: {EMBEDDING_DIM})")
+    parser.add_argument('--token', help="--base-url 요청에 쓸 액세스 토큰")
+    parser.add_argument('--max-posts', type=int,
+                        help="이번 실행에서 처리할 최대 게시글 수 (나눠서 실행할 때, 넘지 않도록 배치 단위로 내림)")
+    parser.add_argument('--restart', action='store_true', help="체크포인트를 무시하고 처음부터")
+    parser.add_argument('--no-index', action='store_true', help="끝난 뒤 인덱스로 합치지 않음")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    catalog = load_catalog()
+    default_size, min_size, max_size = batch_limits(catalog)
+    batch_size = args.batch_size or default_size
+    if not min_size <= batch_size <= max_size:
+        raise SystemExit(f"배치 크기는 일괄 벡터화 API의 limit 범위({min_size}-{max_size})여야 합니다: {batch_size}")
+    if args.max_posts is not None and args.max_posts < batch_size:
+        raise SystemExit(f"--max-posts는 배치 크기({batch_size}) 이상이어야 합니다: {args.max_posts}")
+
+    boards = board_types(catalog)
+    if args.base_url:
+        source = ApiSource(args.base_url, boards, args.token)
+    elif args.posts:
+        source = JsonlSource(args.posts)
+    else:
+        source = SyntheticSource(args.synthetic, boards)
+    vectorizer = BatchVectorizer(source, args.output, args.embedder, args.dim, batch_size, args.workers,
+                                 args.max_posts)
+    os.makedirs(args.output, exist_ok=True)
+    try:
+        state = vectorizer.load_state(args.restart)
+    except ValueError as exc:
+        raise SystemExit(f"❌ {exc}") from None
+    finished = state["complete"]
+    if finished:
+        print(f"이미 완료된 작업입니다 ({state['vectorized']:,}건) - 다시 하려면 --restart")
+    else:
+        resumed = f" (배치 {state['batches']:,}개, {state['vectorized']:,}건 처리된 지점부터 재개)" if state["batches"] else ""
+        print(f"일괄 벡터화 시작: {source.describe()['type']}, 배치 {batch_size}건, 워커 {args.workers}개{resumed}")
+        elapsed = asyncio.run(vectorizer.run())
+        rate = vectorizer.processed / elapsed if elapsed else 0
+        print(f"✅ 이번 실행 {vectorizer.processed:,}건 / {elapsed:.1f}s = {rate:,.0f}건/s "
+              f"(임베딩 {vectorizer.embed_seconds:.1f}s), 누적 {state['vectorized']:,}건"
+              + ("" if state["complete"] else " - 남은 게시글은 같은 명령으로 이어서 처리"))
+    # 이미 완료된 작업은 인덱스가 없을 때만 다시 합친다
+    built = os.path.exists(os.path.join(args.output, META_FILE))
+    if state["complete"] and not args.no_index and not (finished and built):
+        started = time.perf_counter()
+        index = vectorizer.build_index()
+        if index is not None:
+            print(f"✅ 인덱스 저장 완료: {args.output} ({len(index):,}건, {time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 명세서 생성기 벤치마크
+실제 API_DATA와 API 수를 늘린 합성 카탈로그(기본 1k, 10k)에 대해
+generate_html 렌더링 시간, tracemalloc 최대 메모리, 출력 크기를 재고
+json_to_html / escape_html 단독 시간도 함께 잰다.
+
+결과는 git 리비전을 키로 JSON 파일에 누적 저장하고, 기준 리비전과 비교해 변화율을 출력한다.
+
+사용법:
+    python bench_api_docs.py                       # 측정 후 .api_docs_bench.json에 저장, 직전 결과와 비교
+    python bench_api_docs.py --baseline 6b73264    # 특정 리비전 결과와 비교
+    python bench_api_docs.py --sizes 1000 --repeat 3 --no-save
+"""
+
+import argparse
+import copy
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+
+import generate_api_docs
+from api_catalog import ApiCatalog
+from generate_api_docs import API_DATA, escape_html, generate_html, json_to_html
+
+DEFAULT_RESULTS = '.api_docs_bench.json'
+DEFAULT_SIZES = (1000, 10000)
+
+# 합성 카탈로그의 섹션당 API 수
+SYNTHETIC_SECTION_SIZE = 50
+
+# 렌더러 코드/API 정의 파일 - 이 파일들에 커밋되지 않은 변경이 있으면 리비전에 "-dirty"를 붙인다
+SOURCE_FILES = ('generate_api_docs.py', 'api_catalog.py', 'api_data.json')
+
+
+def synthetic_api_data(api_data, size):
+    """실제 API들을 순환 복제해 API size개짜리 API_DATA 생성
+
+    ID, 이름, 경로에 복제 번호를 붙여 카탈로그의 중복 검사를 통과하게 한다.
+    """
+    apis = [api for section in api_data['sections'] for api in section['apis']]
+    sections = []
+    for index in range(size):
+        section_no, api_no = divmod(index, SYNTHETIC_SECTION_SIZE)
+        if api_no == 0:
+            sections.append({"id": str(section_no + 1), "name": f"합성 섹션 {section_no + 1}", "apis": []})
+        api = copy.deepcopy(apis[index % len(apis)])
+        api['id'] = f"{section_no + 1}.{api_no + 1}"
+        api['name'] = f"{api['name']} #{index}"
+        api['path'] = f"/svc{index // len(apis)}{api['path']}"
+        sections[-1]['apis'].append(api)
+    return {"base_url": api_data.get('base_url', ''), "sections": sections}
+
+
+def example_bodies(api_data):
+    return [status['body'] for section in api_data['sections'] for api in section['apis']
+            for status in api.get('status_codes') or () if status.get('body') is not None]
+
+
+def text_fields(api_data):
+    """escape_html 벤치마크용 문자열 (이름, 설명, 경로, 상태 메시지)"""
+    texts = []
+    for section in api_data['sections']:
+        for api in section['apis']:
+            texts.extend(str(api.get(k) or '') for k in ('name', 'description', 'path', 'response'))
+            for status in api.get('status_codes') or ():
+                texts.extend(str(status.get(k) or '') for k in ('message', 'msg'))
+    return texts
+
+
+def timed(func, repeat, number=1):
+    """func를 number번 실행하는 시간을 repeat번 측정 -> 1회당 초 단위 (최소, 중앙값)"""
+    func()  # 예열
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - started) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return min(samples), statistics.median(samples)
+
+
+def peak_memory(func):
+    """func 한 번 실행 중 tracemalloc 최대 할당량 (bytes)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_render(name, api_data, repeat):
+    catalog = ApiCatalog(api_data)
+    html = generate_html(catalog)
+    compile_min, _ = timed(lambda: ApiCatalog(api_data), repeat)
+    render_min, render_median = timed(lambda: generate_html(catalog), repeat)
+    result = {
+        "endpoints": len(catalog),
+        "compile_ms": round(compile_min * 1000, 3),
+        "render_ms": round(render_min * 1000, 3),
+        "render_median_ms": round(render_median * 1000, 3),
+        "peak_memory_kb": round(peak_memory(lambda: generate_html(catalog)) / 1024, 1),
+        "output_bytes": len(html.encode('utf-8')),
+    }
+    print(f"  {name:<10} API {result['endpoints']:>6}개  렌더링 {result['render_ms']:>10.3f}ms "
+          f"(중앙값 {result['render_median_ms']:.3f}ms)  컴파일 {result['compile_ms']:.3f}ms  "
+          f"최대 메모리 {result['peak_memory_kb']:.1f}KB  출력 {result['output_bytes']:,}B")
+    return result
+
+
+def bench_functions(api_data, repeat):
+    bodies = example_bodies(api_data)
+    texts = text_fields(api_data)
+
+    def run_json():
+        for body in bodies:
+            json_to_html(body)
+
+    def run_escape():
+        for text in texts:
+            escape_html(text)
+
+    json_min, _ = timed(run_json, repeat, number=20)
+    escape_min, _ = timed(run_escape, repeat, number=20)
+    result = {
+        "json_to_html_us": round(json_min / len(bodies) * 1e6, 3),
+        "json_to_html_calls": len(bodies),
+        "escape_html_us": round(escape_min / len(texts) * 1e6, 3),
+        "escape_html_calls": len(texts),
+    }
+    print(f"  json_to_html 1회 {result['json_to_html_us']:.3f}µs (응답 예시 {len(bodies)}개), "
+          f"escape_html 1회 {result['escape_html_us']:.3f}µs (문자열 {len(texts)}개)")
+    return result
+
+
+def git_revision():
+    """현재 커밋 (렌더러 파일이 수정된 상태면 "-dirty")"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    try:
+        rev = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=here, capture_output=True,
+                             text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--', *SOURCE_FILES], cwd=here,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f"{rev}-dirty" if dirty else rev
+
+
+def run_benchmarks(sizes, repeat):
+    print("렌더링:")
+    render = {"real": bench_render("real", API_DATA, repeat)}
+    for size in sizes:
+        render[f"synthetic_{size}"] = bench_render(f"{size}", synthetic_api_data(API_DATA, size), repeat)
+    print("함수:")
+    return {
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "render": render,
+        "functions": bench_functions(API_DATA, repeat),
+    }
+
+
+def load_results(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(current, baseline, baseline_rev):
+    """시간/메모리/크기 지표의 변화율 출력 (+는 느려짐/커짐)"""
+    print(f"\n기준 리비전 {baseline_rev} 대비:")
+    rows = []
+    for name, entry in current['render'].items():
+        base = baseline.get('render', {}).get(name)
+        if base:
+            rows.extend((f"{name}.{key}", entry[key], base[key])
+                        for key in ('render_ms', 'peak_memory_kb', 'output_bytes') if key in base)
+    base_functions = baseline.get('functions', {})
+    rows.extend((f"functions.{key}", value, base_functions[key])
+                for key, value in current['functions'].items()
+                if key.endswith('_us') and key in base_functions)
+    for label, value, base in rows:
+        change = (value - base) / base * 100 if base else 0.0
+        print(f"  {label:<36} {base:>14,.3f} -> {value:>14,.3f}  {change:+7.1f}%")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="API 명세서 생성기 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='*', default=list(DEFAULT_SIZES),
+                        help="합성 카탈로그 API 수 (기본값: 1000 10000)")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 반복 횟수 (기본값: 5, 최솟값을 기록)")
+    parser.add_argument('-o', '--output', default=DEFAULT_RESULTS,
+                        help=f"결과 누적 파일 (기본값: {DEFAULT_RESULTS})")
+    parser.add_argument('--baseline', help="비교할 리비전 (생략하면 파일에 있는 직전 결과)")
+    parser.add_argument('--no-save', action='store_true', help="결과를 파일에 저장하지 않음")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rev = git_revision()
+    print(f"리비전 {rev}, Python {platform.python_version()}, {generate_api_docs.__file__}")
+    current = run_benchmarks(args.sizes, args.repeat)
+
+    history = load_results(args.output)
+    baseline_rev = args.baseline
+    if baseline_rev is None:
+        previous = [r for r in history if r != rev]
+        baseline_rev = max(previous, key=lambda r: history[r]['timestamp']) if previous else None
+    if baseline_rev:
+        if baseline_rev in history:
+            compare(current, history[baseline_rev], baseline_rev)
+        else:
+            print(f"\n⚠️ 기준 리비전 결과가 없습니다: {baseline_rev}")
+
+    if not args.no_save:
+        history[rev] = current
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ 결과 저장 완료: {args.output} ({rev})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예산 Excel/CSV Export 스트리밍 엔진
+"Excel Export"(GET /api/budget/export/excel)와 "CSV Export"(GET /api/budget/export/csv)는 문서상 data: None이지만
+실제로는 파일 응답이다. 워크북 전체를 메모리에 만든 뒤 보내면 플래너가 시즌 말에 담당 커플 수백 명을 한 번에
+내보낼 때 메모리와 응답 시간이 항목 수에 비례해 늘어난다. 이 엔진은 예산 항목을 generator로 받아 응답 스트림에
+바로 쓸 bytes 청크를 generator로 내보낸다.
+- CSV: 행을 버퍼에 쓰다가 CHUNK_SIZE가 차면 내보낸다 (메모리 일정)
+- XLSX: 쓰기 전용 스트리밍 writer - 표준 라이브러리 zipfile을 탐색 불가능한 스트림 모드(data descriptor)로 쓰고,
+  공유 문자열 표 대신 inline string을 써서 행 수와 무관하게 메모리가 일정하다
+- 일괄 모드: 여러 사용자(웨딩 플래너 업체의 담당 커플 전체)의 항목을 user_id 열을 붙여 한 파일로 내보낸다
+
+열은 "예산 항목 추가"(POST /api/budget/items) 본문 필드를 따른다 - 같은 파일을 Import API로 다시 올릴 수 있다.
+백엔드에서는 DB 커서를 rows로 넘기고 청크 generator를 스트리밍 응답 본문으로 쓰면 된다:
+    content_type, headers, chunks = export_response(catalog, 'excel', rows, user_ids=[user_id])
+    return StreamingResponse(chunks, media_type=content_type, headers=headers)
+
+사용법:
+    python budget_export.py export --format csv --input budget_items.jsonl --user-id 3 -o budget.csv
+    python budget_export.py export --format excel --synthetic-users 500 -o season.xlsx   # 일괄 모드
+    python budget_export.py bench --users 500 --items 200      # 스트리밍/전체 메모리 방식의 최대 메모리, 첫 청크 시간 비교
+"""
+
+import argparse
+import csv
+import io
+import json
+import math
+import numbers
+import random
+import re
+import sys
+import time
+import tracemalloc
+import zipfile
+from decimal import Decimal
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from api_catalog import load_catalog
+
+# 응답 스트림에 한 번에 쓰는 크기
+CHUNK_SIZE = 64 * 1024
+
+EXPORT_APIS = {
+    'excel': 'GET /api/budget/export/excel',
+    'csv': 'GET /api/budget/export/csv',
+}
+ITEM_API = 'POST /api/budget/items'
+
+# 카탈로그에서 열을 찾지 못할 때 쓰는 예산 항목 필드
+DEFAULT_COLUMNS = ('item_name', 'category', 'estimated_budget', 'actual_expense', 'unit', 'quantity', 'notes',
+                   'payer')
+DEFAULT_NUMERIC = ('estimated_budget', 'actual_expense', 'quantity')
+
+CONTENT_TYPES = {
+    'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+}
+EXTENSIONS = {'excel': 'xlsx', 'csv': 'csv'}
+
+SHEET_NAME = 'budget'
+
+# 스프레드시트가 수식으로 해석하는 CSV 셀 시작 문자 (사용자가 입력한 메모 등은 앞에 '를 붙인다)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# XML 1.0에 쓸 수 없는 제어 문자
+INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+SYNTHETIC_ITEMS = (('웨딩홀 대관료', 'venue'), ('식대', 'venue'), ('스튜디오 촬영', 'sdm'), ('드레스', 'sdm'),
+                   ('메이크업', 'sdm'), ('예물', 'gift'), ('청첩장', 'etc'), ('신혼여행 항공권', 'honeymoon'),
+                   ('부케', 'etc'), ('본식 스냅', 'sdm'))
+
+XLSX_STATIC_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'),
+    # 스타일 0: 기본, 1: 머리글(굵게)
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'),
+}
+
+WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets></workbook>')
+
+# 머리글 행을 고정한 워크시트 앞부분 (sheetData 행은 스트리밍으로 이어 쓴다)
+SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '</sheetView></sheetViews><sheetData>')
+SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def export_columns(catalog):
+    """예산 항목 추가 API 본문 필드 -> (열 이름들, 숫자 열 집합)"""
+    try:
+        body = catalog.resolve(ITEM_API).body
+    except ValueError:
+        body = None
+    if not isinstance(body, dict) or not body:
+        return DEFAULT_COLUMNS, frozenset(DEFAULT_NUMERIC)
+    numeric = {name for name, kind in body.items()
+               if isinstance(kind, str) and re.match(r'(number|float|integer|int)\b', kind)}
+    return tuple(body), frozenset(numeric)
+
+
+def file_content_type(endpoint, fmt):
+    """Export API 문서의 응답 'File (Content-Type)' -> Content-Type"""
+    match = re.match(r'File \(([^)]+)\)', endpoint.response or '')
+    return match.group(1).strip() if match else CONTENT_TYPES[fmt]
+
+
+class _Sink:
+    """zipfile이 쓰는 탐색 불가능한 출력 - 쓴 bytes를 모아 두었다가 청크로 꺼낸다"""
+
+    def __init__(self):
+        self.parts = []
+        self.size = 0
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.parts)
+        self.parts = []
+        self.size = 0
+        return data
+
+
+def csv_chunks(rows, columns, chunk_size=CHUNK_SIZE):
+    """행(dict) generator -> CSV bytes 청크 (UTF-8 BOM 포함 - Excel에서 한글이 깨지지 않도록)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\r\n')
+    buffer.write('\ufeff')
+    writer.writerow(columns)
+    for row in rows:
+        values = []
+        for name in columns:
+            value = row.get(name)
+            if value is None:
+                value = ''
+            elif isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+                value = "'" + value
+            values.append(value)
+        writer.writerow(values)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+
+def _number(value):
+    """숫자 셀 값 문자열, 쓸 수 없는 값(NaN, 무한대)은 None"""
+    if isinstance(value, Decimal):
+        return format(value, 'f') if value.is_finite() else None
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    return repr(value) if math.isfinite(value) else None
+
+
+def _cell(value, numeric):
+    if value is None or value == '':
+        return '<c/>'
+    if numeric and isinstance(value, (numbers.Real, Decimal)) and not isinstance(value, bool):
+        number = _number(value)
+        return '<c/>' if number is None else f'<c><v>{number}</v></c>'
+    text = escape(INVALID_XML_CHARS.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def xlsx_chunks(rows, columns, numeric=(), sheet_name=SHEET_NAME, chunk_size=CHUNK_SIZE):
+    """행(dict) generator -> XLSX bytes 청크 (워크시트 한 장, 첫 행은 굵은 머리글로 고정)"""
+    sink = _Sink()
+    flags = [name in numeric for name in columns]
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in XLSX_STATIC_PARTS.items():
+            archive.writestr(name, xml)
+        archive.writestr('xl/workbook.xml', WORKBOOK_XML.format(name=escape(sheet_name, {'"': '&quot;'})))
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            header = ''.join(f'<c s="1" t="inlineStr"><is><t>{escape(name)}</t></is></c>' for name in columns)
+            sheet.write(f'{SHEET_HEAD}<row>{header}</row>'.encode('utf-8'))
+            for row in rows:
+                cells = ''.join(_cell(row.get(name), flag) for name, flag in zip(columns, flags, strict=True))
+                sheet.write(f'<row>{cells}</row>'.encode('utf-8'))
+                if sink.size >= chunk_size:
+                    yield sink.drain()
+            sheet.write(SHEET_TAIL.encode('utf-8'))
+    yield sink.drain()
+
+
+def export_response(catalog, fmt, rows, user_ids=None, chunk_size=CHUNK_SIZE):
+    """(Content-Type, 응답 헤더 dict, bytes 청크 generator)
+
+    user_ids가 한 명이 아니면(여러 명 또는 None = 전체) 일괄 모드 - 맨 앞에 user_id 열을 붙인다
+    (rows의 각 dict에 user_id가 있어야 한다).
+    """
+    columns, numeric = export_columns(catalog)
+    user_ids = list(user_ids or ())
+    extension = EXTENSIONS[fmt]
+    if len(user_ids) == 1:
+        filename = f"budget_{user_ids[0]}.{extension}"
+    else:
+        columns = ('user_id',) + columns
+        numeric = numeric | {'user_id'}
+        filename = f"budget_{len(user_ids)}users.{extension}" if user_ids else f"budget_all.{extension}"
+    content_type = file_content_type(catalog.resolve(EXPORT_APIS[fmt]), fmt)
+    if fmt == 'csv':
+        content_type += '; charset=utf-8'
+        chunks = csv_chunks(rows, columns, chunk_size)
+    else:
+        chunks = xlsx_chunks(rows, columns, numeric, chunk_size=chunk_size)
+    headers = {'Content-Disposition': f"attachment; filename=\"{filename}\"; filename*=UTF-8''{quote(filename)}"}
+    return content_type, headers, chunks
+
+
+def jsonl_items(path, user_ids=None):
+    """JSONL 예산 항목 덤프({"user_id", "item_name", ...} 한 줄에 하나) -> 선택한 사용자의 항목 generator"""
+    wanted = set(user_ids) if user_ids else None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if wanted is None or item.get('user_id') in wanted:
+                yield item
+
+
+def synthetic_items(user_ids, items_per_user, seed=0):
+    """사용자마다 items_per_user개의 합성 예산 항목 generator"""
+    rng = random.Random(seed)
+    payers = ('both', 'groom', 'bride')
+    for user_id in user_ids:
+        for index in range(items_per_user):
+            name, category = SYNTHETIC_ITEMS[index % len(SYNTHETIC_ITEMS)]
+            estimated = float(rng.randrange(10, 500) * 10000)
+            yield {
+                'user_id': user_id,
+                'item_name': f"{name} {index // len(SYNTHETIC_ITEMS) + 1}",
+                'category': category,
+                'estimated_budget': estimated,
+                'actual_expense': round(estimated * rng.uniform(0.7, 1.3), -3),
+                'unit': None,
+                'quantity': 1.0,
+                'notes': '계약금 지급 완료' if rng.random() < 0.3 else None,
+                'payer': rng.choice(payers),
+            }
+
+
+def _measure(make_chunks):
+    """(총 bytes, 첫 청크까지 초, 전체 초, 최대 할당 bytes)"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    first = None
+    total = 0
+    for chunk in make_chunks():
+        if first is None:
+            first = time.perf_counter() - started
+        total += len(chunk)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return total, first, elapsed, peak
+
+
+def bench(args):
+    catalog = load_catalog()
+    user_ids = list(range(1, args.users + 1))
+    print(f"사용자 {args.users}명 x 항목 {args.items}개 = {args.users * args.items:,}행 (일괄 모드)")
+    print(f"  {'형식':<6} {'방식':<8} {'크기':>10} {'첫 청크':>10} {'전체':>9} {'최대 메모리':>12}")
+    for fmt in ('csv', 'excel'):
+        def streaming(fmt=fmt):
+            return export_response(catalog, fmt, synthetic_items(user_ids, args.items), user_ids)[2]
+
+        def in_memory(fmt=fmt):
+            # 비교용: 항목을 모두 읽고 파일 전체를 만든 뒤 한 번에 보내는 방식
+            rows = list(synthetic_items(user_ids, args.items))
+            return [b''.join(export_response(catalog, fmt, rows, user_ids)[2])]
+
+        for label, make_chunks in (('스트리밍', streaming), ('전체', in_memory)):
+            total, first, elapsed, peak = _measure(make_chunks)
+            print(f"  {fmt:<6} {label:<8} {total / 1e6:>8.1f}MB {first * 1000:>8.1f}ms {elapsed:>8.2f}s "
+                  f"{peak / 1e6:>10.1f}MB")
+
+
+def export_command(args):
+    catalog = load_catalog()
+    user_ids = args.user_id or []
+    if args.synthetic_users:
+        user_ids = user_ids or list(range(1, args.synthetic_users + 1))
+        rows = synthetic_items(user_ids, args.items)
+    else:
+        rows = jsonl_items(args.input, user_ids)
+    content_type, headers, chunks = export_response(catalog, args.format, rows, user_ids)
+    output = args.output or re.search(r'filename="([^"]+)"', headers['Content-Disposition']).group(1)
+    started = time.perf_counter()
+    total = 0
+    out = sys.stdout.buffer if output == '-' else open(output, 'wb')
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+            total += len(chunk)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+    print(f"{content_type} {total:,} bytes -> {output} ({time.perf_counter() - started:.2f}s)", file=sys.stderr)
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="예산 Excel/CSV Export 스트리밍 엔진")
+    commands = parser.add_subparsers(dest='command', required=True)
+    export_parser = commands.add_parser('export', help="예산 항목을 파일로 내보내기")
+    export_parser.add_argument('--format', choices=sorted(EXPORT_APIS), default='excel', help="형식 (기본값: excel)")
+    source = export_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help="JSONL 예산 항목 덤프 ({\"user_id\", \"item_name\", ...} 한 줄에 하나)")
+    source.add_argument('--synthetic-users', type=int, help="합성 사용자 N명의 항목")
+    export_parser.add_argument('--user-id', type=int, action='append',
+                               help="내보낼 사용자 (여러 번 주면 일괄 모드, --input에서 생략하면 전체를 일괄 모드로)")
+    export_parser.add_argument('--items', type=int, default=50, help="합성 사용자당 항목 수 (기본값: 50)")
+    export_parser.add_argument('-o', '--output', help="출력 파일 ('-'는 표준 출력, 기본값: 응답 파일 이름)")
+    bench_parser = commands.add_parser('bench', help="스트리밍/전체 메모리 방식 비교")
+    bench_parser.add_argument('--users', type=int, default=300, help="사용자 수 (기본값: 300)")
+    bench_parser.add_argument('--items', type=int, default=100, help="사용자당 항목 수 (기본값: 100)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'bench':
+        bench(args)
+        return 0
+    return export_command(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+챗봇 스트리밍 API 하네스
+API 카탈로그의 NDJSON 스트리밍 API(기본: POST /api/chat)로 동시에 여러 대화 세션을 열고,
+질문 목록을 세션마다 차례로 보내며 응답 스트림을 한 줄씩 읽어 측정한다 (응답 전체를 버퍼링하지 않음).
+
+요청마다 측정하는 값:
+- 첫 청크까지 시간 (time-to-first-chunk): 요청 전송 ~ 첫 content 청크 도착
+- 청크 간격 (inter-chunk gap): 연속한 NDJSON 줄 사이 시간
+- 전체 스트림 시간: 요청 전송 ~ 스트림 끝
+세션별 결과와 전체 분위수(p50/p95/p99)를 출력하고 -o로 JSON 저장한다.
+
+요청 본문은 load_test의 요청 템플릿(문서의 body 예시)에 질문만 바꿔 넣는다.
+
+사용법:
+    python chat_harness.py --sessions 20 --turns 3
+    python chat_harness.py --prompts prompts.txt --sessions 50 --base-url http://localhost:8000 -o chat_result.json
+    python chat_harness.py --token eyJ... --think-time-ms 2000
+
+질문 파일: 한 줄에 질문 하나 (.jsonl이면 {"message": "..."} 한 줄에 하나)
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+
+from access_log_analyzer import LatencySketch
+from api_catalog import load_catalog
+from async_http import AsyncHttpClient, HttpError
+from load_test import DEFAULT_BASE_URL, build_templates, capture
+
+DEFAULT_PROMPTS = [
+    "결혼식 예산을 항목별로 어떻게 나누면 좋을까요?",
+    "스드메 계약할 때 꼭 확인해야 할 것들을 알려주세요.",
+    "본식 3개월 전까지 해야 할 일을 정리해 주세요.",
+    "하객 200명 기준 식대 예산은 어느 정도가 적당할까요?",
+    "청첩장 문구 예시를 몇 가지 추천해 주세요.",
+]
+
+# 첫 청크로 치는 NDJSON 청크 type (없으면 type과 상관없이 첫 줄)
+CONTENT_TYPES = ('content',)
+
+# 세션별 결과 출력 개수 (첫 청크까지 시간이 느린 순)
+SUMMARY_SIZE = 10
+
+QUANTILES = (("p50", .5), ("p95", .95), ("p99", .99))
+
+
+def chat_endpoint(catalog, key=None):
+    """key(API ID/"메서드 경로"/이름)로 조회, 생략하면 응답이 NDJSON 스트림인 첫 API"""
+    if key:
+        return catalog.resolve(key)
+    for endpoint in catalog:
+        if 'NDJSON' in (endpoint.response or ''):
+            return endpoint
+    raise ValueError("카탈로그에 NDJSON 스트리밍 API가 없습니다")
+
+
+def load_prompts(path):
+    if not path:
+        return list(DEFAULT_PROMPTS)
+    prompts = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            prompts.append(json.loads(line)['message'] if path.endswith('.jsonl') else line)
+    if not prompts:
+        raise ValueError(f"질문 파일이 비어 있습니다: {path}")
+    return prompts
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def _sketch_dict(sketch):
+    if not sketch.count:
+        return None
+    return {name: _ms(sketch.quantile(q)) for name, q in QUANTILES}
+
+
+class StreamResult:
+    """스트리밍 요청 하나의 측정값 (시간은 초)"""
+    __slots__ = ('status', 'first_byte', 'first_chunk', 'duration', 'chunks', 'chars', 'gaps', 'types', 'error')
+
+    def __init__(self):
+        self.status = None
+        self.first_byte = None
+        self.first_chunk = None
+        self.duration = None
+        self.chunks = 0
+        self.chars = 0
+        self.gaps = []
+        self.types = Counter()
+        self.error = None
+
+    def to_dict(self):
+        return {
+            "status": self.status,
+            "first_byte_ms": _ms(self.first_byte),
+            "first_chunk_ms": _ms(self.first_chunk),
+            "duration_ms": _ms(self.duration),
+            "chunks": self.chunks,
+            "chars": self.chars,
+            "max_gap_ms": _ms(max(self.gaps)) if self.gaps else None,
+            "types": dict(self.types),
+            "error": self.error,
+        }
+
+
+class ChatHarness:
+    def __init__(self, catalog, client, endpoint, prompts, token=None, think_time=0.0, timeout=60.0, seed=None):
+        self.catalog = catalog
+        self.client = client
+        self.endpoint = endpoint
+        self.template = build_templates(catalog)[endpoint.id]
+        self.prompts = prompts
+        self.token = token
+        self.think_time = think_time
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.sessions = []
+        self.first_chunk = LatencySketch()
+        self.gaps = LatencySketch()
+        self.duration = LatencySketch()
+        self.statuses = Counter()
+        self.errors = Counter()
+
+    async def login(self, credentials):
+        """카탈로그의 로그인 API로 액세스 토큰 발급 (응답에서 access_token을 찾는다)"""
+        login = build_templates(self.catalog)[self.catalog.resolve('1.1').id]
+        method, path, query, headers, body = login.build({}, None)
+        response = await self.client.request(method, path, query, headers, dict(body, **credentials))
+        variables = {}
+        if response.body:
+            capture(response.json(), {'access_token'}, variables)
+        self.token = variables.get('access_token', self.token)
+        return response.status
+
+    async def stream_once(self, prompt):
+        """질문 하나를 보내고 NDJSON 스트림을 끝까지 읽으며 측정"""
+        result = StreamResult()
+        method, path, query, headers, body = self.template.build({}, self.token)
+        if isinstance(body, dict) and 'message' in body:
+            body = dict(body, message=prompt)
+        headers['Accept'] = 'application/x-ndjson'
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._consume(result, started, method, path, query, headers, body),
+                                   self.timeout)
+        except (HttpError, asyncio.TimeoutError, OSError) as exc:
+            result.error = type(exc).__name__
+        result.duration = time.perf_counter() - started
+        return result
+
+    async def _consume(self, result, started, method, path, query, headers, body):
+        async with self.client.stream(method, path, query, headers, body) as response:
+            result.status = response.status
+            last = result.first_byte = time.perf_counter() - started
+            # 2xx NDJSON 스트림만 청크로 측정하고, 나머지는 본문을 비우고 오류로만 센다
+            content_type = response.headers.get('content-type', '')
+            if not 200 <= response.status < 300:
+                result.error = f"HTTP {response.status}"
+            elif content_type and 'json' not in content_type:
+                result.error = f"not_ndjson ({content_type.split(';')[0]})"
+            if result.error:
+                await response.read()
+                return
+            async for line in response.iter_lines():
+                if not line.strip():
+                    continue
+                now = time.perf_counter() - started
+                if result.chunks:
+                    result.gaps.append(now - last)
+                last = now
+                result.chunks += 1
+                try:
+                    chunk = json.loads(line)
+                except ValueError:
+                    result.types['invalid_json'] += 1
+                    continue
+                kind = chunk.get('type') if isinstance(chunk, dict) else None
+                result.types[kind or 'untyped'] += 1
+                if result.first_chunk is None and (kind in CONTENT_TYPES or kind is None):
+                    result.first_chunk = now
+                content = chunk.get('content') if isinstance(chunk, dict) else None
+                if isinstance(content, str):
+                    result.chars += len(content)
+
+    def _record(self, result):
+        self.statuses[result.status] += 1
+        if result.error:
+            self.errors[result.error] += 1
+            return
+        if result.first_chunk is not None:
+            self.first_chunk.add(result.first_chunk)
+        for gap in result.gaps:
+            self.gaps.add(gap)
+        self.duration.add(result.duration)
+
+    async def run_session(self, index, turns):
+        """대화 세션 하나 - 질문 turns개를 차례로 보낸다 (세션마다 시작 위치를 달리해 질문을 섞는다)"""
+        offset = self.rng.randrange(len(self.prompts))
+        results = []
+        for turn in range(turns):
+            if turn and self.think_time:
+                await asyncio.sleep(self.rng.expovariate(1 / self.think_time))
+            result = await self.stream_once(self.prompts[(offset + turn) % len(self.prompts)])
+            self._record(result)
+            results.append(result)
+        self.sessions.append((index, results))
+
+    async def run(self, sessions, turns, ramp_up=0.0):
+        """sessions개 세션을 동시에 실행 (ramp_up초 동안 고르게 나눠 시작)"""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        async def delayed(index):
+            if ramp_up and sessions > 1:
+                await asyncio.sleep(ramp_up * index / (sessions - 1))
+            await self.run_session(index, turns)
+
+        await asyncio.gather(*(delayed(index) for index in range(sessions)))
+        return loop.time() - start
+
+    def report(self, elapsed):
+        sessions = []
+        for index, results in sorted(self.sessions):
+            first = [r.first_chunk for r in results if r.first_chunk is not None]
+            gaps = [gap for r in results for gap in r.gaps]
+            sessions.append({
+                "session": index,
+                "turns": [r.to_dict() for r in results],
+                "first_chunk_ms": {"min": _ms(min(first)), "max": _ms(max(first))} if first else None,
+                "max_gap_ms": _ms(max(gaps)) if gaps else None,
+                "duration_ms": _ms(sum(r.duration for r in results)),
+            })
+        return {
+            "api": {"id": self.endpoint.id, "method": self.endpoint.method, "path": self.endpoint.path},
+            "elapsed_s": round(elapsed, 3),
+            "streams": sum(self.statuses.values()),
+            "status_codes": {str(k): v for k, v in sorted(self.statuses.items(), key=lambda i: str(i[0]))},
+            "errors": dict(self.errors),
+            "first_chunk_ms": _sketch_dict(self.first_chunk),
+            "gap_ms": _sketch_dict(self.gaps),
+            "duration_ms": _sketch_dict(self.duration),
+            "sessions": sessions,
+        }
+
+
+def print_report(report, top=SUMMARY_SIZE):
+    api = report['api']
+    print(f"\n{api['id']} {api['method']} {api['path']}: 실행 시간 {report['elapsed_s']}초, "
+          f"스트림 {report['streams']}개 {report['status_codes']}")
+    for label, key in (("첫 청크까지", 'first_chunk_ms'), ("청크 간격", 'gap_ms'), ("전체 스트림", 'duration_ms')):
+        q = report[key]
+        print(f"  {label:<8} " + (f"p50={q['p50']}ms p95={q['p95']}ms p99={q['p99']}ms" if q else "-"))
+    for error, count in report['errors'].items():
+        print(f"  ⚠️ {error}: {count}건")
+
+    def slowest(session):
+        first = session['first_chunk_ms']
+        return -(first['max'] if first else float('inf'))
+
+    print(f"\n세션별 (첫 청크가 느린 순 {min(top, len(report['sessions']))}개)")
+    for session in sorted(report['sessions'], key=slowest)[:top]:
+        first = session['first_chunk_ms']
+        chunks = sum(turn['chunks'] for turn in session['turns'])
+        print(f"  #{session['session']:<4} 첫 청크 "
+              + (f"{first['min']}~{first['max']}ms" if first else "-")
+              + (f"  최대 간격 {session['max_gap_ms']}ms" if session['max_gap_ms'] is not None else "  최대 간격 -")
+              + f"  전체 {session['duration_ms']}ms"
+              + f"  청크 {chunks}개 / 질문 {len(session['turns'])}개")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="챗봇 NDJSON 스트리밍 API 동시 세션 하네스")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help=f"대상 서버 (기본값: {DEFAULT_BASE_URL})")
+    parser.add_argument('--api', help="대상 API (API ID, \"메서드 경로\", 이름 - 생략하면 NDJSON 스트리밍 API)")
+    parser.add_argument('--prompts', metavar='FILE', help="질문 파일 (한 줄에 하나, .jsonl은 {\"message\": ...})")
+    parser.add_argument('--sessions', type=int, default=10, help="동시 대화 세션 수 (기본값: 10)")
+    parser.add_argument('--turns', type=int, default=3, help="세션당 질문 수 (기본값: 3)")
+    parser.add_argument('--think-time-ms', type=float, default=0, help="세션 안 질문 사이 평균 대기 시간 (밀리초)")
+    parser.add_argument('--ramp-up', type=float, default=0, help="세션 시작을 나눠 퍼뜨릴 시간 (초)")
+    parser.add_argument('--timeout', type=float, default=60, help="스트림 하나의 타임아웃 (초)")
+    parser.add_argument('--token', help="액세스 토큰 (생략하면 --email/--password로 로그인)")
+    parser.add_argument('--email', help="로그인 이메일")
+    parser.add_argument('--password', help="로그인 비밀번호")
+    parser.add_argument('--seed', type=int, help="난수 시드 (재현용)")
+    parser.add_argument('--top', type=int, default=SUMMARY_SIZE, help="출력할 세션 수")
+    parser.add_argument('-o', '--output', help="결과 JSON 파일 경로 (세션별 요청 측정값 포함)")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog()
+    endpoint = chat_endpoint(catalog, args.api)
+    prompts = load_prompts(args.prompts)
+
+    async def run():
+        # 세션마다 스트림 하나씩 동시에 열리므로 연결 수는 세션 수만큼
+        client = AsyncHttpClient(args.base_url, max_connections=max(args.sessions, 1), timeout=args.timeout)
+        harness = ChatHarness(catalog, client, endpoint, prompts, args.token, args.think_time_ms / 1000,
+                              args.timeout, args.seed)
+        try:
+            if args.token is None and endpoint.auth:
+                credentials = {k: v for k, v in (('email', args.email), ('password', args.password)) if v}
+                try:
+                    status = await harness.login(credentials)
+                except (HttpError, asyncio.TimeoutError, OSError, ValueError) as exc:
+                    raise SystemExit(f"❌ 로그인 실패 ({args.base_url}): {type(exc).__name__} {exc}") from None
+                print(f"로그인 {status}" + ("" if harness.token else " (토큰 없음 - 인증 없이 요청)"))
+            print(f"챗봇 하네스 시작: {args.base_url}{endpoint.path}, 세션 {args.sessions}개 x 질문 {args.turns}개")
+            elapsed = await harness.run(args.sessions, args.turns, args.ramp_up)
+        finally:
+            await client.close()
+        return harness.report(elapsed)
+
+    report = asyncio.run(run())
+    print_report(report, args.top)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ 결과 저장 완료: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
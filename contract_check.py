@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+계약 준수 검사기
+녹화한 요청/응답 쌍(브라우저 HAR 또는 JSONL 캡처)을 한 건씩 읽어 API 카탈로그와 맞는지 검사한다.
+- 카탈로그에 없는 API 호출 (경로의 숫자 세그먼트는 {id}로 묶어 집계)
+- 문서에 없는 상태 코드
+- 백엔드가 받아들인(2xx/3xx) 요청 중 문서상 잘못된 요청 (필수 본문 필드 누락, 파라미터 범위/형식 등)
+- 응답 본문의 message가 해당 상태 코드에 문서화된 값이 아닌 경우
+백엔드와 명세서가 어긋난 것을 프론트엔드가 깨지기 전에 찾는 용도다.
+
+캡처 파일은 스트리밍으로 읽는다 (HAR도 entries 배열을 원소 단위로 디코딩). 집계는 API/상태 코드/필드 조합별
+카운터뿐이고 API 매칭은 route_trie, 요청 검사는 request_validator의 컴파일된 함수를 쓰므로
+노트북에서도 수백만 건을 처리할 수 있다. orjson이 있으면 JSON 파싱에 사용한다 (선택 의존성).
+
+JSONL 캡처는 한 줄에 요청 하나:
+    {"method": "POST", "url": "/api/posts", "status": 201, "content_type": "application/json",
+     "request_body": {"title": "..."}, "response_body": {"message": "create_post_success", "data": {...}}}
+(url 대신 target/path, 본문은 객체 또는 문자열 모두 가능. HAR entry 형식의 줄도 받는다)
+
+사용법:
+    python contract_check.py capture.har
+    python contract_check.py traffic.jsonl.gz -o contract_report.json --strict
+"""
+
+import argparse
+import base64
+import contextlib
+import gzip
+import json
+import re
+import sys
+from collections import Counter
+from datetime import datetime
+
+from api_catalog import load_catalog
+from request_validator import RequestValidator
+from route_trie import split_target
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# 결과에 남길 서로 다른 미등록 API(메서드 + 묶은 경로) 최대 개수 - 넘는 것은 건수만 센다
+MAX_UNKNOWN_KEYS = 1000
+
+# 요약에 출력할 항목 수 (분류별)
+SUMMARY_SIZE = 15
+
+# HAR 읽기 단위 (문자)
+HAR_CHUNK_SIZE = 1 << 20
+
+HAR_ENTRIES_RE = re.compile(r'"entries"\s*:\s*\[')
+HAR_SNIFF_RE = re.compile(r'\s*\{\s*"log"\s*:')
+ID_SEGMENT_RE = re.compile(r'/\d+(?=/|$)')
+# {"message": "...", ...} 형식 응답은 전체를 파싱하지 않고 message만 읽는다
+LEADING_MESSAGE_RE = re.compile(r'\s*\{\s*"message"\s*:\s*"([^"\\]*)"')
+
+
+class CaptureRecord:
+    """정규화한 요청/응답 한 쌍 (본문은 bytes/str/dict 중 원본 그대로)"""
+    __slots__ = ('method', 'target', 'status', 'content_type', 'request_body', 'response_body')
+
+    def __init__(self, method, target, status, content_type='', request_body=None, response_body=None):
+        self.method = method.upper()
+        self.target = target
+        self.status = int(status)
+        self.content_type = content_type or ''
+        self.request_body = request_body
+        self.response_body = response_body
+
+
+def _har_text(content):
+    """HAR postData/content -> 본문 문자열 (base64 인코딩 해제)"""
+    if not content:
+        return None
+    text = content.get('text')
+    if text is not None and content.get('encoding') == 'base64':
+        try:
+            return base64.b64decode(text).decode('utf-8', errors='replace')
+        except ValueError:
+            return None
+    return text
+
+
+def from_har_entry(entry):
+    request, response = entry['request'], entry['response']
+    post = request.get('postData') or {}
+    return CaptureRecord(request['method'], request['url'], response['status'],
+                         post.get('mimeType', ''), _har_text(post), _har_text(response.get('content')))
+
+
+def from_json_record(record):
+    """JSONL 한 줄 (간단 형식 또는 HAR entry 형식) -> CaptureRecord"""
+    if isinstance(record.get('request'), dict):
+        return from_har_entry(record)
+    target = record.get('url') or record.get('target') or record.get('path')
+    return CaptureRecord(record['method'], target, record['status'], record.get('content_type', ''),
+                         record.get('request_body'), record.get('response_body'))
+
+
+def iter_jsonl(f):
+    for line in f:
+        if line.strip():
+            yield _loads(line)
+
+
+def iter_har_entries(f, chunk_size=HAR_CHUNK_SIZE):
+    """HAR 파일의 log.entries 원소를 하나씩 디코딩 (파일 전체를 메모리에 올리지 않음)"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    match = None
+    while match is None:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        # 키가 읽기 단위 경계에 걸쳐도 찾도록 앞부분을 조금 남긴다
+        buffer = buffer[-64:] + chunk
+        match = HAR_ENTRIES_RE.search(buffer)
+    buffer = buffer[match.end():]
+    pos = 0
+    eof = False
+    while True:
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == ']':
+            return
+        try:
+            entry, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # 원소가 읽기 단위보다 크면 남은 크기만큼 더 읽어 다시 시도 (전체 재시도 비용이 선형이 되도록)
+            chunk = f.read(max(chunk_size, len(buffer) - pos))
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        yield entry
+        pos = end
+        if pos > chunk_size:
+            buffer, pos = buffer[pos:], 0
+
+
+def open_capture(path):
+    """캡처 파일 열기 ('-'는 표준 입력, .gz는 압축 해제하며 읽기)"""
+    if path == '-':
+        return contextlib.nullcontext(sys.stdin)  # with 블록이 표준 입력을 닫지 않도록
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def iter_capture(f):
+    """캡처 파일 -> CaptureRecord 이터레이터 (HAR/JSONL 자동 판별)"""
+    head = f.read(4096)
+    rest = _Prepend(head, f)
+    if HAR_SNIFF_RE.match(head):
+        return (from_har_entry(entry) for entry in iter_har_entries(rest))
+    return (from_json_record(record) for record in iter_jsonl(rest))
+
+
+class _Prepend:
+    """판별용으로 먼저 읽은 앞부분을 되돌려 놓은 파일 객체 (read/줄 단위 반복만 지원)"""
+
+    def __init__(self, head, f):
+        self.head = head
+        self.f = f
+
+    def read(self, size=-1):
+        if self.head:
+            data, self.head = self.head, ''
+            return data
+        return self.f.read(size)
+
+    def __iter__(self):
+        if self.head:
+            head, self.head = self.head, ''
+            line_end = head.rfind('\n')
+            if line_end < 0:
+                yield head + self.f.readline()
+            else:
+                yield from head[:line_end + 1].splitlines(keepends=True)
+                tail = head[line_end + 1:]
+                if tail:
+                    yield tail + self.f.readline()
+        yield from self.f
+
+
+class _Contract:
+    """API 하나의 문서화된 상태 코드 -> message 집합"""
+    __slots__ = ('endpoint', 'messages')
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.messages = {}
+        for status in endpoint.status_codes:
+            messages = self.messages.setdefault(int(status['code']), set())
+            body = status.get('body')
+            for message in (status.get('message'), body.get('message') if isinstance(body, dict) else None):
+                if message:
+                    messages.add(message)
+
+
+def response_message(body):
+    """응답 본문 (dict/str/bytes/None) -> message 값 또는 None"""
+    if body is None:
+        return None
+    if isinstance(body, dict):
+        message = body.get('message')
+        return message if isinstance(message, str) else None
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', errors='replace')
+    match = LEADING_MESSAGE_RE.match(body)
+    if match is not None:
+        return match.group(1)
+    if '"message"' not in body:
+        return None
+    try:
+        return response_message(_loads(body))
+    except ValueError:
+        return None
+
+
+def request_bytes(body):
+    if body is None:
+        return b''
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode('utf-8')
+    return json.dumps(body, ensure_ascii=False).encode('utf-8')
+
+
+class ContractChecker:
+    """캡처 레코드를 스트리밍으로 받아 계약 위반을 종류별로 집계 (메모리는 API 수에만 비례)"""
+
+    def __init__(self, catalog=None, prefix=None):
+        self.catalog = catalog or load_catalog()
+        self.router = self.catalog.router
+        self.validator = RequestValidator(self.catalog)
+        self.contracts = {endpoint.id: _Contract(endpoint) for endpoint in self.catalog}
+        # 정적 파일 등 API 밖의 요청은 검사하지 않는다 (기본값: 카탈로그 경로의 첫 세그먼트, 예: /api/)
+        self.prefix = prefix if prefix is not None else _common_prefix(self.catalog)
+        self.records = 0
+        self.skipped = 0
+        self.aborted = 0
+        self.matched = 0
+        self.unknown_total = 0
+        self.unknown = Counter()
+        self.statuses = Counter()
+        self.invalid = Counter()
+        self.messages = Counter()
+
+    def feed(self, record):
+        self.records += 1
+        # 응답을 받지 못한 요청 (HAR의 status 0: 취소, 차단, 연결 실패)은 대조할 응답이 없다
+        if record.status == 0:
+            self.aborted += 1
+            return
+        path, query = split_target(record.target)
+        if record.method == 'OPTIONS' or not path.startswith(self.prefix):
+            self.skipped += 1
+            return
+        match = self.router.match(record.method, path)
+        if match is None:
+            self.unknown_total += 1
+            key = (record.method, ID_SEGMENT_RE.sub('/{id}', path))
+            if key in self.unknown or len(self.unknown) < MAX_UNKNOWN_KEYS:
+                self.unknown[key] += 1
+            return
+        self.matched += 1
+        endpoint = match.endpoint
+        contract = self.contracts[endpoint.id]
+        documented = contract.messages.get(record.status)
+        if documented is None:
+            self.statuses[endpoint.id, record.status] += 1
+        elif documented:
+            message = response_message(record.response_body)
+            if message is not None and message not in documented:
+                self.messages[endpoint.id, record.status, message] += 1
+        # 거절된 요청(4xx/5xx)은 클라이언트 잘못이거나 이미 오류로 드러나므로, 받아들여진 요청만 명세와 대조
+        if record.status < 400:
+            errors = self.validator.validate(endpoint, match.params, query, request_bytes(record.request_body),
+                                             record.content_type)
+            for error in errors:
+                self.invalid[endpoint.id, '.'.join(error['loc']), error['msg']] += 1
+
+    def feed_records(self, records):
+        for record in records:
+            self.feed(record)
+
+    @property
+    def violations(self):
+        return (self.unknown_total + sum(self.statuses.values()) + sum(self.invalid.values())
+                + sum(self.messages.values()))
+
+    def _api(self, api_id):
+        endpoint = self.catalog.get(api_id)
+        return {"id": api_id, "method": endpoint.method, "path": endpoint.path}
+
+    def report(self):
+        """JSON 호환 결과 (각 목록은 건수 내림차순)"""
+        def by_count(counter):
+            return sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+
+        return {
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "records": self.records,
+            "skipped": self.skipped,
+            "aborted": self.aborted,
+            "matched": self.matched,
+            "unknown_endpoints": {
+                "count": self.unknown_total,
+                "distinct_truncated": len(self.unknown) >= MAX_UNKNOWN_KEYS,
+                "paths": [{"method": method, "path": path, "count": n}
+                          for (method, path), n in by_count(self.unknown)],
+            },
+            "undocumented_status": [
+                {**self._api(api_id), "status": status, "count": n,
+                 "documented": sorted(self.contracts[api_id].messages)}
+                for (api_id, status), n in by_count(self.statuses)],
+            "invalid_requests": [
+                {**self._api(api_id), "loc": loc, "msg": msg, "count": n}
+                for (api_id, loc, msg), n in by_count(self.invalid)],
+            "undocumented_messages": [
+                {**self._api(api_id), "status": status, "message": message, "count": n,
+                 "documented": sorted(self.contracts[api_id].messages[status])}
+                for (api_id, status, message), n in by_count(self.messages)],
+        }
+
+
+def _common_prefix(catalog):
+    firsts = {endpoint.path.strip('/').split('/')[0] for endpoint in catalog}
+    return f"/{firsts.pop()}/" if len(firsts) == 1 else '/'
+
+
+def print_summary(report, top=SUMMARY_SIZE):
+    unknown = report['unknown_endpoints']
+    print(f"전체 {report['records']:,}건, 검사 {report['matched']:,}건, 미등록 API {unknown['count']:,}건, "
+          f"검사 제외 {report['skipped']:,}건, 응답 없음 {report['aborted']:,}건")
+    sections = (
+        ("미등록 API", unknown['paths'], lambda e: f"{e['method']:<6} {e['path']}"),
+        ("문서에 없는 상태 코드", report['undocumented_status'],
+         lambda e: f"{e['id']:>6} {e['method']:<6} {e['path']:<45} {e['status']} (문서: {e['documented']})"),
+        ("명세와 다른 요청 (2xx/3xx 응답)", report['invalid_requests'],
+         lambda e: f"{e['id']:>6} {e['method']:<6} {e['path']:<45} {e['loc']}: {e['msg']}"),
+        ("문서에 없는 message", report['undocumented_messages'],
+         lambda e: f"{e['id']:>6} {e['method']:<6} {e['path']:<45} {e['status']} {e['message']!r} "
+                   f"(문서: {', '.join(e['documented'])})"),
+    )
+    for title, entries, describe in sections:
+        if not entries:
+            continue
+        print(f"\n⚠️ {title} {sum(e['count'] for e in entries):,}건")
+        for entry in entries[:top]:
+            print(f"  {entry['count']:>9,}  {describe(entry)}")
+        if len(entries) > top:
+            print(f"  ... 외 {len(entries) - top}종")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="녹화한 요청/응답(HAR, JSONL)을 API 명세와 대조")
+    parser.add_argument('captures', nargs='*', default=['-'],
+                        help="캡처 파일 (.har / .jsonl, .gz 가능, 생략하면 표준 입력)")
+    parser.add_argument('-o', '--output', help="결과 JSON 파일 경로 (생략하면 요약만 출력)")
+    parser.add_argument('--prefix', help="검사할 경로 접두사 (기본값: 카탈로그 경로의 공통 첫 세그먼트)")
+    parser.add_argument('--top', type=int, default=SUMMARY_SIZE, help="요약에 출력할 분류별 항목 수")
+    parser.add_argument('--strict', action='store_true', help="위반이 하나라도 있으면 종료 코드 1 (CI용)")
+    args = parser.parse_args(argv)
+
+    checker = ContractChecker(prefix=args.prefix)
+    for path in args.captures:
+        with open_capture(path) as f:
+            checker.feed_records(iter_capture(f))
+    report = checker.report()
+    print_summary(report, top=args.top)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ 계약 검사 결과 저장 완료: {args.output}")
+    if args.strict and checker.violations:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
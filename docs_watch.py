@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 명세서 --watch 모드 도구
+- iter_changes: 카탈로그 원본 파일 변경 감시 (watchfiles가 있으면 inotify/FSEvents, 없으면 mtime 폴링)
+- restart: 렌더러 코드가 바뀌었을 때 같은 인자로 다시 실행
+- LiveReloadServer: 생성된 명세서를 내보내는 로컬 서버, HTML에 자동 새로고침 스크립트를 넣고
+  다시 생성할 때마다 Server-Sent Events(/__livereload)로 열린 브라우저에 알린다
+
+watchfiles는 선택 의존성이다 (pip install watchfiles).
+"""
+
+import os
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+# mtime 폴링 간격 (초)
+POLL_INTERVAL = 0.2
+
+# 여러 번에 나눠 저장하는 편집기를 위해 변경 후 이 시간 동안 추가 변경을 모은다 (밀리초)
+DEBOUNCE_MS = 50
+
+LIVERELOAD_PATH = '/__livereload'
+
+# SSE 연결 유지용 주석 전송 간격 (초)
+KEEPALIVE_INTERVAL = 15
+
+# 빌드 ID가 처음 받은 값과 달라지면 새로고침 (서버가 재시작해 다시 연결된 경우도 포함)
+LIVERELOAD_SCRIPT = f'''
+<script>
+  (function () {{
+    let build = null;
+    new EventSource('{LIVERELOAD_PATH}').onmessage = function (event) {{
+      if (build !== null && event.data !== build) {{
+        location.reload();
+      }}
+      build = event.data;
+    }};
+  }})();
+</script>
+'''
+
+
+def _snapshot(paths):
+    state = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            state[path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            state[path] = None
+    return state
+
+
+def _poll_changes(paths, interval):
+    state = _snapshot(paths)
+    while True:
+        time.sleep(interval)
+        current = _snapshot(paths)
+        if current == state:
+            continue
+        time.sleep(DEBOUNCE_MS / 1000)
+        current = _snapshot(paths)
+        changed = {path for path in paths if current[path] != state[path]}
+        state = current
+        if changed:
+            yield changed
+
+
+def _watchfiles_changes(paths):
+    # 편집기가 임시 파일을 쓰고 이름을 바꾸는 경우에도 놓치지 않게 디렉토리를 감시하고 경로로 거른다
+    wanted = {os.path.abspath(path) for path in paths}
+    directories = sorted({os.path.dirname(path) for path in wanted})
+    for changes in watchfiles.watch(*directories, debounce=DEBOUNCE_MS * 4, step=DEBOUNCE_MS,
+                                    recursive=False):
+        touched = {path for _, path in changes}
+        changed = {path for path in paths if os.path.abspath(path) in touched}
+        if changed:
+            yield changed
+
+
+def iter_changes(paths, interval=POLL_INTERVAL):
+    """paths 중 바뀐 파일 집합을 변경이 있을 때마다 내주는 이터레이터 (끝나지 않음)"""
+    paths = list(dict.fromkeys(paths))
+    if watchfiles is not None:
+        return _watchfiles_changes(paths)
+    return _poll_changes(paths, interval)
+
+
+def restart():
+    """같은 인자로 현재 프로세스를 다시 실행 (열린 소켓은 exec 시 닫힌다)"""
+    sys.stdout.flush()
+    os.execv(sys.executable, [sys.executable] + sys.argv)
+
+
+class LiveReloadHandler(SimpleHTTPRequestHandler):
+    """정적 파일 + HTML에 새로고침 스크립트 삽입 + /__livereload SSE"""
+
+    def do_GET(self):
+        if self.path == LIVERELOAD_PATH:
+            self._stream_builds()
+            return
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        if path.endswith('.html') and os.path.isfile(path):
+            self._send_html(path)
+            return
+        super().do_GET()
+
+    def end_headers(self):
+        # 다시 생성한 파일을 항상 새로 받도록
+        self.send_header('Cache-Control', 'no-cache')
+        super().end_headers()
+
+    def _send_html(self, path):
+        with open(path, 'rb') as f:
+            body = f.read()
+        end = body.rfind(b'</body>')
+        script = LIVERELOAD_SCRIPT.encode('utf-8')
+        body = body[:end] + script + body[end:] if end >= 0 else body + script
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_builds(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        server = self.server
+        try:
+            build = server.build_id
+            self.wfile.write(f"retry: 1000\ndata: {build}\n\n".encode('utf-8'))
+            self.wfile.flush()
+            while True:
+                with server.changed:
+                    server.changed.wait_for(lambda build=build: server.build_id != build, timeout=KEEPALIVE_INTERVAL)
+                    current = server.build_id
+                if current != build:
+                    build = current
+                    self.wfile.write(f"data: {build}\n\n".encode('utf-8'))
+                else:
+                    self.wfile.write(b": ping\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LiveReloadServer(ThreadingHTTPServer):
+    """root 디렉토리를 내보내는 미리보기 서버 (start 후 백그라운드 스레드에서 실행)"""
+
+    daemon_threads = True
+
+    def __init__(self, root, host='127.0.0.1', port=8000):
+        super().__init__((host, port), partial(LiveReloadHandler, directory=root))
+        self.changed = threading.Condition()
+        # 실행할 때마다 다른 값에서 시작해 재시작(exec는 PID가 같다) 후 다시 연결한 브라우저도 새로고침되게 한다
+        self.started = f"{time.time_ns():x}"
+        self.builds = 0
+        self.build_id = f"{self.started}-0"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def notify(self):
+        """다시 생성 완료 - 연결된 브라우저 새로고침"""
+        with self.changed:
+            self.builds += 1
+            self.build_id = f"{self.started}-{self.builds}"
+            self.changed.notify_all()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
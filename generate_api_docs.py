@@ -3,2526 +3,34 @@
 """
 Wedding OS API 명세서 HTML 생성 스크립트
 노션 템플릿 형식에 맞춰 완성도 높은 API 문서 생성
+API 정의(API_DATA)는 api_data.json에 있다 (api_catalog.load_api_data로 읽음)
 """
 
+import argparse
+import hashlib
+import io
 import json
+import os
+import tempfile
+import time
+import types
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from itertools import repeat
 
-# API 데이터 정의
-API_DATA = {
-    "base_url": "http://localhost:8101/api",
-    "sections": []
-}
+from api_catalog import API_DATA_PATH, ApiCatalog, api_sort_key, load_api_data
+from api_search_index import build_search_index, dump_search_script
+from static_artifacts import ArtifactWriter
 
-# 인증 API
-API_DATA["sections"].append({
-    "id": "1",
-    "name": "인증 (Authentication)",
-    "apis": [
-        {
-            "id": "1.1",
-            "name": "로그인",
-            "method": "POST",
-            "path": "/api/auth/login",
-            "request": "LoginRequest",
-            "response": "LoginResponse",
-            "auth": False,
-            "description": "이메일/비밀번호 검증 후 JWT 토큰 발급",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "email": "string",
-                "password": "string"
-            },
-            "body_required": ["email", "password"],
-            "body_optional": [],
-            "status_codes": [
-                {
-                    "code": 200,
-                    "message": "login_success",
-                    "body": {
-                        "message": "login_success",
-                        "data": {
-                            "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                            "token_type": "bearer",
-                            "user_id": 1,
-                            "nickname": "사용자",
-                            "profile_image_url": "https://..."
-                        }
-                    },
-                    "msg": "로그인 성공"
-                },
-                {
-                    "code": 400,
-                    "message": "invalid_credentials",
-                    "body": {"message": "invalid_credentials", "data": None},
-                    "msg": "아이디 또는 비밀번호를 확인해주세요"
-                },
-                {
-                    "code": 422,
-                    "message": "invalid_email_format",
-                    "body": {"message": "invalid_email_format", "data": None},
-                    "msg": "올바른 이메일 주소 형식을 입력해주세요"
-                },
-                {
-                    "code": 422,
-                    "message": "password_required",
-                    "body": {"message": "password_required", "data": None},
-                    "msg": "비밀번호를 입력해주세요"
-                },
-                {
-                    "code": 500,
-                    "message": "internal_server_error",
-                    "body": {"message": "internal_server_error", "data": None},
-                    "msg": "서버 오류"
-                }
-            ]
-        },
-        {
-            "id": "1.2",
-            "name": "회원 가입",
-            "method": "POST",
-            "path": "/api/auth/signup",
-            "request": "SignupRequest",
-            "response": "SignupResponse",
-            "auth": False,
-            "description": "이메일/비밀번호/닉네임/프로필 이미지 URL을 받아 신규 사용자 생성",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "email": "string",
-                "password": "string",
-                "password_check": "string",
-                "nickname": "string",
-                "profile_image_url": "string (HttpUrl)"
-            },
-            "body_required": ["email", "password", "password_check", "nickname", "profile_image_url"],
-            "body_optional": [],
-            "status_codes": [
-                {
-                    "code": 201,
-                    "message": "register_success",
-                    "body": {
-                        "message": "register_success",
-                        "data": {"user_id": 1}
-                    },
-                    "msg": "회원가입 성공"
-                },
-                {
-                    "code": 400,
-                    "message": "invalid_email_format",
-                    "body": {"message": "invalid_email_format", "data": None},
-                    "msg": "올바른 이메일 주소 형식을 입력해주세요"
-                },
-                {
-                    "code": 409,
-                    "message": "duplicate_email",
-                    "body": {"message": "duplicate_email", "data": None},
-                    "msg": "이미 사용 중인 이메일입니다"
-                },
-                {
-                    "code": 409,
-                    "message": "duplicate_nickname",
-                    "body": {"message": "duplicate_nickname", "data": None},
-                    "msg": "이미 사용 중인 닉네임입니다"
-                },
-                {
-                    "code": 422,
-                    "message": "password_mismatch",
-                    "body": {"message": "password_mismatch", "data": None},
-                    "msg": "비밀번호가 일치하지 않습니다"
-                },
-                {
-                    "code": 500,
-                    "message": "internal_server_error",
-                    "body": {"message": "internal_server_error", "data": None},
-                    "msg": "서버 오류"
-                }
-            ]
-        }
-    ]
-})
-
-# 사용자 API 추가
-API_DATA["sections"].append({
-    "id": "2",
-    "name": "사용자 (User)",
-    "apis": [
-        {
-            "id": "2.1",
-            "name": "프로필 이미지 업로드",
-            "method": "POST",
-            "path": "/api/users/profile/upload",
-            "request": "MultipartFormData",
-            "response": "UploadResponse",
-            "auth": False,
-            "description": "Multipart 이미지 업로드, 응답으로 CDN URL 반환",
-            "query_params": None,
-            "path_params": None,
-            "headers": [{"name": "Content-Type", "type": "String", "required": True, "description": "multipart/form-data"}],
-            "body": {"file": "File (multipart/form-data)"},
-            "body_required": ["file"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "upload_success", "body": {"message": "upload_success", "data": {"url": "https://..."}}, "msg": "업로드 성공"},
-                {"code": 413, "message": "payload_too_large", "body": {"message": "payload_too_large", "data": None}, "msg": "파일 크기가 너무 큽니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "2.2",
-            "name": "프로필 수정",
-            "method": "PATCH",
-            "path": "/api/users/profile",
-            "request": "NicknamePatchRequest",
-            "response": "UpdateProfileResponse",
-            "auth": True,
-            "description": "닉네임 수정. 중복/길이/공백 검증",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"nickname": "string", "profile_image_url": "string | null"},
-            "body_required": ["nickname"],
-            "body_optional": ["profile_image_url"],
-            "status_codes": [
-                {"code": 200, "message": "update_profile_success", "body": {"message": "update_profile_success", "data": {"nickname": "..."}}, "msg": "프로필 수정 성공"},
-                {"code": 409, "message": "duplicate_nickname", "body": {"message": "duplicate_nickname", "data": None}, "msg": "이미 사용 중인 닉네임입니다"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "2.3",
-            "name": "회원 탈퇴",
-            "method": "DELETE",
-            "path": "/api/users/profile",
-            "request": None,
-            "response": "DeleteUserResponse",
-            "auth": True,
-            "description": "회원 탈퇴. 사용자 관련 게시글/댓글/좋아요도 함께 삭제",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "delete_user_success", "body": {"message": "delete_user_success", "data": None}, "msg": "회원 탈퇴 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "2.4",
-            "name": "비밀번호 변경",
-            "method": "PUT",
-            "path": "/api/users/password",
-            "request": "PasswordUpdateRequest",
-            "response": "UpdatePasswordResponse",
-            "auth": True,
-            "description": "기존 비밀번호 확인 후 새 비밀번호로 갱신",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"old_password": "string", "password": "string", "password_check": "string"},
-            "body_required": ["old_password", "password", "password_check"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "update_password_success", "body": {"message": "update_password_success", "data": None}, "msg": "비밀번호 변경 성공"},
-                {"code": 400, "message": "invalid_old_password", "body": {"message": "invalid_old_password", "data": None}, "msg": "기존 비밀번호가 일치하지 않습니다"},
-                {"code": 422, "message": "password_mismatch", "body": {"message": "password_mismatch", "data": None}, "msg": "비밀번호가 일치하지 않습니다"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 게시판 API 추가 (주요 API만 포함, 나머지는 동일한 패턴으로 확장 가능)
-API_DATA["sections"].append({
-    "id": "3",
-    "name": "게시판 (Posts)",
-    "apis": [
-        {
-            "id": "3.1",
-            "name": "게시글 목록 조회",
-            "method": "GET",
-            "path": "/api/posts",
-            "request": None,
-            "response": "PostListResponse",
-            "auth": False,
-            "description": "최신순 게시글 목록 조회",
-            "query_params": [
-                {"name": "page", "type": "Integer", "required": False, "default": "1", "description": "페이지 번호"},
-                {"name": "limit", "type": "Integer", "required": False, "default": "10", "description": "페이지당 항목 수"},
-                {"name": "board_type", "type": "String", "required": False, "default": "couple", "description": "게시판 타입 (couple: 예비부부 게시판, planner: 플래너 리뷰, venue_review: 웨딩홀 리뷰, private: 우리만의 공간, vault: 문서 보관함)"}
-            ],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "get_posts_success", "body": {"message": "get_posts_success", "data": {"posts": [], "total": 0, "page": 1, "limit": 10}}, "msg": "게시글 목록 조회 성공"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "3.2",
-            "name": "게시글 상세 조회",
-            "method": "GET",
-            "path": "/api/posts/{post_id}",
-            "request": None,
-            "response": "PostDetailResponse",
-            "auth": False,
-            "description": "게시글 상세 조회 (로그인 선택, 공개 게시판은 목록만 비회원 가능, 상세는 로그인 필요)",
-            "query_params": None,
-            "path_params": [{"name": "post_id", "type": "Integer", "description": "게시글 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "get_post_success", "body": {"message": "get_post_success", "data": {"post_id": 1, "title": "...", "content": "...", "comments": []}}, "msg": "게시글 상세 조회 성공"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "로그인이 필요한 기능입니다"},
-                {"code": 404, "message": "post_not_found", "body": {"message": "post_not_found", "data": None}, "msg": "게시글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "3.3",
-            "name": "게시글 작성",
-            "method": "POST",
-            "path": "/api/posts",
-            "request": "PostCreateRequest",
-            "response": "PostCreateResponse",
-            "auth": True,
-            "description": "게시글 작성 (AI 요약/태그/감성 분석은 서버 측에서 자동 수행)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"title": "string (max 2000자)", "content": "string", "image_url": "string (HttpUrl) | null", "board_type": "string (기본값: 'couple')"},
-            "body_required": ["title", "content"],
-            "body_optional": ["image_url", "board_type"],
-            "status_codes": [
-                {"code": 201, "message": "create_post_success", "body": {"message": "create_post_success", "data": {"post_id": 1}}, "msg": "게시글 작성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 422, "message": "invalid_request", "body": {"message": "invalid_request", "data": None}, "msg": "유효성 검사 실패"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "3.4",
-            "name": "게시글 수정",
-            "method": "PATCH",
-            "path": "/api/posts/{post_id}",
-            "request": "PostUpdateRequest",
-            "response": "PostUpdateResponse",
-            "auth": True,
-            "description": "게시글 수정 (작성자 또는 커플 파트너만 가능)",
-            "query_params": None,
-            "path_params": [{"name": "post_id", "type": "Integer", "description": "게시글 ID"}],
-            "headers": None,
-            "body": {"title": "string | null", "content": "string | null", "image_url": "string (HttpUrl) | null"},
-            "body_required": [],
-            "body_optional": ["title", "content", "image_url"],
-            "status_codes": [
-                {"code": 200, "message": "update_post_success", "body": {"message": "update_post_success", "data": {"post_id": 1}}, "msg": "게시글 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "post_not_found", "body": {"message": "post_not_found", "data": None}, "msg": "게시글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "3.5",
-            "name": "게시글 삭제",
-            "method": "DELETE",
-            "path": "/api/posts/{post_id}",
-            "request": None,
-            "response": "PostDeleteResponse",
-            "auth": True,
-            "description": "게시글 삭제 (작성자 또는 커플 파트너만 가능)",
-            "query_params": None,
-            "path_params": [{"name": "post_id", "type": "Integer", "description": "게시글 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "delete_post_success", "body": {"message": "delete_post_success", "data": None}, "msg": "게시글 삭제 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "post_not_found", "body": {"message": "post_not_found", "data": None}, "msg": "게시글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "3.6",
-            "name": "게시글 좋아요 토글",
-            "method": "POST",
-            "path": "/api/posts/{post_id}/like",
-            "request": None,
-            "response": "LikeToggleResponse",
-            "auth": True,
-            "description": "게시글 좋아요 토글 (좋아요/취소)",
-            "query_params": None,
-            "path_params": [{"name": "post_id", "type": "Integer", "description": "게시글 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "like_toggled", "body": {"message": "like_toggled", "data": {"like_count": 10, "liked": True}}, "msg": "좋아요 토글 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "post_not_found", "body": {"message": "post_not_found", "data": None}, "msg": "게시글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "3.7",
-            "name": "게시글 조회수 증가",
-            "method": "PATCH",
-            "path": "/api/posts/{post_id}/view",
-            "request": None,
-            "response": "ViewIncrementResponse",
-            "auth": False,
-            "description": "게시글 조회수 증가",
-            "query_params": None,
-            "path_params": [{"name": "post_id", "type": "Integer", "description": "게시글 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "view_incremented", "body": {"message": "view_incremented", "data": {"view_count": 100}}, "msg": "조회수 증가 성공"},
-                {"code": 404, "message": "post_not_found", "body": {"message": "post_not_found", "data": None}, "msg": "게시글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "3.8",
-            "name": "게시글 이미지 업로드",
-            "method": "POST",
-            "path": "/api/posts/upload",
-            "request": "MultipartFormData",
-            "response": "ImageUploadResponse",
-            "auth": False,
-            "description": "게시글 이미지 업로드 (이미지 분류 포함)",
-            "query_params": None,
-            "path_params": None,
-            "headers": [{"name": "Content-Type", "type": "String", "required": True, "description": "multipart/form-data"}],
-            "body": {"file": "File (multipart/form-data, image/jpeg, image/png, image/webp)"},
-            "body_required": ["file"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "upload_success", "body": {"message": "upload_success", "data": {"url": "https://...", "category": "wedding"}}, "msg": "이미지 업로드 성공"},
-                {"code": 400, "message": "invalid_file_type", "body": {"message": "invalid_file_type", "data": None}, "msg": "지원하지 않는 파일 형식입니다"},
-                {"code": 413, "message": "payload_too_large", "body": {"message": "payload_too_large", "data": None}, "msg": "파일 크기가 너무 큽니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "3.9",
-            "name": "문서 업로드 + OCR 처리",
-            "method": "POST",
-            "path": "/api/posts/upload-document",
-            "request": "MultipartFormData",
-            "response": "DocumentUploadResponse",
-            "auth": True,
-            "description": "문서 이미지를 업로드하고 OCR로 텍스트를 추출한 후, AI 요약 및 태깅을 수행하여 문서 보관함(vault)에 저장합니다.",
-            "query_params": None,
-            "path_params": None,
-            "headers": [{"name": "Content-Type", "type": "String", "required": True, "description": "multipart/form-data"}],
-            "body": {
-                "file": "File (multipart/form-data, image/jpeg, image/png, image/webp, 최대 10MB)",
-                "title": "string (Form field, 문서 제목)"
-            },
-            "body_required": ["file", "title"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "document_uploaded", "body": {"message": "document_uploaded", "data": {"post_id": 1, "title": "문서 제목", "content": "OCR로 추출된 텍스트", "image_url": "https://...", "summary": "AI 요약", "tags": ["태그1", "태그2"]}}, "msg": "문서 업로드 및 OCR 처리 성공"},
-                {"code": 400, "message": "invalid_file_type", "body": {"message": "invalid_file_type", "data": {"allowed": ["jpg", "png", "webp"]}}, "msg": "지원하지 않는 파일 형식입니다"},
-                {"code": 413, "message": "file_too_large", "body": {"message": "file_too_large", "data": {"max_size": "10MB"}}, "msg": "파일 크기가 너무 큽니다 (최대 10MB)"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 댓글 API 추가
-API_DATA["sections"].append({
-    "id": "4",
-    "name": "댓글 (Comments)",
-    "apis": [
-        {
-            "id": "4.1",
-            "name": "댓글 목록 조회",
-            "method": "GET",
-            "path": "/api/posts/{post_id}/comments",
-            "request": None,
-            "response": "CommentListResponse",
-            "auth": False,
-            "description": "게시글의 댓글 목록 조회",
-            "query_params": None,
-            "path_params": [{"name": "post_id", "type": "Integer", "description": "게시글 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "get_comments_success", "body": {"message": "get_comments_success", "data": {"comments": []}}, "msg": "댓글 목록 조회 성공"},
-                {"code": 404, "message": "post_not_found", "body": {"message": "post_not_found", "data": None}, "msg": "게시글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "4.2",
-            "name": "댓글 작성",
-            "method": "POST",
-            "path": "/api/posts/{post_id}/comments",
-            "request": "CommentCreateRequest",
-            "response": "CommentCreateResponse",
-            "auth": True,
-            "description": "댓글 작성, 서버에서 감성 분석 수행",
-            "query_params": None,
-            "path_params": [{"name": "post_id", "type": "Integer", "description": "게시글 ID"}],
-            "headers": None,
-            "body": {"content": "string"},
-            "body_required": ["content"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 201, "message": "create_comment_success", "body": {"message": "create_comment_success", "data": {"comment_id": 1}}, "msg": "댓글 작성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "post_not_found", "body": {"message": "post_not_found", "data": None}, "msg": "게시글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "4.3",
-            "name": "댓글 수정",
-            "method": "PATCH",
-            "path": "/api/posts/{post_id}/comments/{comment_id}",
-            "request": "CommentUpdateRequest",
-            "response": "CommentUpdateResponse",
-            "auth": True,
-            "description": "댓글 수정 (작성자만 가능)",
-            "query_params": None,
-            "path_params": [
-                {"name": "post_id", "type": "Integer", "description": "게시글 ID"},
-                {"name": "comment_id", "type": "Integer", "description": "댓글 ID"}
-            ],
-            "headers": None,
-            "body": {"content": "string"},
-            "body_required": ["content"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "update_comment_success", "body": {"message": "update_comment_success", "data": {"comment_id": 1}}, "msg": "댓글 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "comment_not_found", "body": {"message": "comment_not_found", "data": None}, "msg": "댓글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "4.4",
-            "name": "댓글 삭제",
-            "method": "DELETE",
-            "path": "/api/posts/{post_id}/comments/{comment_id}",
-            "request": None,
-            "response": "CommentDeleteResponse",
-            "auth": True,
-            "description": "댓글 삭제 (작성자만 가능)",
-            "query_params": None,
-            "path_params": [
-                {"name": "post_id", "type": "Integer", "description": "게시글 ID"},
-                {"name": "comment_id", "type": "Integer", "description": "댓글 ID"}
-            ],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "delete_comment_success", "body": {"message": "delete_comment_success", "data": None}, "msg": "댓글 삭제 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "comment_not_found", "body": {"message": "comment_not_found", "data": None}, "msg": "댓글을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 챗봇 API 추가
-API_DATA["sections"].append({
-    "id": "5",
-    "name": "챗봇 (Chat)",
-    "apis": [
-        {
-            "id": "5.1",
-            "name": "챗봇 대화 (스트리밍)",
-            "method": "POST",
-            "path": "/api/chat",
-            "request": "ChatRequest",
-            "response": "StreamingResponse (NDJSON)",
-            "auth": True,
-            "description": "스트리밍 챗봇 (NDJSON). RAG + 개인 데이터 통합 + Vector DB 검색",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"message": "string", "user_id": "integer | null", "include_context": "boolean (기본값: true)"},
-            "body_required": ["message"],
-            "body_optional": ["user_id", "include_context"],
-            "status_codes": [
-                {"code": 200, "message": "chat_success", "body": {"type": "content", "content": "..."}, "msg": "스트리밍 응답"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 캘린더 API 추가
-API_DATA["sections"].append({
-    "id": "6",
-    "name": "캘린더 (Calendar)",
-    "apis": [
-        {
-            "id": "6.1",
-            "name": "예식일 설정",
-            "method": "POST",
-            "path": "/api/calendar/wedding-date",
-            "request": "WeddingDateSetRequest",
-            "response": "WeddingDateSetResponse",
-            "auth": True,
-            "description": "예식일 설정 (JWT 토큰에서 user_id 추출, 커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"wedding_date": "string (YYYY-MM-DD)"},
-            "body_required": ["wedding_date"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "wedding_date_set", "body": {"message": "wedding_date_set", "data": {"wedding_date": "2025-05-01"}}, "msg": "예식일 설정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 422, "message": "invalid_date_format", "body": {"message": "invalid_date_format", "data": None}, "msg": "올바른 날짜 형식을 입력해주세요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "6.2",
-            "name": "예식일 조회",
-            "method": "GET",
-            "path": "/api/calendar/wedding-date",
-            "request": None,
-            "response": "WeddingDateResponse",
-            "auth": True,
-            "description": "예식일 조회 (JWT 토큰에서 user_id 추출, 커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "wedding_date_retrieved", "body": {"message": "wedding_date_retrieved", "data": {"wedding_date": "2025-05-01"}}, "msg": "예식일 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "6.3",
-            "name": "타임라인 자동 생성",
-            "method": "POST",
-            "path": "/api/calendar/timeline/generate",
-            "request": "TimelineGenerateRequest",
-            "response": "TimelineGenerateResponse",
-            "auth": True,
-            "description": "D-Day 기반 타임라인 자동 생성 (커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"wedding_date": "string (YYYY-MM-DD)"},
-            "body_required": ["wedding_date"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "timeline_generated", "body": {"message": "timeline_generated", "data": {"events_created": 10}}, "msg": "타임라인 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 422, "message": "invalid_date_format", "body": {"message": "invalid_date_format", "data": None}, "msg": "올바른 날짜 형식을 입력해주세요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "6.4",
-            "name": "일정/할일 생성",
-            "method": "POST",
-            "path": "/api/calendar/todos",
-            "request": "TodoCreateRequest",
-            "response": "TodoCreateResponse",
-            "auth": True,
-            "description": "일정/할일 생성 (통합 API, 커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "title": "string",
-                "description": "string | null",
-                "due_date": "string (YYYY-MM-DD)",
-                "category": "string (기본값: 'todo')",
-                "priority": "string (기본값: 'medium')",
-                "assignee": "string (기본값: 'both')"
-            },
-            "body_required": ["title", "due_date"],
-            "body_optional": ["description", "category", "priority", "assignee"],
-            "status_codes": [
-                {"code": 200, "message": "todo_created", "body": {"message": "todo_created", "data": {"todo_id": 1}}, "msg": "일정/할일 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 422, "message": "invalid_request", "body": {"message": "invalid_request", "data": None}, "msg": "유효성 검사 실패"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "6.5",
-            "name": "일정/할일 조회",
-            "method": "GET",
-            "path": "/api/calendar/todos",
-            "request": None,
-            "response": "TodoListResponse",
-            "auth": True,
-            "description": "일정/할일 조회 (통합 API, 커플 공유)",
-            "query_params": [
-                {"name": "completed", "type": "Boolean", "required": False, "default": None, "description": "완료 여부 필터"},
-                {"name": "start_date", "type": "String", "required": False, "default": None, "description": "시작 날짜 (YYYY-MM-DD)"},
-                {"name": "end_date", "type": "String", "required": False, "default": None, "description": "종료 날짜 (YYYY-MM-DD)"},
-                {"name": "category", "type": "String", "required": False, "default": None, "description": "카테고리 필터 ('todo'로 필터링하면 할일만)"}
-            ],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "todos_retrieved", "body": {"message": "todos_retrieved", "data": {"todos": []}}, "msg": "일정/할일 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "6.6",
-            "name": "일정/할일 수정",
-            "method": "PUT",
-            "path": "/api/calendar/todos/{todo_id}",
-            "request": "TodoUpdateRequest",
-            "response": "TodoUpdateResponse",
-            "auth": True,
-            "description": "일정/할일 수정 (통합 API, 커플 공유)",
-            "query_params": None,
-            "path_params": [{"name": "todo_id", "type": "Integer", "description": "일정/할일 ID"}],
-            "headers": None,
-            "body": {
-                "title": "string | null",
-                "description": "string | null",
-                "due_date": "string (YYYY-MM-DD) | null",
-                "completed": "boolean | null",
-                "category": "string | null",
-                "priority": "string | null",
-                "assignee": "string | null"
-            },
-            "body_required": [],
-            "body_optional": ["title", "description", "due_date", "completed", "category", "priority", "assignee"],
-            "status_codes": [
-                {"code": 200, "message": "todo_updated", "body": {"message": "todo_updated", "data": {"todo_id": 1}}, "msg": "일정/할일 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "todo_not_found", "body": {"message": "todo_not_found", "data": None}, "msg": "일정/할일을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "6.7",
-            "name": "일정/할일 삭제",
-            "method": "DELETE",
-            "path": "/api/calendar/todos/{todo_id}",
-            "request": None,
-            "response": "TodoDeleteResponse",
-            "auth": True,
-            "description": "일정/할일 삭제 (통합 API, 커플 공유)",
-            "query_params": None,
-            "path_params": [{"name": "todo_id", "type": "Integer", "description": "일정/할일 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "todo_deleted", "body": {"message": "todo_deleted", "data": None}, "msg": "일정/할일 삭제 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "todo_not_found", "body": {"message": "todo_not_found", "data": None}, "msg": "일정/할일을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "6.8",
-            "name": "주간 요약 조회",
-            "method": "GET",
-            "path": "/api/calendar/week-summary",
-            "request": None,
-            "response": "WeekSummaryResponse",
-            "auth": True,
-            "description": "이번 주 요약 (챗봇 연동용, 커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "week_summary_retrieved", "body": {"message": "week_summary_retrieved", "data": {"summary": "..."}}, "msg": "주간 요약 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 예산 API 추가
-API_DATA["sections"].append({
-    "id": "7",
-    "name": "예산 (Budget)",
-    "apis": [
-        {
-            "id": "7.1",
-            "name": "예산 항목 생성",
-            "method": "POST",
-            "path": "/api/budget/items",
-            "request": "BudgetItemCreateRequest",
-            "response": "BudgetItemCreateResponse",
-            "auth": True,
-            "description": "예산 항목 생성",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "item_name": "string",
-                "category": "string (기본값: 'etc')",
-                "estimated_budget": "number (float)",
-                "actual_expense": "number (float, 기본값: 0.0)",
-                "unit": "string | null",
-                "quantity": "number (float, 기본값: 1.0)",
-                "notes": "string | null",
-                "payer": "string (기본값: 'both')"
-            },
-            "body_required": ["item_name", "estimated_budget"],
-            "body_optional": ["category", "actual_expense", "unit", "quantity", "notes", "payer"],
-            "status_codes": [
-                {"code": 200, "message": "budget_item_created", "body": {"message": "budget_item_created", "data": {"item_id": 1}}, "msg": "예산 항목 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 422, "message": "invalid_request", "body": {"message": "invalid_request", "data": None}, "msg": "유효성 검사 실패"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.2",
-            "name": "예산 항목 조회",
-            "method": "GET",
-            "path": "/api/budget/items",
-            "request": None,
-            "response": "BudgetItemListResponse",
-            "auth": True,
-            "description": "예산 항목 조회 (커플 공유)",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "budget_items_retrieved", "body": {"message": "budget_items_retrieved", "data": {"items": []}}, "msg": "예산 항목 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.3",
-            "name": "예산 항목 수정",
-            "method": "PUT",
-            "path": "/api/budget/items/{item_id}",
-            "request": "BudgetItemUpdateRequest",
-            "response": "BudgetItemUpdateResponse",
-            "auth": True,
-            "description": "예산 항목 수정 (커플 공유)",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": [{"name": "item_id", "type": "Integer", "description": "예산 항목 ID"}],
-            "headers": None,
-            "body": {"item_name": "string | null", "category": "string | null", "estimated_budget": "float | null", "actual_expense": "float | null", "unit": "string | null", "quantity": "float | null", "notes": "string | null", "payer": "string | null"},
-            "body_required": [],
-            "body_optional": ["item_name", "category", "estimated_budget", "actual_expense", "unit", "quantity", "notes", "payer"],
-            "status_codes": [
-                {"code": 200, "message": "budget_item_updated", "body": {"message": "budget_item_updated", "data": {"item_id": 1}}, "msg": "예산 항목 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "budget_item_not_found", "body": {"message": "budget_item_not_found", "data": None}, "msg": "예산 항목을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.4",
-            "name": "예산 항목 삭제",
-            "method": "DELETE",
-            "path": "/api/budget/items/{item_id}",
-            "request": None,
-            "response": "BudgetItemDeleteResponse",
-            "auth": True,
-            "description": "예산 항목 삭제 (커플 공유)",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": [{"name": "item_id", "type": "Integer", "description": "예산 항목 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "budget_item_deleted", "body": {"message": "budget_item_deleted", "data": None}, "msg": "예산 항목 삭제 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "budget_item_not_found", "body": {"message": "budget_item_not_found", "data": None}, "msg": "예산 항목을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.5",
-            "name": "예산 요약 조회",
-            "method": "GET",
-            "path": "/api/budget/summary",
-            "request": None,
-            "response": "BudgetSummaryResponse",
-            "auth": True,
-            "description": "예산 요약 (카테고리별 합계, 커플 공유)",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "budget_summary_retrieved", "body": {"message": "budget_summary_retrieved", "data": {"summary": {}}}, "msg": "예산 요약 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.6",
-            "name": "총 예산 설정",
-            "method": "POST",
-            "path": "/api/budget/total",
-            "request": "TotalBudgetSetRequest",
-            "response": "TotalBudgetSetResponse",
-            "auth": True,
-            "description": "총 예산 설정 (커플 공유)",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": None,
-            "body": {"total_budget": "float"},
-            "body_required": ["total_budget"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "total_budget_set", "body": {"message": "total_budget_set", "data": {"total_budget": 10000000}}, "msg": "총 예산 설정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.7",
-            "name": "Excel Export",
-            "method": "GET",
-            "path": "/api/budget/export/excel",
-            "request": None,
-            "response": "File (application/vnd.openxmlformats-officedocument.spreadsheetml.sheet)",
-            "auth": True,
-            "description": "예산 데이터를 Excel 파일로 Export",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "excel_exported", "body": {"message": "excel_exported", "data": None}, "msg": "Excel Export 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.8",
-            "name": "CSV Export",
-            "method": "GET",
-            "path": "/api/budget/export/csv",
-            "request": None,
-            "response": "File (text/csv)",
-            "auth": True,
-            "description": "예산 데이터를 CSV로 Export",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "csv_exported", "body": {"message": "csv_exported", "data": None}, "msg": "CSV Export 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.9",
-            "name": "Excel Import",
-            "method": "POST",
-            "path": "/api/budget/import/excel",
-            "request": "MultipartFormData",
-            "response": "BudgetImportResponse",
-            "auth": True,
-            "description": "Excel 파일에서 예산 데이터 Import",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": [{"name": "Content-Type", "type": "String", "required": True, "description": "multipart/form-data"}],
-            "body": {"file": "File (multipart/form-data, application/vnd.openxmlformats-officedocument.spreadsheetml.sheet)"},
-            "body_required": ["file"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "budget_imported", "body": {"message": "budget_imported", "data": {"items_imported": 10, "items": []}}, "msg": "Excel Import 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 400, "message": "invalid_file_type", "body": {"message": "invalid_file_type", "data": None}, "msg": "지원하지 않는 파일 형식입니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.10",
-            "name": "CSV Import",
-            "method": "POST",
-            "path": "/api/budget/import/csv",
-            "request": "MultipartFormData",
-            "response": "BudgetImportResponse",
-            "auth": True,
-            "description": "CSV 파일에서 예산 데이터 Import",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": [{"name": "Content-Type", "type": "String", "required": True, "description": "multipart/form-data"}],
-            "body": {"file": "File (multipart/form-data, text/csv)"},
-            "body_required": ["file"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "budget_imported", "body": {"message": "budget_imported", "data": {"items_imported": 10, "items": []}}, "msg": "CSV Import 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 400, "message": "invalid_file_type", "body": {"message": "invalid_file_type", "data": None}, "msg": "지원하지 않는 파일 형식입니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "7.11",
-            "name": "영수증 이미지 처리",
-            "method": "POST",
-            "path": "/api/budget/process-receipt",
-            "request": "MultipartFormData",
-            "response": "ReceiptProcessResponse",
-            "auth": True,
-            "description": "영수증/견적서 이미지 처리 (OCR + LLM 구조화)",
-            "query_params": [{"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}],
-            "path_params": None,
-            "headers": [{"name": "Content-Type", "type": "String", "required": True, "description": "multipart/form-data"}],
-            "body": {"file": "File (multipart/form-data, image/jpeg, image/png, image/webp)"},
-            "body_required": ["file"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "receipt_processed", "body": {"message": "receipt_processed", "data": {"items": []}}, "msg": "영수증 처리 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 400, "message": "invalid_file_type", "body": {"message": "invalid_file_type", "data": None}, "msg": "지원하지 않는 파일 형식입니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 음성 비서 API 추가
-API_DATA["sections"].append({
-    "id": "8",
-    "name": "음성 비서 (Voice)",
-    "apis": [
-        {
-            "id": "8.1",
-            "name": "음성 처리",
-            "method": "POST",
-            "path": "/api/voice/process",
-            "request": "VoiceProcessRequest",
-            "response": "VoiceProcessResponse",
-            "auth": False,
-            "description": "음성 처리 (STT + 자동 정리 파이프라인)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"audio_data": "string (base64 encoded audio)"},
-            "body_required": ["audio_data"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "voice_processed", "body": {"message": "voice_processed", "data": {"text": "...", "structured_data": {}}}, "msg": "음성 처리 성공"},
-                {"code": 400, "message": "invalid_audio_format", "body": {"message": "invalid_audio_format", "data": None}, "msg": "지원하지 않는 오디오 형식입니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "8.2",
-            "name": "음성 응답 생성",
-            "method": "POST",
-            "path": "/api/voice/response",
-            "request": None,
-            "response": "VoiceResponseResponse",
-            "auth": False,
-            "description": "음성 질문에 대한 답변 생성",
-            "query_params": [
-                {"name": "query", "type": "String", "required": True, "default": None, "description": "음성 질문"},
-                {"name": "user_id", "type": "Integer", "required": True, "default": None, "description": "사용자 ID"}
-            ],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "voice_response_generated", "body": {"message": "voice_response_generated", "data": {"response": "..."}}, "msg": "음성 응답 생성 성공"},
-                {"code": 400, "message": "invalid_request", "body": {"message": "invalid_request", "data": None}, "msg": "유효하지 않은 요청입니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 업체 추천 API 추가
-API_DATA["sections"].append({
-    "id": "9",
-    "name": "업체 추천 (Vendor)",
-    "apis": [
-        {
-            "id": "9.1",
-            "name": "결혼식 프로필 생성",
-            "method": "POST",
-            "path": "/api/wedding-profiles",
-            "request": "WeddingProfileCreateRequest",
-            "response": "WeddingProfileCreateResponse",
-            "auth": True,
-            "description": "결혼식 프로필 생성",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "wedding_date": "string (YYYY-MM-DD)",
-                "guest_count_category": "string (SMALL, MEDIUM, LARGE)",
-                "total_budget": "number (float)",
-                "location_city": "string",
-                "location_district": "string",
-                "style_indoor": "boolean (기본값: true)",
-                "style_outdoor": "boolean (기본값: false)",
-                "outdoor_rain_plan_required": "boolean (기본값: false)"
-            },
-            "body_required": ["wedding_date", "guest_count_category", "total_budget", "location_city", "location_district"],
-            "body_optional": ["style_indoor", "style_outdoor", "outdoor_rain_plan_required"],
-            "status_codes": [
-                {"code": 200, "message": "profile_created", "body": {"message": "profile_created", "data": {"profile_id": 1}}, "msg": "프로필 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 422, "message": "invalid_request", "body": {"message": "invalid_request", "data": None}, "msg": "유효성 검사 실패"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.2",
-            "name": "결혼식 프로필 목록 조회",
-            "method": "GET",
-            "path": "/api/wedding-profiles",
-            "request": None,
-            "response": "WeddingProfileListResponse",
-            "auth": True,
-            "description": "결혼식 프로필 목록 조회 (커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "wedding_profiles_retrieved", "body": {"message": "wedding_profiles_retrieved", "data": {"profiles": []}}, "msg": "결혼식 프로필 목록 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.3",
-            "name": "결혼식 프로필 상세 조회",
-            "method": "GET",
-            "path": "/api/wedding-profiles/{profile_id}",
-            "request": None,
-            "response": "WeddingProfileDetailResponse",
-            "auth": True,
-            "description": "결혼식 프로필 상세 조회 (커플 공유)",
-            "query_params": None,
-            "path_params": [{"name": "profile_id", "type": "Integer", "description": "프로필 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "wedding_profile_retrieved", "body": {"message": "wedding_profile_retrieved", "data": {"profile_id": 1, "wedding_date": "2025-05-01"}}, "msg": "결혼식 프로필 상세 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "profile_not_found", "body": {"message": "profile_not_found", "data": None}, "msg": "프로필을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.4",
-            "name": "결혼식 프로필 수정",
-            "method": "PUT",
-            "path": "/api/wedding-profiles/{profile_id}",
-            "request": "WeddingProfileUpdateRequest",
-            "response": "WeddingProfileUpdateResponse",
-            "auth": True,
-            "description": "결혼식 프로필 수정 (커플 공유)",
-            "query_params": None,
-            "path_params": [{"name": "profile_id", "type": "Integer", "description": "프로필 ID"}],
-            "headers": None,
-            "body": {
-                "wedding_date": "string (YYYY-MM-DD) | null",
-                "guest_count_category": "string | null",
-                "total_budget": "float | null",
-                "location_city": "string | null",
-                "location_district": "string | null",
-                "style_indoor": "boolean | null",
-                "style_outdoor": "boolean | null",
-                "outdoor_rain_plan_required": "boolean | null"
-            },
-            "body_required": [],
-            "body_optional": ["wedding_date", "guest_count_category", "total_budget", "location_city", "location_district", "style_indoor", "style_outdoor", "outdoor_rain_plan_required"],
-            "status_codes": [
-                {"code": 200, "message": "wedding_profile_updated", "body": {"message": "wedding_profile_updated", "data": {"profile_id": 1}}, "msg": "결혼식 프로필 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "profile_not_found", "body": {"message": "profile_not_found", "data": None}, "msg": "프로필을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.5",
-            "name": "결혼식 프로필 삭제",
-            "method": "DELETE",
-            "path": "/api/wedding-profiles/{profile_id}",
-            "request": None,
-            "response": "WeddingProfileDeleteResponse",
-            "auth": True,
-            "description": "결혼식 프로필 삭제 (커플 공유)",
-            "query_params": None,
-            "path_params": [{"name": "profile_id", "type": "Integer", "description": "프로필 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "wedding_profile_deleted", "body": {"message": "wedding_profile_deleted", "data": None}, "msg": "결혼식 프로필 삭제 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "profile_not_found", "body": {"message": "profile_not_found", "data": None}, "msg": "프로필을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.6",
-            "name": "업체 추천",
-            "method": "GET",
-            "path": "/api/vendors/recommend",
-            "request": None,
-            "response": "VendorRecommendResponse",
-            "auth": True,
-            "description": "업체 추천 (프로필 기반, 커플 공유)",
-            "query_params": [
-                {"name": "wedding_profile_id", "type": "Integer", "required": True, "default": None, "description": "결혼식 프로필 ID"},
-                {"name": "vendor_type", "type": "String", "required": False, "default": None, "description": "업체 타입 (IPHONE_SNAP, MC, SINGER, STUDIO_PREWEDDING, VENUE_OUTDOOR)"},
-                {"name": "min_price", "type": "Float", "required": False, "default": None, "description": "최소 가격"},
-                {"name": "max_price", "type": "Float", "required": False, "default": None, "description": "최대 가격"},
-                {"name": "location_city", "type": "String", "required": False, "default": None, "description": "지역 필터"},
-                {"name": "has_rain_plan", "type": "Boolean", "required": False, "default": None, "description": "우천 대비 여부"},
-                {"name": "sort", "type": "String", "required": False, "default": "score_desc", "description": "정렬 방식 (score_desc, price_asc, price_desc, review_desc)"}
-            ],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "vendors_recommended", "body": {"message": "vendors_recommended", "data": {"vendors": [], "total": 0}}, "msg": "업체 추천 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "profile_not_found", "body": {"message": "profile_not_found", "data": None}, "msg": "프로필을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.7",
-            "name": "벤더 목록 조회",
-            "method": "GET",
-            "path": "/api/vendors",
-            "request": None,
-            "response": "VendorListResponse",
-            "auth": False,
-            "description": "벤더 목록 조회 (카테고리별)",
-            "query_params": [{"name": "vendor_type", "type": "String", "required": False, "default": None, "description": "벤더 타입 필터"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "vendors_retrieved", "body": {"message": "vendors_retrieved", "data": {"vendors": []}}, "msg": "벤더 목록 조회 성공"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.8",
-            "name": "벤더 계정 정보 조회",
-            "method": "GET",
-            "path": "/api/vendors/my-vendor",
-            "request": None,
-            "response": "MyVendorResponse",
-            "auth": True,
-            "description": "벤더 계정의 자신의 벤더 정보 조회",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "my_vendor_retrieved", "body": {"message": "my_vendor_retrieved", "data": {"vendor": {}}}, "msg": "벤더 정보 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "vendor_not_found", "body": {"message": "vendor_not_found", "data": None}, "msg": "벤더를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.9",
-            "name": "업체 상세 조회",
-            "method": "GET",
-            "path": "/api/vendors/{vendor_id}",
-            "request": None,
-            "response": "VendorDetailResponse",
-            "auth": False,
-            "description": "업체 상세 조회",
-            "query_params": None,
-            "path_params": [{"name": "vendor_id", "type": "Integer", "description": "벤더 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "vendor_retrieved", "body": {"message": "vendor_retrieved", "data": {"vendor": {}}}, "msg": "업체 상세 조회 성공"},
-                {"code": 404, "message": "vendor_not_found", "body": {"message": "vendor_not_found", "data": None}, "msg": "업체를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.10",
-            "name": "찜하기",
-            "method": "POST",
-            "path": "/api/favorites",
-            "request": "FavoriteVendorCreateRequest",
-            "response": "FavoriteVendorCreateResponse",
-            "auth": True,
-            "description": "찜하기 (커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"vendor_id": "integer", "wedding_profile_id": "integer"},
-            "body_required": ["vendor_id", "wedding_profile_id"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "favorite_created", "body": {"message": "favorite_created", "data": {"favorite_id": 1}}, "msg": "찜하기 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "vendor_not_found", "body": {"message": "vendor_not_found", "data": None}, "msg": "업체를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.11",
-            "name": "찜 목록 조회",
-            "method": "GET",
-            "path": "/api/favorites",
-            "request": None,
-            "response": "FavoriteListResponse",
-            "auth": True,
-            "description": "찜 목록 조회 (커플 공유)",
-            "query_params": [{"name": "wedding_profile_id", "type": "Integer", "required": False, "default": None, "description": "결혼식 프로필 ID (필터링용)"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "favorites_retrieved", "body": {"message": "favorites_retrieved", "data": {"favorites": []}}, "msg": "찜 목록 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "9.12",
-            "name": "찜 삭제",
-            "method": "DELETE",
-            "path": "/api/favorites/{favorite_id}",
-            "request": None,
-            "response": "FavoriteDeleteResponse",
-            "auth": True,
-            "description": "찜 삭제 (커플 공유)",
-            "query_params": None,
-            "path_params": [{"name": "favorite_id", "type": "Integer", "description": "찜 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "favorite_deleted", "body": {"message": "favorite_deleted", "data": None}, "msg": "찜 삭제 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "favorite_not_found", "body": {"message": "favorite_not_found", "data": None}, "msg": "찜을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 벤더 메시지 API 추가
-API_DATA["sections"].append({
-    "id": "12",
-    "name": "벤더 메시지 & 결제 리마인더",
-    "apis": [
-        {
-            "id": "12.1",
-            "name": "벤더 메시지 쓰레드 생성",
-            "method": "POST",
-            "path": "/api/vendor-threads",
-            "request": "VendorThreadCreateRequest",
-            "response": "VendorThreadCreateResponse",
-            "auth": True,
-            "description": "벤더 메시지 쓰레드 생성 (선택적 커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"vendor_id": "integer", "title": "string | null", "is_shared_with_partner": "boolean (기본값: false)"},
-            "body_required": ["vendor_id"],
-            "body_optional": ["title", "is_shared_with_partner"],
-            "status_codes": [
-                {"code": 200, "message": "thread_created", "body": {"message": "thread_created", "data": {"thread_id": 1}}, "msg": "쓰레드 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "vendor_not_found", "body": {"message": "vendor_not_found", "data": None}, "msg": "벤더를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.2",
-            "name": "벤더 메시지 쓰레드 목록 조회",
-            "method": "GET",
-            "path": "/api/vendor-threads",
-            "request": None,
-            "response": "VendorThreadListResponse",
-            "auth": True,
-            "description": "벤더 메시지 쓰레드 목록 조회 (사용자 또는 벤더, 선택적 커플 공유)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "threads_retrieved", "body": {"message": "threads_retrieved", "data": {"threads": []}}, "msg": "쓰레드 목록 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.3",
-            "name": "벤더 메시지 쓰레드 상세 조회",
-            "method": "GET",
-            "path": "/api/vendor-threads/{thread_id}",
-            "request": None,
-            "response": "VendorThreadDetailResponse",
-            "auth": True,
-            "description": "벤더 메시지 쓰레드 상세 조회 (사용자 또는 벤더, 선택적 커플 공유)",
-            "query_params": None,
-            "path_params": [{"name": "thread_id", "type": "Integer", "description": "쓰레드 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "thread_retrieved", "body": {"message": "thread_retrieved", "data": {"thread": {}, "messages": []}}, "msg": "쓰레드 상세 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "thread_not_found", "body": {"message": "thread_not_found", "data": None}, "msg": "쓰레드를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.4",
-            "name": "벤더 메시지 쓰레드 수정",
-            "method": "PUT",
-            "path": "/api/vendor-threads/{thread_id}",
-            "request": "VendorThreadUpdateRequest",
-            "response": "VendorThreadUpdateResponse",
-            "auth": True,
-            "description": "벤더 메시지 쓰레드 수정",
-            "query_params": None,
-            "path_params": [{"name": "thread_id", "type": "Integer", "description": "쓰레드 ID"}],
-            "headers": None,
-            "body": {"title": "string | null"},
-            "body_required": [],
-            "body_optional": ["title"],
-            "status_codes": [
-                {"code": 200, "message": "thread_updated", "body": {"message": "thread_updated", "data": {"thread_id": 1}}, "msg": "쓰레드 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "thread_not_found", "body": {"message": "thread_not_found", "data": None}, "msg": "쓰레드를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.5",
-            "name": "메시지 전송",
-            "method": "POST",
-            "path": "/api/vendor-messages",
-            "request": "VendorMessageCreateRequest",
-            "response": "VendorMessageCreateResponse",
-            "auth": True,
-            "description": "메시지 전송 (사용자 또는 벤더)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"thread_id": "integer", "content": "string"},
-            "body_required": ["thread_id", "content"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "message_sent", "body": {"message": "message_sent", "data": {"message_id": 1}}, "msg": "메시지 전송 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "thread_not_found", "body": {"message": "thread_not_found", "data": None}, "msg": "쓰레드를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.6",
-            "name": "계약 정보 생성",
-            "method": "POST",
-            "path": "/api/vendor-contracts",
-            "request": "VendorContractCreateRequest",
-            "response": "VendorContractCreateResponse",
-            "auth": True,
-            "description": "계약 정보 생성",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"thread_id": "integer", "contract_amount": "float", "contract_date": "string (YYYY-MM-DD)", "notes": "string | null"},
-            "body_required": ["thread_id", "contract_amount", "contract_date"],
-            "body_optional": ["notes"],
-            "status_codes": [
-                {"code": 200, "message": "contract_created", "body": {"message": "contract_created", "data": {"contract_id": 1}}, "msg": "계약 정보 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "thread_not_found", "body": {"message": "thread_not_found", "data": None}, "msg": "쓰레드를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.7",
-            "name": "계약 정보 수정",
-            "method": "PUT",
-            "path": "/api/vendor-contracts/{contract_id}",
-            "request": "VendorContractUpdateRequest",
-            "response": "VendorContractUpdateResponse",
-            "auth": True,
-            "description": "계약 정보 수정",
-            "query_params": None,
-            "path_params": [{"name": "contract_id", "type": "Integer", "description": "계약 ID"}],
-            "headers": None,
-            "body": {"contract_amount": "float | null", "contract_date": "string (YYYY-MM-DD) | null", "notes": "string | null"},
-            "body_required": [],
-            "body_optional": ["contract_amount", "contract_date", "notes"],
-            "status_codes": [
-                {"code": 200, "message": "contract_updated", "body": {"message": "contract_updated", "data": {"contract_id": 1}}, "msg": "계약 정보 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "contract_not_found", "body": {"message": "contract_not_found", "data": None}, "msg": "계약을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.8",
-            "name": "문서 업로드",
-            "method": "POST",
-            "path": "/api/vendor-documents",
-            "request": "VendorDocumentCreateRequest",
-            "response": "VendorDocumentCreateResponse",
-            "auth": True,
-            "description": "문서 업로드 (견적서/계약서)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"thread_id": "integer", "document_type": "string", "document_url": "string", "notes": "string | null"},
-            "body_required": ["thread_id", "document_type", "document_url"],
-            "body_optional": ["notes"],
-            "status_codes": [
-                {"code": 200, "message": "document_created", "body": {"message": "document_created", "data": {"document_id": 1}}, "msg": "문서 업로드 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "thread_not_found", "body": {"message": "thread_not_found", "data": None}, "msg": "쓰레드를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.9",
-            "name": "문서 상태 수정",
-            "method": "PUT",
-            "path": "/api/vendor-documents/{document_id}",
-            "request": "VendorDocumentUpdateRequest",
-            "response": "VendorDocumentUpdateResponse",
-            "auth": True,
-            "description": "문서 상태 수정 (서명 등)",
-            "query_params": None,
-            "path_params": [{"name": "document_id", "type": "Integer", "description": "문서 ID"}],
-            "headers": None,
-            "body": {"status": "string | null", "notes": "string | null"},
-            "body_required": [],
-            "body_optional": ["status", "notes"],
-            "status_codes": [
-                {"code": 200, "message": "document_updated", "body": {"message": "document_updated", "data": {"document_id": 1}}, "msg": "문서 상태 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "document_not_found", "body": {"message": "document_not_found", "data": None}, "msg": "문서를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.10",
-            "name": "결제 일정 생성",
-            "method": "POST",
-            "path": "/api/vendor-payment-schedules",
-            "request": "VendorPaymentScheduleCreateRequest",
-            "response": "VendorPaymentScheduleCreateResponse",
-            "auth": True,
-            "description": "결제 일정 생성",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"thread_id": "integer", "payment_date": "string (YYYY-MM-DD)", "amount": "float", "payment_type": "string", "notes": "string | null"},
-            "body_required": ["thread_id", "payment_date", "amount", "payment_type"],
-            "body_optional": ["notes"],
-            "status_codes": [
-                {"code": 200, "message": "payment_schedule_created", "body": {"message": "payment_schedule_created", "data": {"schedule_id": 1}}, "msg": "결제 일정 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "thread_not_found", "body": {"message": "thread_not_found", "data": None}, "msg": "쓰레드를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.11",
-            "name": "결제 일정 수정",
-            "method": "PUT",
-            "path": "/api/vendor-payment-schedules/{schedule_id}",
-            "request": "VendorPaymentScheduleUpdateRequest",
-            "response": "VendorPaymentScheduleUpdateResponse",
-            "auth": True,
-            "description": "결제 일정 수정",
-            "query_params": None,
-            "path_params": [{"name": "schedule_id", "type": "Integer", "description": "결제 일정 ID"}],
-            "headers": None,
-            "body": {"payment_date": "string (YYYY-MM-DD) | null", "amount": "float | null", "payment_type": "string | null", "notes": "string | null"},
-            "body_required": [],
-            "body_optional": ["payment_date", "amount", "payment_type", "notes"],
-            "status_codes": [
-                {"code": 200, "message": "payment_schedule_updated", "body": {"message": "payment_schedule_updated", "data": {"schedule_id": 1}}, "msg": "결제 일정 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "schedule_not_found", "body": {"message": "schedule_not_found", "data": None}, "msg": "결제 일정을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.12",
-            "name": "결제 리마인더 조회",
-            "method": "GET",
-            "path": "/api/vendor-payment-reminders",
-            "request": None,
-            "response": "PaymentReminderResponse",
-            "auth": True,
-            "description": "결제 리마인더 조회",
-            "query_params": [{"name": "days", "type": "Integer", "required": False, "default": "7", "description": "N일 이내 결제 예정 조회"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "payment_reminders_retrieved", "body": {"message": "payment_reminders_retrieved", "data": {"reminders": []}}, "msg": "결제 리마인더 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "12.13",
-            "name": "벤더 비교",
-            "method": "POST",
-            "path": "/api/vendors/compare",
-            "request": "VendorCompareRequest",
-            "response": "VendorCompareResponse",
-            "auth": True,
-            "description": "벤더 비교",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {"vendor_ids": "array[integer]"},
-            "body_required": ["vendor_ids"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "vendors_compared", "body": {"message": "vendors_compared", "data": {"comparison": {}}}, "msg": "벤더 비교 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 400, "message": "invalid_request", "body": {"message": "invalid_request", "data": None}, "msg": "유효하지 않은 요청입니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 디지털 초대장 + 축의금 결제 시스템 API 추가
-API_DATA["sections"].append({
-    "id": "13",
-    "name": "디지털 초대장 + 축의금 결제 시스템",
-    "apis": [
-        {
-            "id": "13.1",
-            "name": "디지털 초대장 생성",
-            "method": "POST",
-            "path": "/api/digital-invitations",
-            "request": "DigitalInvitationCreateReq",
-            "response": "DigitalInvitationCreateResponse",
-            "auth": True,
-            "description": "디지털 초대장 생성 (청첩장 디자인과 연결)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "invitation_design_id": "integer",
-                "title": "string",
-                "wedding_date": "string (YYYY-MM-DD)",
-                "wedding_time": "string | null",
-                "wedding_venue": "string",
-                "wedding_address": "string | null",
-                "groom_name": "string",
-                "bride_name": "string",
-                "groom_parents": "string | null",
-                "bride_parents": "string | null",
-                "contact_info": "object | null",
-                "bank_info": "object | null",
-                "theme": "string (ELEGANT|MODERN|RUSTIC|MINIMALIST|LUXURY)",
-                "main_image_url": "string | null",
-                "gallery_image_urls": "array[string] | null",
-                "greeting_message": "string | null",
-                "map_url": "string | null",
-                "parking_info": "string | null",
-                "allow_payment": "boolean (기본값: true)",
-                "allow_rsvp": "boolean (기본값: true)",
-                "allow_guest_message": "boolean (기본값: true)"
-            },
-            "body_required": ["invitation_design_id", "title", "wedding_date", "wedding_venue", "groom_name", "bride_name"],
-            "body_optional": ["wedding_time", "wedding_address", "groom_parents", "bride_parents", "contact_info", "bank_info", "theme", "main_image_url", "gallery_image_urls", "greeting_message", "map_url", "parking_info", "allow_payment", "allow_rsvp", "allow_guest_message"],
-            "status_codes": [
-                {"code": 201, "message": "digital_invitation_created", "body": {"message": "digital_invitation_created", "data": {"id": 1, "invitation_url": "abc123xyz", "design_qr_code_url": "https://..."}}, "msg": "디지털 초대장 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "invitation_design_not_found", "body": {"message": "invitation_design_not_found", "data": None}, "msg": "청첩장 디자인을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.2",
-            "name": "내 디지털 초대장 목록 조회",
-            "method": "GET",
-            "path": "/api/digital-invitations/my",
-            "request": None,
-            "response": "DigitalInvitationListResponse",
-            "auth": True,
-            "description": "사용자/커플의 디지털 초대장 목록 조회",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "digital_invitations_retrieved", "body": {"message": "digital_invitations_retrieved", "data": {"invitations": []}}, "msg": "디지털 초대장 목록 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.3",
-            "name": "디지털 초대장 조회 (공개)",
-            "method": "GET",
-            "path": "/api/digital-invitations/public/{invitation_url}",
-            "request": None,
-            "response": "DigitalInvitationDetailResponse",
-            "auth": False,
-            "description": "공개 디지털 초대장 조회 (하객용, 조회수 자동 증가)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_url", "type": "String", "description": "초대장 고유 URL"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "public_digital_invitation_retrieved", "body": {"message": "public_digital_invitation_retrieved", "data": {"invitation": {}}}, "msg": "디지털 초대장 조회 성공"},
-                {"code": 404, "message": "digital_invitation_not_found", "body": {"message": "digital_invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.4",
-            "name": "디지털 초대장 수정",
-            "method": "PUT",
-            "path": "/api/digital-invitations/{invitation_id}",
-            "request": "DigitalInvitationUpdateReq",
-            "response": "DigitalInvitationUpdateResponse",
-            "auth": True,
-            "description": "디지털 초대장 수정 (소유자만)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": {
-                "title": "string | null",
-                "wedding_date": "string (YYYY-MM-DD) | null",
-                "wedding_time": "string | null",
-                "wedding_venue": "string | null",
-                "wedding_address": "string | null",
-                "groom_name": "string | null",
-                "bride_name": "string | null",
-                "groom_parents": "string | null",
-                "bride_parents": "string | null",
-                "contact_info": "object | null",
-                "bank_info": "object | null",
-                "theme": "string | null",
-                "main_image_url": "string | null",
-                "gallery_image_urls": "array[string] | null",
-                "greeting_message": "string | null",
-                "map_url": "string | null",
-                "parking_info": "string | null",
-                "allow_payment": "boolean | null",
-                "allow_rsvp": "boolean | null",
-                "allow_guest_message": "boolean | null"
-            },
-            "body_required": [],
-            "body_optional": ["title", "wedding_date", "wedding_time", "wedding_venue", "wedding_address", "groom_name", "bride_name", "groom_parents", "bride_parents", "contact_info", "bank_info", "theme", "main_image_url", "gallery_image_urls", "greeting_message", "map_url", "parking_info", "allow_payment", "allow_rsvp", "allow_guest_message"],
-            "status_codes": [
-                {"code": 200, "message": "digital_invitation_updated", "body": {"message": "digital_invitation_updated", "data": {"id": 1}}, "msg": "디지털 초대장 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "digital_invitation_not_found", "body": {"message": "digital_invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.5",
-            "name": "디지털 초대장 삭제",
-            "method": "DELETE",
-            "path": "/api/digital-invitations/{invitation_id}",
-            "request": None,
-            "response": "BaseResponse",
-            "auth": True,
-            "description": "디지털 초대장 삭제 (소유자만)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "digital_invitation_deleted", "body": {"message": "digital_invitation_deleted", "data": None}, "msg": "디지털 초대장 삭제 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "digital_invitation_not_found", "body": {"message": "digital_invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.6",
-            "name": "RSVP 응답 생성 (공개)",
-            "method": "POST",
-            "path": "/api/digital-invitations/{invitation_id}/rsvps",
-            "request": "RSVPCreateReq",
-            "response": "RSVPCreateResponse",
-            "auth": False,
-            "description": "RSVP 응답 생성 (하객용, 공개 접근)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": {
-                "invitation_id": "integer",
-                "guest_name": "string",
-                "guest_phone": "string | null",
-                "guest_email": "string | null",
-                "status": "string (ATTENDING|NOT_ATTENDING|MAYBE|PENDING)",
-                "plus_one": "boolean (기본값: false)",
-                "plus_one_name": "string | null",
-                "dietary_restrictions": "string | null",
-                "special_requests": "string | null"
-            },
-            "body_required": ["invitation_id", "guest_name", "status"],
-            "body_optional": ["guest_phone", "guest_email", "plus_one", "plus_one_name", "dietary_restrictions", "special_requests"],
-            "status_codes": [
-                {"code": 201, "message": "rsvp_created", "body": {"message": "rsvp_created", "data": {"id": 1}}, "msg": "RSVP 응답 생성 성공"},
-                {"code": 404, "message": "digital_invitation_not_found", "body": {"message": "digital_invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.7",
-            "name": "RSVP 목록 조회",
-            "method": "GET",
-            "path": "/api/digital-invitations/{invitation_id}/rsvps",
-            "request": None,
-            "response": "RSVPListResponse",
-            "auth": True,
-            "description": "RSVP 목록 조회 (초대장 소유자만)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": {
-                "guest_name": "string | null",
-                "status": "string (ATTENDING|NOT_ATTENDING|MAYBE) | null",
-                "attending_guests": "integer | null",
-                "dietary_restrictions": "string | null",
-                "contact_phone": "string | null"
-            },
-            "body_required": [],
-            "body_optional": ["guest_name", "status", "attending_guests", "dietary_restrictions", "contact_phone"],
-            "status_codes": [
-                {"code": 200, "message": "rsvp_updated", "body": {"message": "rsvp_updated", "data": {"id": 1}}, "msg": "RSVP 응답 수정 성공"},
-                {"code": 404, "message": "rsvp_not_found", "body": {"message": "rsvp_not_found", "data": None}, "msg": "RSVP를 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.8",
-            "name": "축의금 결제 생성 (공개)",
-            "method": "POST",
-            "path": "/api/digital-invitations/{invitation_id}/payments",
-            "request": "PaymentCreateReq",
-            "response": "PaymentCreateResponse",
-            "auth": False,
-            "description": "축의금 결제 생성 (하객용, 공개 접근, 간편 결제 지원)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": {
-                "invitation_id": "integer",
-                "payer_name": "string",
-                "payer_phone": "string | null",
-                "payer_message": "string | null",
-                "amount": "float",
-                "payment_method": "string (BANK_TRANSFER|KAKAO_PAY|TOSS|CREDIT_CARD)"
-            },
-            "body_required": ["invitation_id", "payer_name", "amount", "payment_method"],
-            "body_optional": ["payer_phone", "payer_message"],
-            "status_codes": [
-                {"code": 200, "message": "payment_created", "body": {"message": "payment_created", "data": {"id": 1, "amount": 50000.0, "payment_method": "KAKAO_PAY", "payment_status": "PENDING"}}, "msg": "축의금 결제 생성 성공"},
-                {"code": 404, "message": "invitation_not_found", "body": {"message": "invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.9",
-            "name": "결제 목록 조회",
-            "method": "GET",
-            "path": "/api/digital-invitations/{invitation_id}/payments",
-            "request": None,
-            "response": "PaymentListResponse",
-            "auth": True,
-            "description": "결제 목록 조회 (초대장 소유자만)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "payments_retrieved", "body": {"message": "payments_retrieved", "data": {"payments": []}}, "msg": "결제 목록 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "invitation_not_found", "body": {"message": "invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.10",
-            "name": "하객 메시지 생성 (공개)",
-            "method": "POST",
-            "path": "/api/digital-invitations/{invitation_id}/guest-messages",
-            "request": "GuestMessageCreateReq",
-            "response": "GuestMessageCreateResponse",
-            "auth": False,
-            "description": "하객 메시지 및 사진 생성 (하객용, 공개 접근)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": {
-                "invitation_id": "integer",
-                "guest_name": "string",
-                "guest_phone": "string | null",
-                "message": "string | null",
-                "image_url": "string | null"
-            },
-            "body_required": ["invitation_id", "guest_name"],
-            "body_optional": ["guest_phone", "message", "image_url"],
-            "status_codes": [
-                {"code": 200, "message": "guest_message_created", "body": {"message": "guest_message_created", "data": {"id": 1, "guest_name": "테스트 하객", "message": "결혼 축하합니다!", "image_url": None}}, "msg": "하객 메시지 생성 성공"},
-                {"code": 404, "message": "invitation_not_found", "body": {"message": "invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.11",
-            "name": "하객 메시지 목록 조회",
-            "method": "GET",
-            "path": "/api/digital-invitations/{invitation_id}/guest-messages",
-            "request": None,
-            "response": "GuestMessageListResponse",
-            "auth": False,
-            "description": "하객 메시지 목록 조회 (공개)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "guest_messages_retrieved", "body": {"message": "guest_messages_retrieved", "data": {"messages": []}}, "msg": "하객 메시지 목록 조회 성공"},
-                {"code": 404, "message": "invitation_not_found", "body": {"message": "invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "13.12",
-            "name": "디지털 초대장 통계 조회",
-            "method": "GET",
-            "path": "/api/digital-invitations/{invitation_id}/statistics",
-            "request": None,
-            "response": "InvitationStatisticsResponse",
-            "auth": True,
-            "description": "디지털 초대장 통계 조회 (소유자용: 조회수, RSVP 현황, 결제 현황, 축하 메시지 수)",
-            "query_params": None,
-            "path_params": [{"name": "invitation_id", "type": "Integer", "description": "초대장 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "invitation_statistics_retrieved", "body": {"message": "invitation_statistics_retrieved", "data": {"view_count": 100, "rsvp_stats": {"total_responses": 50, "attending_guests_total": 60, "not_attending_count": 5, "maybe_count": 3, "no_response_count": 0}, "payment_stats": {"total_payments_count": 30, "total_amount_collected": 5000000}, "guest_message_count": 25}}, "msg": "통계 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "digital_invitation_not_found", "body": {"message": "digital_invitation_not_found", "data": None}, "msg": "초대장을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 청첩장 디자인 서비스 API 추가 (섹션 14)
-API_DATA["sections"].append({
-    "id": "14",
-    "name": "청첩장 디자인 서비스 (Invitation Design)",
-    "apis": [
-        {
-            "id": "14.1",
-            "name": "템플릿 목록 조회",
-            "method": "GET",
-            "path": "/api/invitation-templates",
-            "request": None,
-            "response": "TemplatesResponse",
-            "auth": False,
-            "description": "청첩장 템플릿 목록을 조회합니다. 스타일 필터링 지원.",
-            "query_params": [{"name": "style", "type": "String", "required": False, "default": None, "description": "템플릿 스타일 필터 (CLASSIC, MODERN, VINTAGE, MINIMAL, LUXURY, NATURE, ROMANTIC)"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "templates_retrieved", "body": {"message": "templates_retrieved", "data": {"templates": []}}, "msg": "템플릿 목록 조회 성공"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.2",
-            "name": "템플릿 상세 조회",
-            "method": "GET",
-            "path": "/api/invitation-templates/{template_id}",
-            "request": None,
-            "response": "TemplateResponse",
-            "auth": False,
-            "description": "특정 템플릿의 상세 정보를 조회합니다.",
-            "query_params": None,
-            "path_params": [{"name": "template_id", "type": "Integer", "description": "템플릿 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "template_retrieved", "body": {"message": "template_retrieved", "data": {"id": 1, "name": "템플릿명", "style": "CLASSIC", "preview_image_url": "https://...", "template_data": {}}}, "msg": "템플릿 조회 성공"},
-                {"code": 404, "message": "template_not_found", "body": {"message": "template_not_found", "data": None}, "msg": "템플릿을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.3",
-            "name": "디자인 생성",
-            "method": "POST",
-            "path": "/api/invitation-designs",
-            "request": "InvitationDesignCreateReq",
-            "response": "DesignCreateResponse",
-            "auth": True,
-            "description": "새로운 청첩장 디자인을 생성합니다. 템플릿 선택 및 QR 코드 생성 지원.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "template_id": "integer | null",
-                "design_data": "object",
-                "qr_code_data": "object | null"
-            },
-            "body_required": ["design_data"],
-            "body_optional": ["template_id", "qr_code_data"],
-            "status_codes": [
-                {"code": 201, "message": "design_created", "body": {"message": "design_created", "data": {"id": 1, "template_id": 1, "design_data": {}, "qr_code_url": "https://...", "status": "DRAFT"}}, "msg": "디자인 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "template_not_found", "body": {"message": "template_not_found", "data": None}, "msg": "템플릿을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.4",
-            "name": "디자인 목록 조회",
-            "method": "GET",
-            "path": "/api/invitation-designs",
-            "request": None,
-            "response": "DesignsResponse",
-            "auth": True,
-            "description": "현재 사용자 또는 커플이 생성한 디자인 목록을 조회합니다.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "designs_retrieved", "body": {"message": "designs_retrieved", "data": {"designs": []}}, "msg": "디자인 목록 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.5",
-            "name": "디자인 상세 조회",
-            "method": "GET",
-            "path": "/api/invitation-designs/{design_id}",
-            "request": None,
-            "response": "DesignResponse",
-            "auth": True,
-            "description": "특정 디자인의 상세 정보를 조회합니다. 본인 또는 파트너의 디자인만 조회 가능.",
-            "query_params": None,
-            "path_params": [{"name": "design_id", "type": "Integer", "description": "디자인 ID"}],
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "design_retrieved", "body": {"message": "design_retrieved", "data": {"id": 1, "template_id": 1, "design_data": {}, "qr_code_url": "https://...", "qr_code_data": {}, "preview_image_url": "https://...", "pdf_url": "https://...", "status": "DRAFT"}}, "msg": "디자인 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "design_not_found", "body": {"message": "design_not_found", "data": None}, "msg": "디자인을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.6",
-            "name": "디자인 수정",
-            "method": "PUT",
-            "path": "/api/invitation-designs/{design_id}",
-            "request": "InvitationDesignUpdateReq",
-            "response": "DesignUpdateResponse",
-            "auth": True,
-            "description": "생성된 디자인의 정보를 수정합니다. 디자인 데이터, QR 코드, 상태 변경 지원.",
-            "query_params": None,
-            "path_params": [{"name": "design_id", "type": "Integer", "description": "디자인 ID"}],
-            "headers": None,
-            "body": {
-                "design_data": "object | null",
-                "qr_code_data": "object | null",
-                "status": "string | null (DRAFT, COMPLETED)"
-            },
-            "body_required": [],
-            "body_optional": ["design_data", "qr_code_data", "status"],
-            "status_codes": [
-                {"code": 200, "message": "design_updated", "body": {"message": "design_updated", "data": {"id": 1, "design_data": {}, "qr_code_url": "https://...", "status": "COMPLETED"}}, "msg": "디자인 수정 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 403, "message": "forbidden", "body": {"message": "forbidden", "data": None}, "msg": "권한 없음"},
-                {"code": 404, "message": "design_not_found", "body": {"message": "design_not_found", "data": None}, "msg": "디자인을 찾을 수 없습니다"},
-                {"code": 400, "message": "invalid_status", "body": {"message": "invalid_status", "data": None}, "msg": "유효하지 않은 상태입니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.7",
-            "name": "AI 문구 추천",
-            "method": "POST",
-            "path": "/api/invitation-text-recommend",
-            "request": "InvitationTextRecommendReq",
-            "response": "TextRecommendResponse",
-            "auth": False,
-            "description": "AI를 활용하여 청첩장 문구를 추천합니다. 신랑/신부 이름, 예식 정보, 스타일을 기반으로 맞춤 문구 생성.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "groom_name": "string",
-                "bride_name": "string",
-                "wedding_date": "string (YYYY-MM-DD)",
-                "wedding_time": "string | null (HH:MM)",
-                "wedding_location": "string | null",
-                "style": "string | null (CLASSIC, MODERN, VINTAGE 등)",
-                "additional_info": "string | null"
-            },
-            "body_required": ["groom_name", "bride_name", "wedding_date"],
-            "body_optional": ["wedding_time", "wedding_location", "style", "additional_info"],
-            "status_codes": [
-                {"code": 200, "message": "text_recommended", "body": {"message": "text_recommended", "data": {"recommended_text": "추천 문구..."}}, "msg": "문구 추천 성공"},
-                {"code": 400, "message": "invalid_request", "body": {"message": "invalid_request", "data": None}, "msg": "잘못된 요청"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.8",
-            "name": "QR 코드 생성",
-            "method": "POST",
-            "path": "/api/invitation-qr-code",
-            "request": "InvitationQRCodeGenerateReq",
-            "response": "QRCodeGenerateResponse",
-            "auth": False,
-            "description": "디지털 초대장, 축의금 결제, RSVP 링크를 포함한 QR 코드를 생성합니다.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "digital_invitation_url": "string | null",
-                "payment_url": "string | null",
-                "rsvp_url": "string | null"
-            },
-            "body_required": [],
-            "body_optional": ["digital_invitation_url", "payment_url", "rsvp_url"],
-            "status_codes": [
-                {"code": 200, "message": "qr_code_generated", "body": {"message": "qr_code_generated", "data": {"qr_code_url": "https://...", "qr_code_data": {}}}, "msg": "QR 코드 생성 성공"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.9",
-            "name": "PDF 생성 및 다운로드",
-            "method": "POST",
-            "path": "/api/invitation-pdf",
-            "request": "InvitationPDFGenerateReq",
-            "response": "PDFStreamResponse",
-            "auth": True,
-            "description": "디자인을 기반으로 청첩장 PDF를 생성하고 다운로드합니다. QR 코드 포함, 용지 크기 및 DPI 설정 지원.",
-            "query_params": None,
-            "path_params": None,
-            "headers": {"Content-Type": "application/pdf"},
-            "body": {
-                "design_id": "integer",
-                "paper_size": "string (기본값: A5)",
-                "dpi": "integer (기본값: 300)"
-            },
-            "body_required": ["design_id"],
-            "body_optional": ["paper_size", "dpi"],
-            "status_codes": [
-                {"code": 200, "message": "pdf_generated", "body": "PDF 파일 스트림", "msg": "PDF 생성 및 다운로드 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "design_not_found", "body": {"message": "design_not_found", "data": None}, "msg": "디자인을 찾을 수 없습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.10",
-            "name": "주문 생성",
-            "method": "POST",
-            "path": "/api/invitation-orders",
-            "request": "InvitationOrderCreateReq",
-            "response": "OrderCreateResponse",
-            "auth": True,
-            "description": "완성된 디자인을 기반으로 실물 청첩장 주문을 생성합니다. 수량, 용지 타입, 배송 정보 입력.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "design_id": "integer",
-                "quantity": "integer",
-                "paper_type": "string | null",
-                "paper_size": "string (기본값: A5)",
-                "shipping_address": "string",
-                "shipping_phone": "string",
-                "shipping_name": "string"
-            },
-            "body_required": ["design_id", "quantity", "shipping_address", "shipping_phone", "shipping_name"],
-            "body_optional": ["paper_type", "paper_size"],
-            "status_codes": [
-                {"code": 201, "message": "order_created", "body": {"message": "order_created", "data": {"id": 1, "design_id": 1, "quantity": 100, "order_status": "PENDING"}}, "msg": "주문 생성 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 404, "message": "design_not_found", "body": {"message": "design_not_found", "data": None}, "msg": "디자인을 찾을 수 없습니다"},
-                {"code": 400, "message": "design_not_completed", "body": {"message": "design_not_completed", "data": None}, "msg": "디자인이 완성되지 않았습니다"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "14.11",
-            "name": "주문 목록 조회",
-            "method": "GET",
-            "path": "/api/invitation-orders",
-            "request": None,
-            "response": "OrdersResponse",
-            "auth": True,
-            "description": "현재 사용자의 청첩장 주문 목록을 조회합니다.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "orders_retrieved", "body": {"message": "orders_retrieved", "data": {"orders": []}}, "msg": "주문 목록 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# 커플 API 추가
-API_DATA["sections"].append({
-    "id": "11",
-    "name": "커플 (Couple)",
-    "apis": [
-        {
-            "id": "11.1",
-            "name": "자신의 커플 키 조회",
-            "method": "GET",
-            "path": "/api/couple/my-key",
-            "request": None,
-            "response": "CoupleKeyResponse",
-            "auth": True,
-            "description": "자신의 커플 키를 조회합니다. 파트너와 연결하기 위해 사용됩니다.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "couple_key_retrieved", "body": {"message": "couple_key_retrieved", "data": {"couple_key": "ABC123", "gender": "BRIDE", "is_connected": False}}, "msg": "커플 키 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "11.2",
-            "name": "커플 연결",
-            "method": "POST",
-            "path": "/api/couple/connect",
-            "request": "CoupleConnectReq",
-            "response": "CoupleConnectResponse",
-            "auth": True,
-            "description": "파트너의 커플 키를 입력하여 커플을 연결합니다. 양방향 매칭이 지원됩니다.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": {
-                "partner_couple_key": "string"
-            },
-            "body_required": ["partner_couple_key"],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "couple_connected", "body": {"message": "couple_connected", "data": {"couple_id": 1, "partner_id": 2, "partner_nickname": "파트너"}}, "msg": "커플 연결 성공"},
-                {"code": 400, "message": "invalid_couple_key", "body": {"message": "invalid_couple_key", "data": None}, "msg": "유효하지 않은 커플 키입니다"},
-                {"code": 400, "message": "cannot_connect_to_self", "body": {"message": "cannot_connect_to_self", "data": None}, "msg": "자기 자신과는 연결할 수 없습니다"},
-                {"code": 409, "message": "already_connected", "body": {"message": "already_connected", "data": None}, "msg": "이미 연결된 커플입니다"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "11.3",
-            "name": "커플 정보 조회",
-            "method": "GET",
-            "path": "/api/couple/info",
-            "request": None,
-            "response": "CoupleInfoResponse",
-            "auth": True,
-            "description": "현재 사용자의 커플 연결 상태 및 정보를 조회합니다.",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "couple_info_retrieved", "body": {"message": "couple_info_retrieved", "data": {"is_connected": True, "couple_id": 1, "partner_id": 2, "partner_nickname": "파트너"}}, "msg": "커플 정보 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
-
-# Vector DB API 추가
-API_DATA["sections"].append({
-    "id": "10",
-    "name": "Vector DB",
-    "apis": [
-        {
-            "id": "10.1",
-            "name": "게시글 벡터 검색",
-            "method": "GET",
-            "path": "/api/vector/posts/search",
-            "request": None,
-            "response": "VectorSearchResponse",
-            "auth": True,
-            "description": "게시글 벡터 검색 (Vector DB 기반)",
-            "query_params": [
-                {"name": "query", "type": "String", "required": True, "default": None, "description": "검색 쿼리"},
-                {"name": "k", "type": "Integer", "required": False, "default": "5", "description": "반환할 결과 개수 (1-20)"},
-                {"name": "board_type", "type": "String", "required": False, "default": None, "description": "게시판 타입 필터"}
-            ],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "posts_searched", "body": {"message": "posts_searched", "data": {"query": "...", "results": [], "total": 0}}, "msg": "검색 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "10.2",
-            "name": "게시글 벡터 통계",
-            "method": "GET",
-            "path": "/api/vector/posts/stats",
-            "request": None,
-            "response": "VectorStatsResponse",
-            "auth": False,
-            "description": "게시판 Vector DB 통계",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "vector_stats_retrieved", "body": {"message": "vector_stats_retrieved", "data": {"total_documents": 100, "collection_name": "posts"}}, "msg": "벡터 통계 조회 성공"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "10.3",
-            "name": "게시글 일괄 벡터화",
-            "method": "POST",
-            "path": "/api/vector/posts/batch-vectorize",
-            "request": None,
-            "response": "BatchVectorizeResponse",
-            "auth": True,
-            "description": "기존 게시글들을 일괄 벡터화 (관리자용)",
-            "query_params": [{"name": "limit", "type": "Integer", "required": False, "default": "100", "description": "처리할 최대 게시글 수 (1-1000)"}],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "posts_vectorized", "body": {"message": "posts_vectorized", "data": {"vectorized_count": 50, "limit": 100}}, "msg": "일괄 벡터화 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "10.4",
-            "name": "사용자 메모리 검색",
-            "method": "GET",
-            "path": "/api/vector/user/memory",
-            "request": None,
-            "response": "UserMemorySearchResponse",
-            "auth": True,
-            "description": "사용자 메모리 검색",
-            "query_params": [
-                {"name": "query", "type": "String", "required": True, "default": None, "description": "검색 쿼리"},
-                {"name": "k", "type": "Integer", "required": False, "default": "5", "description": "반환할 결과 개수 (1-20)"},
-                {"name": "preference_type", "type": "String", "required": False, "default": None, "description": "선호도 타입 필터"}
-            ],
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "user_memory_retrieved", "body": {"message": "user_memory_retrieved", "data": {"query": "...", "results": [], "total": 0}}, "msg": "메모리 검색 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "10.5",
-            "name": "사용자 프로필 요약",
-            "method": "GET",
-            "path": "/api/vector/user/profile",
-            "request": None,
-            "response": "UserProfileSummaryResponse",
-            "auth": True,
-            "description": "사용자 프로필 요약 (예산 스타일, 선호 컨셉, 일정 패턴 등)",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "user_profile_retrieved", "body": {"message": "user_profile_retrieved", "data": {"profile": {}, "stats": {}}}, "msg": "프로필 요약 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        },
-        {
-            "id": "10.6",
-            "name": "사용자 메모리 통계",
-            "method": "GET",
-            "path": "/api/vector/user/stats",
-            "request": None,
-            "response": "UserMemoryStatsResponse",
-            "auth": True,
-            "description": "사용자 메모리 통계",
-            "query_params": None,
-            "path_params": None,
-            "headers": None,
-            "body": None,
-            "body_required": [],
-            "body_optional": [],
-            "status_codes": [
-                {"code": 200, "message": "user_memory_stats_retrieved", "body": {"message": "user_memory_stats_retrieved", "data": {"stats": {}}}, "msg": "메모리 통계 조회 성공"},
-                {"code": 401, "message": "unauthorized", "body": {"message": "unauthorized", "data": None}, "msg": "인증 필요"},
-                {"code": 500, "message": "internal_server_error", "body": {"message": "internal_server_error", "data": None}, "msg": "서버 오류"}
-            ]
-        }
-    ]
-})
+
+def __getattr__(name):
+    """API_DATA는 처음 참조할 때 api_data.json에서 읽는다 (렌더러 함수만 쓰는 도구는 읽지 않음)"""
+    if name == 'API_DATA':
+        api_data = globals()['API_DATA'] = load_api_data()
+        return api_data
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def escape_html(text):
     """HTML 특수문자 이스케이프"""
@@ -2530,28 +38,626 @@ def escape_html(text):
         return ""
     return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
 
+# 들여쓰기 문자열 캐시 (_indent(n) == "  " * n)
+_INDENTS = ["  " * level for level in range(16)]
+
+def _indent(level):
+    while level >= len(_INDENTS):
+        _INDENTS.append("  " * len(_INDENTS))
+    return _INDENTS[level]
+
+# 이스케이프된 JSON 키 캐시 - 응답 예시의 키는 "message", "data" 처럼 같은 키가 반복된다
+_ESCAPED_KEYS = {}
+_ESCAPED_KEYS_MAX = 4096
+
+def _write_json_html(obj, indent, out):
+    """json_to_html 결과를 out(list)에 조각으로 추가
+
+    재귀 대신 명시적 스택을 써서 깊게 중첩된 예시도 재귀 한도에 걸리지 않는다.
+    지금 쓰는 컨테이너의 상태는 지역 변수에 두고, 한 단계 들어갈 때만 스택에 쌓는다.
+    """
+    append = out.append
+    keys = _ESCAPED_KEYS
+    stack = []
+    items = None  # 지금 쓰는 컨테이너의 자식 반복자 (최상위 값이면 None)
+    is_dict = False
+    first = False
+    first_prefix = prefix = closing = ""
+    value = obj
+    level = indent
+    while True:
+        if type(value) is str:
+            append('"' + value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+                   .replace('"', "&quot;") + '"')
+        elif isinstance(value, (dict, list)):
+            stack.append((items, is_dict, first_prefix, prefix, closing))
+            is_dict = isinstance(value, dict)
+            items = iter(value.items()) if is_dict else iter(value)
+            first = True
+            first_prefix = _indent(level + 1)
+            prefix = ",\n" + first_prefix
+            closing = "\n" + _indent(level) + ("}" if is_dict else "]")
+            append("{\n" if is_dict else "[\n")
+        elif isinstance(value, str):
+            append('"' + escape_html(value) + '"')
+        elif value is None:
+            append("null")
+        else:
+            append(escape_html(value))
+
+        # 다음에 쓸 값 찾기 (다 쓴 컨테이너는 닫고 바깥 컨테이너로 돌아간다)
+        while items is not None:
+            item = next(items, stack)  # 반복이 끝나면 stack 객체를 끝 표시로 돌려받는다
+            if item is stack:
+                append(closing)
+                items, is_dict, first_prefix, prefix, closing = stack.pop()
+                first = False
+                continue
+            if is_dict:
+                key, value = item
+                escaped = keys.get(key) if type(key) is str else None
+                if escaped is None:
+                    escaped = escape_html(key)
+                    if type(key) is str:
+                        if len(keys) >= _ESCAPED_KEYS_MAX:
+                            keys.clear()
+                        keys[key] = escaped
+                append((first_prefix if first else prefix) + '"' + escaped + '": ')
+            else:
+                value = item
+                append(first_prefix if first else prefix)
+            first = False
+            level = len(stack) + indent
+            break
+        else:
+            return
+
 def json_to_html(obj, indent=0):
     """JSON 객체를 HTML 형식으로 변환"""
-    if isinstance(obj, dict):
-        items = []
-        for key, value in obj.items():
-            items.append(f'"{escape_html(key)}": {json_to_html(value, indent+1)}')
-        return "{\n" + ",\n".join("  " * (indent+1) + item for item in items) + "\n" + "  " * indent + "}"
-    elif isinstance(obj, list):
-        items = [json_to_html(item, indent+1) for item in obj]
-        return "[\n" + ",\n".join("  " * (indent+1) + item for item in items) + "\n" + "  " * indent + "]"
-    elif isinstance(obj, str):
-        return f'"{escape_html(obj)}"'
-    elif obj is None:
-        return "null"
-    else:
-        return escape_html(str(obj))
+    out = []
+    _write_json_html(obj, indent, out)
+    return "".join(out)
 
-def generate_html(api_data):
-    """노션 템플릿 형식에 맞춘 HTML 생성"""
+def render_api_row(api):
+    """API 명세서 테이블의 한 행 렌더링"""
+    method_class = f"method-{api['method'].lower()}"
+    auth_class = "auth-required" if api['auth'] else "auth-optional"
+    auth_text = "필수" if api['auth'] else "선택"
     
+    return f'''
+        <tr>
+          <td><strong>{api['id']} {api['name']}</strong></td>
+          <td><span class="method-badge {method_class}">{api['method']}</span></td>
+          <td><code>{api['path']}</code></td>
+          <td><code>{api['request']}</code></td>
+          <td><code>{api['response']}</code></td>
+          <td><span class="auth-badge {auth_class}">{auth_text}</span></td>
+        </tr>'''
+
+def render_api_traffic(traffic):
+    """access_log_analyzer.py로 집계한 API 하나의 실측 트래픽 표 렌더링"""
+    latency = traffic.get('latency_ms', {})
+    statuses = ' · '.join(f"{code}: {count}" for code, count in traffic.get('status_codes', {}).items())
+    def ms(value):
+        return '-' if value is None else f"{value}ms"
+    return f'''
+      <h5 style="margin-top: 24px; color: var(--text);">실측 트래픽</h5>
+      <table class="status-code-table">
+        <thead>
+          <tr>
+            <th>요청 수</th>
+            <th>p50</th>
+            <th>p95</th>
+            <th>p99</th>
+            <th>응답 코드 분포</th>
+          </tr>
+        </thead>
+        <tbody>
+          <tr>
+            <td>{traffic.get('requests', 0)}</td>
+            <td>{ms(latency.get('p50'))}</td>
+            <td>{ms(latency.get('p95'))}</td>
+            <td>{ms(latency.get('p99'))}</td>
+            <td>{escape_html(statuses)}</td>
+          </tr>
+        </tbody>
+      </table>'''
+
+# 응답 코드 행 캐시 크기 - 401 unauthorized, 500 internal_server_error 같은 행이 거의 모든 API에 반복된다
+STATUS_ROW_CACHE_SIZE = 1024
+
+class LruCache:
+    """문자열 키 기준 메모리 LRU 캐시 (최근에 쓴 maxsize개만 유지)"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key, render):
+        entries = self.entries
+        value = entries.get(key)
+        if value is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+        value = render()
+        entries[key] = value
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        self.misses += 1
+        return value
+
+    def clear(self):
+        self.entries.clear()
+
+_status_rows = LruCache(STATUS_ROW_CACHE_SIZE)
+
+def render_status_row(status):
+    """응답 코드 표의 한 행 렌더링"""
+    status_class = f"status-{status['code']}"
+    body_json = json.dumps(status.get('body', {}), ensure_ascii=False, indent=2)
+    return f'''
+          <tr>
+            <td><span class="{status_class}">{status['code']}</span></td>
+            <td><div class="code-block" style="margin: 0; padding: 8px; font-size: 12px;">{escape_html(body_json)}</div></td>
+            <td>{status.get('msg', status.get('message', ''))}</td>
+          </tr>'''
+
+def status_row(status):
+    """render_status_row 결과를 내용 기준으로 재사용 -> (행 HTML, 공유 참조 ID)
+
+    같은 내용의 행은 json.dumps와 템플릿을 한 번만 거친다. 참조 ID는 행 HTML의 해시라서
+    어느 프로세스에서 렌더링해도 같다.
+    """
+    def render():
+        row = render_status_row(status)
+        return row, "sr-" + hashlib.sha1(row.encode('utf-8')).hexdigest()[:12]
+    return _status_rows.get_or_render(repr(status), render)
+
+def shared_status_rows(catalog):
+    """공유 참조 모드에서 페이지에 한 번씩만 넣을 응답 코드 행 (참조 ID -> 행 HTML, 처음 나온 순서)
+
+    두 번 이상 나오는 행만 공유한다 (한 번뿐인 행은 참조로 바꾸면 오히려 커진다).
+    """
+    rows = {}
+    counts = {}
+    for endpoint in catalog:
+        for status in endpoint.status_codes:
+            row, ref = status_row(status)
+            rows.setdefault(ref, row)
+            counts[ref] = counts.get(ref, 0) + 1
+    return {ref: row for ref, row in rows.items() if counts[ref] > 1}
+
+def render_api_detail(api, traffic=None, shared=None):
+    """API 하나의 상세 설명 블록 렌더링 (접기/펼치기 구조)
+
+    traffic이 있으면 응답 코드 표 옆에 실측 트래픽 표를 붙인다.
+    shared(참조 ID 집합)에 있는 응답 코드 행은 페이지 끝 <template>을 가리키는 빈 행으로 대신한다.
+    """
     html_parts = []
-    html_parts.append('''<!DOCTYPE html>
+    api_id = f"api-{api['id'].replace('.', '-')}"
+    method_class = f"method-{api['method'].lower()}"
+    html_parts.append(f'''
+        <div class="api-item">
+          <div class="api-item-header" onclick="toggleApi('{api_id}')">
+            <span class="toggle-icon">▶</span>
+            <span class="method-badge {method_class}">{api['method']}</span>
+            <span class="api-name">{api['id']} {api['name']}</span>
+            <span class="auth-badge {'auth-required' if api['auth'] else 'auth-optional'}">{'필수' if api['auth'] else '선택'}</span>
+          </div>
+          <div class="api-item-content" id="{api_id}">
+            <div class="api-detail">''')
+    
+    html_parts.append(f'''
+      <h3 id="api-{api['id'].replace('.', '-')}">{api['id']} {api['name']}</h3>
+      <div class="api-id">API ID: {api['id']}</div>
+      <div class="description">{api.get('description', '')}</div>
+      
+      <h4 style="margin-top: 24px; margin-bottom: 12px; color: var(--accent-2);">📋 요청 구조</h4>''')
+    
+    # Query Parameters
+    if api.get('query_params'):
+        html_parts.append('''
+      <h5 style="margin-top: 16px; color: var(--text);">Query Parameters</h5>
+      <table class="param-table">
+        <thead>
+          <tr>
+            <th>파라미터</th>
+            <th>타입</th>
+            <th>필수</th>
+            <th>기본값</th>
+            <th>설명</th>
+          </tr>
+        </thead>
+        <tbody>''')
+        for param in api['query_params']:
+            required_class = "required" if param.get('required') else "optional"
+            required_text = "필수" if param.get('required') else "선택"
+            html_parts.append(f'''
+          <tr>
+            <td><code>{param['name']}</code></td>
+            <td>{param['type']}</td>
+            <td><span class="{required_class}">{required_text}</span></td>
+            <td>{param.get('default', '-')}</td>
+            <td>{param.get('description', '')}</td>
+          </tr>''')
+        html_parts.append('''
+        </tbody>
+      </table>''')
+    
+    # Path Parameters
+    if api.get('path_params'):
+        html_parts.append('''
+      <h5 style="margin-top: 16px; color: var(--text);">Path Parameters</h5>
+      <table class="param-table">
+        <thead>
+          <tr>
+            <th>파라미터</th>
+            <th>타입</th>
+            <th>설명</th>
+          </tr>
+        </thead>
+        <tbody>''')
+        for param in api['path_params']:
+            html_parts.append(f'''
+          <tr>
+            <td><code>{param['name']}</code></td>
+            <td>{param['type']}</td>
+            <td>{param.get('description', '')}</td>
+          </tr>''')
+        html_parts.append('''
+        </tbody>
+      </table>''')
+    
+    # Request Body
+    if api.get('body'):
+        html_parts.append('''
+      <h5 style="margin-top: 16px; color: var(--text);">Request Body</h5>
+      <div class="code-block">''')
+        _write_json_html(api['body'], 0, html_parts)
+        html_parts.append('''
+      </div>
+      
+      <h6 style="margin-top: 12px; color: var(--text);">필수 필드</h6>
+      <ul style="margin-left: 24px; color: var(--muted);">''')
+        for field in api.get('body_required', []):
+            field_type = api['body'].get(field, 'string')
+            html_parts.append(f'''
+        <li><code>{field}</code>: {field_type} <span class="required">(필수)</span></li>''')
+        html_parts.append('''
+      </ul>''')
+    
+        if api.get('body_optional'):
+            html_parts.append('''
+      <h6 style="margin-top: 12px; color: var(--text);">선택 필드</h6>
+      <ul style="margin-left: 24px; color: var(--muted);">''')
+            for field in api['body_optional']:
+                field_type = api['body'].get(field, 'string')
+                html_parts.append(f'''
+        <li><code>{field}</code>: {field_type} <span class="optional">(선택)</span></li>''')
+            html_parts.append('''
+      </ul>''')
+    
+    # Response Status Codes
+    if api.get('status_codes'):
+        html_parts.append('''
+      <h5 style="margin-top: 24px; color: var(--text);">응답 코드별 예시</h5>
+      <table class="status-code-table">
+        <thead>
+          <tr>
+            <th>Response Status Code</th>
+            <th>Body</th>
+            <th>Message</th>
+          </tr>
+        </thead>
+        <tbody>''')
+        for status in api['status_codes']:
+            row, ref = status_row(status)
+            html_parts.append(f'''
+          <tr data-ref="{ref}"></tr>''' if shared and ref in shared else row)
+        html_parts.append('''
+        </tbody>
+      </table>''')
+    
+    if traffic:
+        html_parts.append(render_api_traffic(traffic))
+    
+    html_parts.append('''
+            </div>
+          </div>
+        </div>''')
+    
+    return ''.join(html_parts)
+
+def iter_section_rows(section, cache=None):
+    """섹션 하나의 API 테이블 행을 ID 순서대로 생성 (section은 api_catalog.Section)"""
+    for endpoint in section.sorted_endpoints:
+        if cache is None:
+            yield render_api_row(endpoint.raw)
+        else:
+            yield cache.get_or_render('row', endpoint.raw, render_api_row)
+
+# 섹션 상세 블록 닫는 태그
+SECTION_DETAIL_END = '''
+      </div>
+    </div>'''
+
+def render_section_header(section, src=None):
+    """섹션 상세 블록의 여는 부분 (src가 있으면 펼칠 때 그 조각 파일을 불러오는 빈 블록)"""
+    section_id = f"section-{section.id}"
+    if src is None:
+        content = f'<div class="section-content" id="{section_id}">'
+    else:
+        content = (f'<div class="section-content" id="{section_id}" data-src="{src}">\n'
+                   f'        <p style="color: var(--muted);">불러오는 중...</p>')
+    return f'''
+    <div class="section-item">
+      <div class="section-header" onclick="toggleSection('{section_id}')">
+        <span class="toggle-icon">▶</span>
+        <h2>{section.id}. {section.name} ({len(section)}개 API)</h2>
+      </div>
+      {content}'''
+
+def iter_section_detail(section, cache=None, traffic=None, shared=None):
+    """섹션 하나의 상세 설명 블록을 조각 단위로 생성 (API는 원본 순서)"""
+    yield render_section_header(section)
+    yield from iter_section_apis(section, cache, traffic, shared)
+    yield SECTION_DETAIL_END
+
+def iter_section_apis(section, cache=None, traffic=None, shared=None):
+    """섹션에 속한 API 상세 블록들을 원본 순서로 생성"""
+    traffic = traffic or {}
+    for endpoint in section.endpoints:
+        stats = traffic.get(endpoint.id)
+        if cache is None:
+            yield render_api_detail(endpoint.raw, stats, shared)
+        else:
+            # 공유 행을 쓰는 API만 캐시 키가 달라진다
+            refs = [ref for _, ref in map(status_row, endpoint.status_codes) if ref in shared] if shared else None
+            yield cache.get_or_render('detail', endpoint.raw,
+                                      partial(render_api_detail, traffic=stats, shared=shared),
+                                      extra={"traffic": stats, "shared": refs} if refs else stats)
+
+def render_section_rows(section, cache=None):
+    """섹션 하나의 API 테이블 행 렌더링"""
+    return ''.join(iter_section_rows(section, cache))
+
+def render_section_detail(section, cache=None, traffic=None, shared=None):
+    """섹션 하나의 상세 설명 블록 렌더링"""
+    return ''.join(iter_section_detail(section, cache, traffic, shared))
+
+def render_section_apis(section, cache=None, traffic=None, shared=None):
+    """섹션에 속한 API 상세 블록들만 렌더링 (분할 출력의 섹션 조각 파일 내용)"""
+    return ''.join(iter_section_apis(section, cache, traffic, shared))
+
+def _code_fingerprint(code, digest):
+    """함수 코드 객체(중첩 코드 포함)를 해시에 반영"""
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_fingerprint(const, digest)
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+def renderer_fingerprint():
+    """렌더링 함수들의 코드 해시 - 템플릿이 바뀌면 캐시가 자동으로 무효화된다"""
+    digest = hashlib.sha256()
+    for func in (escape_html, _write_json_html, json_to_html, render_api_row, render_status_row,
+                 render_api_detail, render_api_traffic):
+        _code_fingerprint(func.__code__, digest)
+    return digest.hexdigest()
+
+class FragmentCache:
+    """렌더링된 HTML 조각을 (종류, dict 내용) 해시 기준으로 디스크에 캐시"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.salt = renderer_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self.used = set()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, kind, obj, extra=None):
+        payload = json.dumps([obj, extra], ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(f"{self.salt}:{kind}:{payload}".encode('utf-8')).hexdigest()
+
+    def get_or_render(self, kind, obj, render, extra=None):
+        """캐시에 있으면 읽고, 없으면 render(obj) 결과를 저장 후 반환
+
+        extra는 obj 외에 렌더링 결과에 영향을 주는 입력 (캐시 키에 함께 반영)
+        """
+        key = self.key(kind, obj, extra)
+        path = os.path.join(self.cache_dir, f"{key}.html")
+        self.used.add(os.path.basename(path))
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                fragment = f.read()
+            self.hits += 1
+            return fragment
+        except FileNotFoundError:
+            pass
+        fragment = render(obj)
+        # 동시에 여러 빌드가 돌아도 깨진 파일이 남지 않도록 임시 파일 후 교체
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(fragment)
+        os.replace(tmp_path, path)
+        self.misses += 1
+        return fragment
+
+    def stats(self):
+        """다른 프로세스의 캐시 사용 내역을 합치기 위한 (적중, 미스, 사용한 조각) 튜플"""
+        return self.hits, self.misses, self.used
+
+    def merge(self, stats):
+        hits, misses, used = stats
+        self.hits += hits
+        self.misses += misses
+        self.used |= used
+
+    def prune(self):
+        """이번 빌드에서 쓰이지 않은 조각 삭제, 삭제한 개수 반환"""
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.html') and name not in self.used:
+                os.remove(os.path.join(self.cache_dir, name))
+                removed += 1
+        return removed
+
+class MemoryFragmentCache(FragmentCache):
+    """FragmentCache와 같은 키로 조각을 메모리에 보관 (--watch 모드처럼 한 프로세스에서 여러 번 빌드할 때)
+
+    프로세스 풀 작업과는 공유되지 않으므로 jobs=1로 렌더링해야 한다.
+    """
+
+    def __init__(self):
+        self.cache_dir = None
+        self.salt = renderer_fingerprint()
+        self.fragments = {}
+        self.reset()
+
+    def reset(self):
+        """빌드 한 번의 통계 초기화 (조각은 유지)"""
+        self.hits = 0
+        self.misses = 0
+        self.used = set()
+
+    def get_or_render(self, kind, obj, render, extra=None):
+        key = self.key(kind, obj, extra)
+        self.used.add(key)
+        fragment = self.fragments.get(key)
+        if fragment is not None:
+            self.hits += 1
+            return fragment
+        fragment = self.fragments[key] = render(obj)
+        self.misses += 1
+        return fragment
+
+    def prune(self):
+        removed = [key for key in self.fragments if key not in self.used]
+        for key in removed:
+            del self.fragments[key]
+        return len(removed)
+
+def _render_section_job(kind, section, cache_dir, traffic, shared):
+    """프로세스 풀 작업: 섹션 하나를 렌더링해 (HTML, 캐시 통계) 반환"""
+    cache = FragmentCache(cache_dir) if cache_dir else None
+    if kind == 'rows':
+        html = render_section_rows(section, cache)
+    elif kind == 'apis':
+        html = render_section_apis(section, cache, traffic, shared)
+    else:
+        html = render_section_detail(section, cache, traffic, shared)
+    return html, (cache.stats() if cache is not None else None)
+
+def _section_chunks(sections, kind, cache, executor, traffic=None, shared=None):
+    """섹션 순서대로 HTML 조각을 내주는 이터레이터 (executor가 있으면 작업을 즉시 제출)
+
+    kind가 'apis'면 섹션마다 정확히 한 조각(섹션의 API 상세 블록 전체)을 낸다.
+    """
+    if executor is None:
+        if kind == 'rows':
+            return (chunk for section in sections for chunk in iter_section_rows(section, cache))
+        if kind == 'apis':
+            return (render_section_apis(section, cache, traffic, shared) for section in sections)
+        return (chunk for section in sections
+                for chunk in iter_section_detail(section, cache, traffic, shared))
+    cache_dir = cache.cache_dir if cache is not None else None
+    section_traffic = (
+        {e.id: traffic[e.id] for e in section.endpoints if e.id in traffic} if traffic else None
+        for section in sections
+    )
+    results = executor.map(_render_section_job, repeat(kind), sections, repeat(cache_dir),
+                           section_traffic, repeat(shared))
+    return _merge_section_results(results, cache)
+
+def _merge_section_results(results, cache):
+    for html, stats in results:
+        if cache is not None:
+            cache.merge(stats)
+        yield html
+
+def iter_html(api_data, cache=None, jobs=1, traffic=None, shared=False, search_src=None):
+    """노션 템플릿 형식에 맞춘 HTML을 조각 단위로 생성 (전체 문자열을 메모리에 만들지 않음)
+
+    cache에 FragmentCache를 넘기면 내용이 바뀌지 않은 API는 캐시된 조각을 재사용한다.
+    jobs가 2 이상이면 섹션별 렌더링을 프로세스 풀에서 병렬로 수행하고, 결과는 정렬된 섹션 순서대로 이어 붙인다.
+    traffic은 API ID -> access_log_analyzer.py 집계 결과 (각 API 상세에 실측 트래픽 표로 표시).
+    shared가 참이면 같은 응답 코드 행을 페이지 끝 <template>에 한 번만 넣고, API를 펼칠 때 복사해 채운다.
+    search_src는 api_search_index.dump_search_script로 만든 검색 인덱스 파일의 페이지 기준 경로 (검색창 표시).
+    api_data는 API_DATA dict 또는 미리 컴파일한 ApiCatalog.
+    """
+    catalog = ApiCatalog.ensure(api_data)
+    sections = catalog.sections
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        # 풀 작업은 여기서 한꺼번에 제출되므로 헤더를 내보내는 동안에도 렌더링이 진행된다
+        row_chunks = _section_chunks(sections, 'rows', cache, executor)
+        shared_rows = shared_status_rows(catalog) if shared else None
+        detail_chunks = _section_chunks(sections, 'detail', cache, executor, traffic,
+                                        frozenset(shared_rows) if shared_rows else None)
+        yield from _iter_page(catalog, row_chunks, detail_chunks, shared_rows, search_src=search_src)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+# 분할 출력에서 섹션 조각 파일을 두는 하위 디렉토리
+SPLIT_SECTION_DIR = 'sections'
+
+# 분할 출력의 검색 인덱스 파일 이름
+SPLIT_SEARCH_INDEX = 'search-index.js'
+
+def write_split(api_data, out_dir, cache=None, jobs=1, traffic=None, shared=False, search=False,
+                fingerprint=False, precompress=False):
+    """목차 페이지(index.html)와 섹션별 상세 조각(sections/section-<ID>.html)으로 나눠 기록
+
+    목차 페이지에는 API 테이블과 섹션 머리글만 들어가고, 섹션 상세는 toggleSection으로 처음 펼칠 때
+    fetch로 불러온다 (file://로는 불러올 수 없으므로 HTTP 서버로 열어야 한다).
+    search가 참이면 검색 인덱스(search-index.js)도 함께 만든다.
+    fingerprint/precompress는 static_artifacts.ArtifactWriter 옵션 (둘 중 하나라도 켜면 manifest.json 기록).
+    목차 페이지가 조각의 실제 파일 이름을 알아야 하므로 조각을 먼저 쓴다.
+    이번에 쓰지 않은 예전 섹션 조각은 지운다. 기록한 파일 경로 목록 반환 (목차 페이지가 처음).
+    """
+    catalog = ApiCatalog.ensure(api_data)
+    sections = catalog.sections
+    writer = ArtifactWriter(out_dir, fingerprint=fingerprint, precompress=precompress)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        row_chunks = _section_chunks(sections, 'rows', cache, executor)
+        shared_rows = shared_status_rows(catalog) if shared else None
+        api_chunks = _section_chunks(sections, 'apis', cache, executor, traffic,
+                                     frozenset(shared_rows) if shared_rows else None)
+        srcs = [writer.write(f"{SPLIT_SECTION_DIR}/section-{section.id}.html", html)
+                for section, html in zip(sections, api_chunks, strict=True)]
+        search_src = None
+        if search:
+            search_src = writer.write(SPLIT_SEARCH_INDEX, dump_search_script(build_search_index(catalog)))
+        stubs = (render_section_header(section, src) + SECTION_DETAIL_END
+                 for section, src in zip(sections, srcs, strict=True))
+        index = writer.write('index.html', _iter_page(catalog, row_chunks, stubs, shared_rows, lazy_sections=True,
+                                                      search_src=search_src), fingerprint=False)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    writer.prune(SPLIT_SECTION_DIR, 'section-')
+    writer.prune('', os.path.splitext(SPLIT_SEARCH_INDEX)[0] + '.')
+    if fingerprint or precompress:
+        writer.write_manifest()
+    else:
+        writer.remove_manifest()
+    return [os.path.join(out_dir, index)] + [os.path.join(out_dir, entry["file"])
+                                             for name, entry in writer.entries.items() if name != 'index.html']
+
+def _iter_page(catalog, row_chunks, detail_chunks, shared_rows=None, lazy_sections=False, search_src=None):
+    """페이지 골격 사이에 섹션별 테이블 행/상세 블록 조각을 끼워 넣어 생성
+
+    lazy_sections가 참이면 섹션을 처음 펼칠 때 data-src 조각을 불러오는 스크립트를 붙인다.
+    search_src가 있으면 머리글 아래에 검색창을, 끝에 그 인덱스 파일을 쓰는 검색 스크립트를 붙인다.
+    """
+    yield '''<!DOCTYPE html>
 <html lang="ko">
 <head>
   <meta charset="UTF-8" />
@@ -2849,8 +955,13 @@ def generate_html(api_data):
     <header>
       <h1>Wedding OS API 명세서</h1>
       <p>노션 템플릿 형식에 맞춘 완성도 높은 API 문서</p>
-      <p style="margin-top: 8px; font-size: 14px;">Base URL: <code>''' + api_data['base_url'] + '''</code></p>
-    </header>
+      <p style="margin-top: 8px; font-size: 14px;">Base URL: <code>''' + catalog.base_url + '''</code></p>
+    </header>'''
+    
+    if search_src:
+        yield render_search_box(search_src)
+    
+    yield '''
     
     <div class="api-detail" style="margin-bottom: 48px; background: rgba(34,211,238,0.1); border: 1px solid rgba(34,211,238,0.3);">
       <h2 style="color: var(--accent-2); margin-bottom: 24px;">📋 최근 업데이트 내역</h2>
@@ -3038,195 +1149,23 @@ GET /api/vendors/recommend?wedding_profile_id=1&vendor_type=IPHONE_SNAP&min_pric
           <th>인증</th>
         </tr>
       </thead>
-      <tbody>''')
+      <tbody>'''
     
     # API 테이블 행 생성 (섹션 순서대로 정렬)
-    sections = sorted(api_data['sections'], key=lambda x: int(x['id']) if x['id'].isdigit() else 999)
-    for section in sections:
-        # 각 섹션 내 API도 ID 순서대로 정렬 (숫자로 변환하여 정렬)
-        def api_sort_key(api):
-            try:
-                # "9.1" -> (9, 1), "12.10" -> (12, 10)
-                parts = api['id'].split('.')
-                return (int(parts[0]), int(parts[1]) if len(parts) > 1 else 0)
-            except:
-                return (999, 999)
-        apis = sorted(section['apis'], key=api_sort_key)
-        for api in apis:
-            method_class = f"method-{api['method'].lower()}"
-            auth_class = "auth-required" if api['auth'] else "auth-optional"
-            auth_text = "필수" if api['auth'] else "선택"
-            
-            html_parts.append(f'''
-        <tr>
-          <td><strong>{api['id']} {api['name']}</strong></td>
-          <td><span class="method-badge {method_class}">{api['method']}</span></td>
-          <td><code>{api['path']}</code></td>
-          <td><code>{api['request']}</code></td>
-          <td><code>{api['response']}</code></td>
-          <td><span class="auth-badge {auth_class}">{auth_text}</span></td>
-        </tr>''')
+    yield from row_chunks
     
-    html_parts.append('''
+    yield '''
       </tbody>
-    </table>''')
+    </table>'''
     
     # 각 API 상세 정보 생성 (접기/펼치기 구조)
-    html_parts.append('''
+    yield '''
     <h2 class="section-title">API 상세 설명</h2>
-    <div style="margin-top: 32px;">''')
+    <div style="margin-top: 32px;">'''
     
-    sections = sorted(api_data['sections'], key=lambda x: int(x['id']) if x['id'].isdigit() else 999)
-    for section in sections:
-        section_id = f"section-{section['id']}"
-        html_parts.append(f'''
-    <div class="section-item">
-      <div class="section-header" onclick="toggleSection('{section_id}')">
-        <span class="toggle-icon">▶</span>
-        <h2>{section['id']}. {section['name']} ({len(section['apis'])}개 API)</h2>
-      </div>
-      <div class="section-content" id="{section_id}">''')
-        
-        for api in section['apis']:
-            api_id = f"api-{api['id'].replace('.', '-')}"
-            method_class = f"method-{api['method'].lower()}"
-            html_parts.append(f'''
-        <div class="api-item">
-          <div class="api-item-header" onclick="toggleApi('{api_id}')">
-            <span class="toggle-icon">▶</span>
-            <span class="method-badge {method_class}">{api['method']}</span>
-            <span class="api-name">{api['id']} {api['name']}</span>
-            <span class="auth-badge {'auth-required' if api['auth'] else 'auth-optional'}">{'필수' if api['auth'] else '선택'}</span>
-          </div>
-          <div class="api-item-content" id="{api_id}">
-            <div class="api-detail">''')
-            
-            html_parts.append(f'''
-      <h3 id="api-{api['id'].replace('.', '-')}">{api['id']} {api['name']}</h3>
-      <div class="api-id">API ID: {api['id']}</div>
-      <div class="description">{api.get('description', '')}</div>
-      
-      <h4 style="margin-top: 24px; margin-bottom: 12px; color: var(--accent-2);">📋 요청 구조</h4>''')
-            
-            # Query Parameters
-            if api.get('query_params'):
-                html_parts.append('''
-      <h5 style="margin-top: 16px; color: var(--text);">Query Parameters</h5>
-      <table class="param-table">
-        <thead>
-          <tr>
-            <th>파라미터</th>
-            <th>타입</th>
-            <th>필수</th>
-            <th>기본값</th>
-            <th>설명</th>
-          </tr>
-        </thead>
-        <tbody>''')
-                for param in api['query_params']:
-                    required_class = "required" if param.get('required') else "optional"
-                    required_text = "필수" if param.get('required') else "선택"
-                    html_parts.append(f'''
-          <tr>
-            <td><code>{param['name']}</code></td>
-            <td>{param['type']}</td>
-            <td><span class="{required_class}">{required_text}</span></td>
-            <td>{param.get('default', '-')}</td>
-            <td>{param.get('description', '')}</td>
-          </tr>''')
-                html_parts.append('''
-        </tbody>
-      </table>''')
-            
-            # Path Parameters
-            if api.get('path_params'):
-                html_parts.append('''
-      <h5 style="margin-top: 16px; color: var(--text);">Path Parameters</h5>
-      <table class="param-table">
-        <thead>
-          <tr>
-            <th>파라미터</th>
-            <th>타입</th>
-            <th>설명</th>
-          </tr>
-        </thead>
-        <tbody>''')
-                for param in api['path_params']:
-                    html_parts.append(f'''
-          <tr>
-            <td><code>{param['name']}</code></td>
-            <td>{param['type']}</td>
-            <td>{param.get('description', '')}</td>
-          </tr>''')
-                html_parts.append('''
-        </tbody>
-      </table>''')
-            
-            # Request Body
-            if api.get('body'):
-                html_parts.append('''
-      <h5 style="margin-top: 16px; color: var(--text);">Request Body</h5>
-      <div class="code-block">''')
-                html_parts.append(json_to_html(api['body']))
-                html_parts.append('''
-      </div>
-      
-      <h6 style="margin-top: 12px; color: var(--text);">필수 필드</h6>
-      <ul style="margin-left: 24px; color: var(--muted);">''')
-                for field in api.get('body_required', []):
-                    field_type = api['body'].get(field, 'string')
-                    html_parts.append(f'''
-        <li><code>{field}</code>: {field_type} <span class="required">(필수)</span></li>''')
-                html_parts.append('''
-      </ul>''')
-                
-                if api.get('body_optional'):
-                    html_parts.append('''
-      <h6 style="margin-top: 12px; color: var(--text);">선택 필드</h6>
-      <ul style="margin-left: 24px; color: var(--muted);">''')
-                    for field in api['body_optional']:
-                        field_type = api['body'].get(field, 'string')
-                        html_parts.append(f'''
-        <li><code>{field}</code>: {field_type} <span class="optional">(선택)</span></li>''')
-                    html_parts.append('''
-      </ul>''')
-            
-            # Response Status Codes
-            if api.get('status_codes'):
-                html_parts.append('''
-      <h5 style="margin-top: 24px; color: var(--text);">응답 코드별 예시</h5>
-      <table class="status-code-table">
-        <thead>
-          <tr>
-            <th>Response Status Code</th>
-            <th>Body</th>
-            <th>Message</th>
-          </tr>
-        </thead>
-        <tbody>''')
-                for status in api['status_codes']:
-                    status_class = f"status-{status['code']}"
-                    body_json = json.dumps(status.get('body', {}), ensure_ascii=False, indent=2)
-                    html_parts.append(f'''
-          <tr>
-            <td><span class="{status_class}">{status['code']}</span></td>
-            <td><div class="code-block" style="margin: 0; padding: 8px; font-size: 12px;">{escape_html(body_json)}</div></td>
-            <td>{status.get('msg', status.get('message', ''))}</td>
-          </tr>''')
-                html_parts.append('''
-        </tbody>
-      </table>''')
-            
-            html_parts.append('''
-            </div>
-          </div>
-        </div>''')
-        
-        html_parts.append('''
-      </div>
-    </div>''')
+    yield from detail_chunks
     
-    html_parts.append('''
+    yield '''
     </div>
     
     <script>
@@ -3243,19 +1182,369 @@ GET /api/vendors/recommend?wedding_profile_id=1&vendor_type=IPHONE_SNAP&min_pric
         content.classList.toggle('expanded');
         header.classList.toggle('expanded');
       }
-    </script>
+    </script>'''
+    
+    if shared_rows:
+        yield from _iter_shared_rows(shared_rows)
+    
+    if lazy_sections:
+        yield LAZY_SECTION_SCRIPT
+    
+    if search_src:
+        yield SEARCH_SCRIPT
+    
+    yield '''
   </div>
 </body>
-</html>''')
+</html>'''
+
+# 분할 출력: 섹션을 처음 펼칠 때 조각 파일을 불러와 채운다 (실패하면 다음에 펼칠 때 다시 시도)
+LAZY_SECTION_SCRIPT = '''
+    <script>
+      const toggleSectionWithoutLoading = toggleSection;
+      toggleSection = function (sectionId) {
+        const content = document.getElementById(sectionId);
+        if (content.dataset.src && !content.dataset.state) {
+          content.dataset.state = 'loading';
+          fetch(content.dataset.src)
+            .then(function (response) {
+              if (!response.ok) throw new Error(response.status);
+              return response.text();
+            })
+            .then(function (html) {
+              content.innerHTML = html;
+              content.dataset.state = 'loaded';
+            })
+            .catch(function () {
+              content.innerHTML = '<p style="color: var(--muted);">섹션을 불러오지 못했습니다. 다시 펼쳐 주세요.</p>';
+              delete content.dataset.state;
+            });
+        }
+        toggleSectionWithoutLoading(sectionId);
+      };
+    </script>'''
+
+def render_search_box(src):
+    """검색창 (src는 api_search_index.py로 만든 인덱스 스크립트 경로, 처음 포커스할 때 불러옴)"""
+    return f'''
     
-    return ''.join(html_parts)
+    <div class="api-search" style="margin-bottom: 48px;">
+      <style>
+        .api-search input {{ width: 100%; padding: 14px 16px; border-radius: 12px; border: 1px solid var(--line); background: var(--card); color: var(--text); font: inherit; font-size: 16px; }}
+        .api-search input:focus {{ outline: none; border-color: var(--accent-2); }}
+        .api-search ul {{ list-style: none; margin-top: 8px; }}
+        .api-search li button {{ width: 100%; display: flex; gap: 12px; align-items: center; padding: 10px 12px; border: 0; border-radius: 8px; background: transparent; color: var(--text); font: inherit; text-align: left; cursor: pointer; }}
+        .api-search li button:hover, .api-search li button:focus {{ background: var(--soft); outline: none; }}
+        .api-search li code {{ color: var(--muted); }}
+      </style>
+      <input type="search" id="api-search-input" data-src="{escape_html(src)}" autocomplete="off"
+             placeholder="🔍 API 검색 - 이름, 경로, 파라미터, 응답 메시지 (예: 게시글 상세, post_id, unauthorized)">
+      <ul id="api-search-results"></ul>
+    </div>'''
+
+# 검색 스크립트 - 토큰 규칙은 api_search_index.py와 같아야 한다
+SEARCH_SCRIPT = '''
+    <script>
+      (function () {
+        const WORD_RE = /\\d+(?:\\.\\d+)+|[a-z0-9_]+|[가-힣]+/g;
+        const HANGUL_RE = /^[가-힣]+$/;
+        const MAX_RESULTS = 20;
+        const input = document.getElementById('api-search-input');
+        const list = document.getElementById('api-search-results');
+        let index = null;
+        let loading = false;
+
+        window.apiSearchIndexLoaded = function (data) {
+          index = data;
+          search();
+        };
+
+        input.addEventListener('focus', function () {
+          if (index || loading) return;
+          loading = true;
+          const script = document.createElement('script');
+          script.src = input.dataset.src;
+          script.onerror = function () { loading = false; };
+          document.head.appendChild(script);
+        });
+        input.addEventListener('input', search);
+
+        function lookup(word, exact) {
+          const terms = index.terms;
+          let lo = 0, hi = terms.length;
+          while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (terms[mid] < word) lo = mid + 1; else hi = mid;
+          }
+          const found = new Map();
+          for (let i = lo; i < terms.length && (exact ? terms[i] === word : terms[i].startsWith(word)); i++) {
+            for (const entry of index.postings[i]) {
+              const doc = entry >> 2, weight = entry & 3;
+              if ((found.get(doc) || 0) < weight) found.set(doc, weight);
+            }
+          }
+          return found;
+        }
+
+        function match(word) {
+          if (!HANGUL_RE.test(word)) return lookup(word.replace(/^_+|_+$/g, ''), false);
+          if (word.length === 1) return lookup(word, false);
+          // 한글은 마지막 bigram을 뺀 나머지가 모두 일치하면 일치 ("예산을"처럼 끝에 조사가 붙어도 찾도록),
+          // 마지막 bigram은 일치하면 점수에만 더한다
+          const last = word.length - 2;
+          if (last === 0) return lookup(word, true);
+          let scores = null;
+          for (let i = 0; i < last; i++) {
+            const found = lookup(word.substr(i, 2), true);
+            if (scores === null) {
+              scores = found;
+            } else {
+              const next = new Map();
+              for (const [doc, score] of scores) if (found.has(doc)) next.set(doc, score + found.get(doc));
+              scores = next;
+            }
+            if (!scores.size) return scores;
+          }
+          const tail = lookup(word.substr(last, 2), true);
+          for (const [doc, score] of scores) scores.set(doc, score + (tail.get(doc) || 0));
+          return scores;
+        }
+
+        function search() {
+          list.textContent = '';
+          if (!index) return;
+          const words = input.value.toLowerCase().match(WORD_RE) || [];
+          let scores = null;
+          for (const word of words) {
+            const found = match(word);
+            if (scores === null) {
+              scores = found;
+            } else {
+              const next = new Map();
+              for (const [doc, score] of scores) if (found.has(doc)) next.set(doc, score + found.get(doc));
+              scores = next;
+            }
+            if (!scores.size) break;
+          }
+          if (!scores) return;
+          const ranked = Array.from(scores).sort(function (a, b) { return b[1] - a[1] || a[0] - b[0]; });
+          for (const [doc] of ranked.slice(0, MAX_RESULTS)) list.appendChild(renderResult(index.docs[doc]));
+        }
+
+        function renderResult(doc) {
+          const [id, name, method, path, sectionId] = doc;
+          const button = document.createElement('button');
+          const badge = document.createElement('span');
+          badge.className = 'method-badge method-' + method.toLowerCase();
+          badge.textContent = method;
+          const title = document.createElement('span');
+          title.textContent = id + ' ' + name;
+          const code = document.createElement('code');
+          code.textContent = path;
+          button.append(badge, title, code);
+          button.addEventListener('click', function () {
+            openApi('section-' + sectionId, 'api-' + id.replace(/\\./g, '-'));
+          });
+          const item = document.createElement('li');
+          item.appendChild(button);
+          return item;
+        }
+
+        // 섹션과 API를 펼치고 스크롤 (분할 출력이면 섹션 조각이 불러와질 때까지 기다림)
+        function openApi(sectionId, apiId) {
+          const section = document.getElementById(sectionId);
+          if (!section.classList.contains('expanded')) toggleSection(sectionId);
+          (function reveal(attempts) {
+            const content = document.getElementById(apiId);
+            if (!content) {
+              if (attempts > 0) setTimeout(reveal, 50, attempts - 1);
+              return;
+            }
+            if (!content.classList.contains('expanded')) toggleApi(apiId);
+            content.parentElement.scrollIntoView({ behavior: 'smooth', block: 'start' });
+          })(100);
+        }
+      })();
+    </script>'''
+
+def _iter_shared_rows(shared_rows):
+    """공유 응답 코드 행 <template>과, API를 처음 펼칠 때 빈 행을 채우는 스크립트"""
+    for ref, row in shared_rows.items():
+        yield f'''
+    <template id="{ref}">{row}
+    </template>'''
+    yield '''
+    <script>
+      const toggleApiWithoutSharedRows = toggleApi;
+      toggleApi = function (apiId) {
+        document.getElementById(apiId).querySelectorAll('tr[data-ref]').forEach(function (row) {
+          row.replaceWith(document.getElementById(row.dataset.ref).content.cloneNode(true));
+        });
+        toggleApiWithoutSharedRows(apiId);
+      };
+    </script>'''
+
+def generate_html(api_data, cache=None, jobs=1, traffic=None, shared=False, search_src=None):
+    """노션 템플릿 형식에 맞춘 HTML 생성"""
+    return ''.join(iter_html(api_data, cache=cache, jobs=jobs, traffic=traffic, shared=shared,
+                             search_src=search_src))
+
+def write_html(api_data, fp, cache=None, jobs=1, traffic=None, shared=False, search_src=None):
+    """HTML 조각을 파일 객체(파일, 소켓 등)에 바로 기록, 기록한 문자 수 반환
+
+    텍스트 스트림이 아니면 UTF-8로 인코딩해서 쓴다.
+    """
+    binary = not isinstance(fp, io.TextIOBase)
+    written = 0
+    for fragment in iter_html(api_data, cache=cache, jobs=jobs, traffic=traffic, shared=shared,
+                              search_src=search_src):
+        fp.write(fragment.encode('utf-8') if binary else fragment)
+        written += len(fragment)
+    return written
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Wedding OS API 명세서 HTML 생성")
+    parser.add_argument('--data', default=API_DATA_PATH,
+                        help="API 정의 JSON 파일 (기본값: api_data.json)")
+    parser.add_argument('-o', '--output', default='api_reference_details.html',
+                        help="출력 HTML 파일 경로 (기본값: api_reference_details.html)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="변경된 섹션/API만 다시 렌더링 (캐시된 HTML 조각 재사용)")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="섹션 렌더링 프로세스 수 (0이면 CPU 코어 수, 기본값: 1)")
+    parser.add_argument('--traffic', metavar='JSON',
+                        help="access_log_analyzer.py 결과 파일 - 각 API에 실측 지연시간/응답 코드 분포 표시")
+    parser.add_argument('--split', metavar='DIR',
+                        help="목차 페이지 + 섹션별 조각 파일로 나눠 DIR에 생성 (섹션을 펼칠 때 불러옴, HTTP 서버 필요)")
+    parser.add_argument('--search', action='store_true',
+                        help="검색창과 미리 만든 검색 인덱스 파일(<출력 이름>.search.js) 생성")
+    parser.add_argument('--fingerprint', action='store_true',
+                        help="검색 인덱스/섹션 조각 파일 이름에 내용 해시를 붙이고 manifest 기록 (장기 캐시용)")
+    parser.add_argument('--precompress', action='store_true',
+                        help="nginx gzip_static/brotli_static용 .gz/.br 사본 생성 (brotli 패키지가 있으면 .br도)")
+    parser.add_argument('--shared-status-rows', action='store_true',
+                        help="반복되는 응답 코드 행을 한 번만 넣고 참조로 채움 (출력 크기 축소, JavaScript 필요)")
+    parser.add_argument('--watch', action='store_true',
+                        help="카탈로그가 바뀔 때마다 바뀐 API만 다시 렌더링하고 미리보기 브라우저 새로고침")
+    parser.add_argument('--port', type=int, default=8000,
+                        help="--watch 미리보기 서버 포트 (0이면 서버 없이 다시 생성만, 기본값: 8000)")
+    parser.add_argument('--cache-dir', default='.api_docs_cache',
+                        help="증분 빌드용 조각 캐시 디렉토리 (기본값: .api_docs_cache)")
+    return parser.parse_args(argv)
+
+def build(catalog, args, cache=None, jobs=1, traffic=None, verbose=True):
+    """parse_args 결과대로 명세서 파일 생성, 진입 페이지 경로 반환"""
+    if args.split:
+        paths = write_split(catalog, args.split, cache=cache, jobs=jobs, traffic=traffic,
+                            shared=args.shared_status_rows, search=args.search,
+                            fingerprint=args.fingerprint, precompress=args.precompress)
+        return paths[0]
+    # 출력 파일 옆에 검색 인덱스/압축 사본/manifest를 둔다 (페이지 자체는 이름을 바꾸지 않음)
+    stem = os.path.splitext(os.path.basename(args.output))[0]
+    writer = ArtifactWriter(os.path.dirname(args.output) or '.', fingerprint=args.fingerprint,
+                            precompress=args.precompress)
+    search_src = None
+    if args.search:
+        search_src = writer.write(f"{stem}.search.js", dump_search_script(build_search_index(catalog)))
+        if verbose:
+            print(f"검색 인덱스 생성: {search_src} ({writer.entries[f'{stem}.search.js']['bytes']:,} bytes)")
+    writer.write(os.path.basename(args.output),
+                 iter_html(catalog, cache=cache, jobs=jobs, traffic=traffic, shared=args.shared_status_rows,
+                           search_src=search_src), fingerprint=False)
+    writer.prune('', f"{stem}.search.")
+    if args.fingerprint or args.precompress:
+        manifest = writer.write_manifest(f'{stem}.manifest.json')
+        if verbose:
+            print(f"manifest 기록: {manifest}")
+    else:
+        writer.remove_manifest(f"{stem}.manifest.json")
+    return args.output
+
+def load_traffic(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['endpoints']
+
+def changed_endpoints(old, new):
+    """두 카탈로그 사이에 추가/삭제/수정된 API ID 목록 (ID 순서)"""
+    before = {endpoint.id: endpoint.raw for endpoint in old}
+    after = {endpoint.id: endpoint.raw for endpoint in new}
+    changed = {api_id for api_id in before.keys() | after.keys() if before.get(api_id) != after.get(api_id)}
+    return sorted(changed, key=lambda api_id: api_sort_key({'id': api_id}))
+
+# --watch 모드에서 바뀌면 프로세스를 다시 시작하는 렌더러 코드 파일
+RENDERER_SOURCES = ('generate_api_docs.py', 'api_catalog.py', 'api_search_index.py', 'static_artifacts.py')
+
+def watch(catalog, args, traffic=None):
+    """카탈로그 원본(과 --traffic 파일)이 바뀔 때마다 다시 생성하고 미리보기 서버로 브라우저를 새로고침
+
+    컴파일한 카탈로그와 렌더링한 조각을 메모리에 두므로 바뀐 API만 다시 렌더링한다.
+    렌더러 코드(이 파일과 카탈로그/검색/산출물 모듈)가 바뀌면 같은 인자로 프로세스를 다시 시작한다.
+    """
+    import docs_watch
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = [os.path.join(here, name) for name in RENDERER_SOURCES]
+    cache = MemoryFragmentCache()
+    entry = build(catalog, args, cache=cache, traffic=traffic, verbose=False)
+    server = None
+    if args.port:
+        root = args.split or os.path.dirname(os.path.abspath(args.output))
+        server = docs_watch.LiveReloadServer(root, port=args.port).start()
+        page = '' if args.split else os.path.basename(args.output)
+        print(f"미리보기: {server.url}{page}")
+    watched = [args.data] + ([args.traffic] if args.traffic else [])
+    backend = "watchfiles" if docs_watch.watchfiles is not None else f"{docs_watch.POLL_INTERVAL}초 간격 폴링"
+    print(f"👀 변경 감시 중 ({backend}): {', '.join(watched)} - Ctrl+C로 종료")
+    for changed in docs_watch.iter_changes(watched + code):
+        if not changed.isdisjoint(code):
+            print("♻️ 렌더러 코드 변경 - 다시 시작합니다")
+            docs_watch.restart()
+        started = time.perf_counter()
+        try:
+            new_catalog = ApiCatalog(load_api_data(args.data)) if args.data in changed else catalog
+            if args.traffic in changed:
+                traffic = load_traffic(args.traffic)
+        except Exception as exc:  # 편집 중인 파일의 오류로 감시를 멈추지 않는다
+            print(f"⚠️ 카탈로그를 읽지 못했습니다 (이전 결과 유지): {type(exc).__name__}: {exc}")
+            continue
+        apis = changed_endpoints(catalog, new_catalog)
+        if (not apis and args.traffic not in changed
+                and [(sec.id, sec.name) for sec in new_catalog.sections] == [(sec.id, sec.name) for sec in catalog.sections]):
+            continue  # 공백/키 순서만 바뀜
+        catalog = new_catalog
+        cache.reset()
+        build(catalog, args, cache=cache, traffic=traffic, verbose=False)
+        cache.prune()
+        elapsed = (time.perf_counter() - started) * 1000
+        label = f"API {', '.join(apis)} 변경" if apis else "변경된 API 없음"
+        print(f"✅ {label} - {entry} 다시 생성 {elapsed:.0f}ms (새로 렌더링 {cache.misses}개, 재사용 {cache.hits}개)")
+        if server is not None:
+            server.notify()
 
 if __name__ == '__main__':
+    args = parse_args()
+    jobs = args.jobs or os.cpu_count() or 1
+    catalog = ApiCatalog(load_api_data(args.data))
     print("API 데이터 구조 생성 완료")
-    print(f"섹션 수: {len(API_DATA['sections'])}")
-    print(f"총 API 수: {sum(len(s['apis']) for s in API_DATA['sections'])}")
-    print("\nHTML 생성 중...")
-    html_content = generate_html(API_DATA)
-    with open('api_reference_details.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    print('✅ HTML 파일 생성 완료: api_reference_details.html')
+    print(f"섹션 수: {len(catalog.sections)}")
+    print(f"총 API 수: {len(catalog)}")
+    traffic = None
+    if args.traffic:
+        traffic = load_traffic(args.traffic)
+        print(f"실측 트래픽 반영: API {len(traffic)}개")
+    if args.watch:
+        try:
+            watch(catalog, args, traffic)
+        except KeyboardInterrupt:
+            print("\n변경 감시 종료")
+    else:
+        print("\nHTML 생성 중...")
+        cache = FragmentCache(args.cache_dir) if args.incremental else None
+        entry = build(catalog, args, cache=cache, jobs=jobs, traffic=traffic)
+        if cache is not None:
+            removed = cache.prune()
+            print(f"증분 빌드: 캐시 적중 {cache.hits}개, 새로 렌더링 {cache.misses}개, 오래된 조각 {removed}개 삭제")
+        if args.split:
+            print(f'✅ 분할 HTML 생성 완료: {entry} (섹션 조각 {len(catalog.sections)}개)')
+        else:
+            print(f'✅ HTML 파일 생성 완료: {entry}')
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 카탈로그 기반 부하 테스트 시나리오 생성/실행기
+API_DATA의 query_params, path_params, body/body_required, auth로부터 API별 요청 템플릿을 만들고,
+가중치가 있는 사용자 여정(로그인 → 게시글 목록 → 게시글 상세 → 댓글 등)을
+개방형(open-loop) 포아송 도착률로 실행한다.
+
+응답 JSON에서 경로/쿼리 파라미터 이름과 같은 키(post_id, user_id 등)와 access_token을 찾아
+같은 세션의 다음 요청에 이어서 사용한다.
+
+사용법:
+    python load_test.py --list                                  # 생성된 요청 템플릿 확인
+    python load_test.py --rate 50 --duration 60                  # 기본 여정, 초당 50세션
+    python load_test.py --journeys journeys.json --base-url http://localhost:8101 -o result.json
+
+여정 파일 형식:
+    {"journeys": [
+      {"name": "board_reader", "weight": 6, "think_time_ms": 300,
+       "steps": ["로그인", "게시글 목록 조회", "게시글 상세 조회", "댓글 목록 조회"]}
+    ]}
+steps는 API ID, API 이름, "메서드 경로" 중 하나.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from collections import Counter
+from datetime import date
+
+from access_log_analyzer import LatencySketch
+from api_catalog import load_catalog
+from async_http import AsyncHttpClient, HttpError
+
+DEFAULT_BASE_URL = 'http://localhost:8101'
+
+DEFAULT_JOURNEYS = [
+    {"name": "board_reader", "weight": 6, "think_time_ms": 300,
+     "steps": ["1.1", "3.1", "3.2", "4.1"]},
+    {"name": "board_writer", "weight": 1, "think_time_ms": 500,
+     "steps": ["1.1", "3.1", "3.3", "4.2"]},
+    {"name": "planner", "weight": 3, "think_time_ms": 300,
+     "steps": ["1.1", "6.2", "6.5", "7.2", "7.5"]},
+]
+
+# 파일 업로드 API에 보낼 더미 파일 (MIME 타입 -> (파일명, 내용))
+SAMPLE_FILES = {
+    'image/jpeg': ('loadtest.jpg', b'\xff\xd8\xff\xe0' + b'\x00' * 1024 + b'\xff\xd9'),
+    'image/png': ('loadtest.png', b'\x89PNG\r\n\x1a\n' + b'\x00' * 1024),
+    'text/csv': ('loadtest.csv', 'category,item_name,estimated_budget\n드레스,본식 드레스,3000000\n'.encode('utf-8')),
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': ('loadtest.xlsx', b'PK\x03\x04' + b'\x00' * 1024),
+}
+
+DEFAULT_RE = re.compile(r"기본값:\s*'?([^')]+?)'?\s*[),]")
+ENUM_RE = re.compile(r'\(([A-Z_]+(?:\s*[|,]\s*[A-Z_]+)+)\)')
+
+
+def sample_value(type_text):
+    """문서의 타입 문자열("string (YYYY-MM-DD) | null", "boolean (기본값: true)" 등)에 맞는 예시 값"""
+    text = str(type_text)
+    default = DEFAULT_RE.search(text)
+    lowered = text.lower()
+    if default:
+        raw = default.group(1).strip()
+        if lowered.startswith('boolean'):
+            return raw.lower() == 'true'
+        if lowered.startswith(('integer', 'number', 'float')):
+            return float(raw) if '.' in raw else int(raw)
+        return raw
+    enum = ENUM_RE.search(text)
+    if enum:
+        return re.split(r'\s*[|,]\s*', enum.group(1))[0]
+    if lowered.startswith('array[integer'):
+        return [1]
+    if lowered.startswith('array'):
+        return ['loadtest']
+    if lowered.startswith('object'):
+        return {}
+    if lowered.startswith('boolean'):
+        return True
+    if lowered.startswith('integer'):
+        return 1
+    if lowered.startswith(('float', 'number')):
+        return 1.0
+    if 'yyyy-mm-dd' in lowered:
+        return date.today().isoformat()
+    if 'hh:mm' in lowered:
+        return '12:00'
+    if 'httpurl' in lowered:
+        return 'https://example.com/loadtest'
+    if 'base64' in lowered:
+        return ''
+    return 'loadtest'
+
+
+def sample_param(param):
+    """쿼리/경로 파라미터 예시 값 (기본값이 있으면 기본값)"""
+    if param.get('default') not in (None, '-'):
+        return param['default']
+    kind = param.get('type', 'String').lower()
+    if kind == 'integer':
+        return 1
+    if kind == 'boolean':
+        return 'true'
+    if kind == 'float':
+        return 1.0
+    return 'loadtest'
+
+
+def multipart_body(fields, boundary='----WeddingOsLoadTest'):
+    """(Content-Type 헤더, 본문 bytes) - fields는 이름 -> 문자열 또는 (파일명, MIME, bytes)"""
+    parts = []
+    for name, value in fields.items():
+        if isinstance(value, tuple):
+            filename, mime, content = value
+            parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                         f'filename="{filename}"\r\nContent-Type: {mime}\r\n\r\n'.encode('utf-8') + content)
+        else:
+            parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+                         f'{value}'.encode('utf-8'))
+    body = b'\r\n'.join(parts) + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+    return f'multipart/form-data; boundary={boundary}', body
+
+
+class RequestTemplate:
+    """API 하나의 요청 틀 - 세션 변수로 경로/쿼리 파라미터를 채워 실제 요청을 만든다"""
+    __slots__ = ('endpoint', 'path_names', 'query', 'body', 'multipart')
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.path_names = [p['name'] for p in endpoint.path_params] or re.findall(r'\{(\w+)\}', endpoint.path)
+        # 필수 파라미터와 기본값이 있는 선택 파라미터만 보낸다
+        self.query = {p['name']: sample_param(p) for p in endpoint.query_params
+                      if p.get('required') or p.get('default') not in (None, '-')}
+        self.multipart = endpoint.request == 'MultipartFormData'
+        self.body = None
+        if endpoint.body:
+            fields = list(endpoint.body_required) + [f for f in endpoint.body_optional
+                                                     if f not in endpoint.body_required]
+            fields += [f for f in endpoint.body if f not in fields]
+            self.body = {f: self._field_value(endpoint.body.get(f, 'string')) for f in fields}
+
+    def _field_value(self, type_text):
+        if self.multipart and str(type_text).startswith('File'):
+            mimes = [m for m in SAMPLE_FILES if m in type_text] or ['image/jpeg']
+            filename, content = SAMPLE_FILES[mimes[0]]
+            return (filename, mimes[0], content)
+        return sample_value(type_text)
+
+    def build(self, variables, token):
+        """(메서드, 경로, 쿼리, 헤더, 본문)"""
+        path = self.endpoint.path
+        for name in self.path_names:
+            path = path.replace('{' + name + '}', str(variables.get(name, 1)))
+        query = {name: variables.get(name, value) for name, value in self.query.items()}
+        headers = {}
+        if self.endpoint.auth and token:
+            headers['Authorization'] = f'Bearer {token}'
+        body = None
+        if self.body is not None:
+            values = {k: variables.get(k, v) if not isinstance(v, tuple) else v for k, v in self.body.items()}
+            if self.multipart:
+                content_type, body = multipart_body(values)
+                headers['Content-Type'] = content_type
+            else:
+                body = values
+        return self.endpoint.method, path, query, headers, body
+
+    def describe(self):
+        e = self.endpoint
+        return {"id": e.id, "method": e.method, "path": e.path, "auth": e.auth,
+                "path_params": self.path_names, "query": self.query,
+                "body": None if self.body is None else
+                {k: (f"<file {v[0]}>" if isinstance(v, tuple) else v) for k, v in self.body.items()}}
+
+
+def build_templates(catalog):
+    return {endpoint.id: RequestTemplate(endpoint) for endpoint in catalog}
+
+
+def capture_keys(catalog):
+    """응답에서 찾아 세션 변수로 쓸 키 (카탈로그의 모든 경로/쿼리 파라미터 이름)"""
+    keys = {'access_token'}
+    for endpoint in catalog:
+        keys.update(p['name'] for p in endpoint.path_params)
+        keys.update(p['name'] for p in endpoint.query_params)
+    return keys
+
+
+def capture(data, keys, variables, limit=200):
+    """응답 JSON을 너비 우선으로 훑어 keys에 해당하는 첫 값을 variables에 저장"""
+    queue = [data]
+    seen = set()
+    while queue and limit:
+        node = queue.pop(0)
+        limit -= 1
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in keys and key not in seen and isinstance(value, (int, str)) and value != '...':
+                    variables[key] = value
+                    seen.add(key)
+                elif isinstance(value, (dict, list)):
+                    queue.append(value)
+        elif isinstance(node, list):
+            queue.extend(node[:5])
+
+
+class Journey:
+    __slots__ = ('name', 'weight', 'steps', 'think_time')
+
+    def __init__(self, spec, catalog):
+        self.name = spec['name']
+        self.weight = spec.get('weight', 1)
+        self.steps = [catalog.resolve(step) for step in spec['steps']]
+        self.think_time = spec.get('think_time_ms', 0) / 1000
+
+
+class Metrics:
+    """API별 응답 시간 스케치와 상태 코드 분포"""
+
+    def __init__(self):
+        self.latency = {}
+        self.statuses = {}
+        self.errors = Counter()
+        self.sessions = Counter()
+        self.dropped = 0
+
+    def record(self, api_id, status, seconds):
+        if api_id not in self.latency:
+            self.latency[api_id] = LatencySketch()
+            self.statuses[api_id] = Counter()
+        self.latency[api_id].add(seconds)
+        self.statuses[api_id][status] += 1
+
+    def report(self, catalog, elapsed):
+        endpoints = {}
+        for api_id in sorted(self.latency, key=lambda i: catalog.get(i).sort_key):
+            sketch = self.latency[api_id]
+            endpoint = catalog.get(api_id)
+            endpoints[api_id] = {
+                "method": endpoint.method,
+                "path": endpoint.path,
+                "requests": sketch.count,
+                "rps": round(sketch.count / elapsed, 2) if elapsed else None,
+                "status_codes": {str(k): v for k, v in sorted(self.statuses[api_id].items())},
+                "latency_ms": {q: round(sketch.quantile(v) * 1000, 3)
+                               for q, v in (("p50", .5), ("p95", .95), ("p99", .99))},
+            }
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "sessions": dict(self.sessions),
+            "dropped_sessions": self.dropped,
+            "errors": dict(self.errors),
+            "endpoints": endpoints,
+        }
+
+
+class LoadTest:
+    def __init__(self, catalog, client, journeys, variables=None, token=None, credentials=None, seed=None):
+        self.catalog = catalog
+        self.client = client
+        self.journeys = journeys
+        self.templates = build_templates(catalog)
+        self.keys = capture_keys(catalog)
+        self.variables = variables or {}
+        self.token = token
+        self.credentials = credentials
+        self.rng = random.Random(seed)
+        self.metrics = Metrics()
+
+    async def run_session(self, journey):
+        """여정 하나를 처음부터 끝까지 실행 (세션 변수는 세션마다 따로)"""
+        variables = dict(self.variables)
+        token = self.token
+        self.metrics.sessions[journey.name] += 1
+        for index, endpoint in enumerate(journey.steps):
+            if index and journey.think_time:
+                await asyncio.sleep(self.rng.expovariate(1 / journey.think_time))
+            method, path, query, headers, body = self.templates[endpoint.id].build(variables, token)
+            if endpoint.id == '1.1' and self.credentials:
+                body = dict(body, **self.credentials)
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(method, path, query, headers, body)
+            except (HttpError, asyncio.TimeoutError, OSError) as exc:
+                self.metrics.errors[f"{endpoint.id} {type(exc).__name__}"] += 1
+                return
+            self.metrics.record(endpoint.id, response.status, time.perf_counter() - started)
+            if response.headers.get('content-type', '').startswith('application/json'):
+                try:
+                    capture(response.json(), self.keys, variables)
+                except ValueError:
+                    pass
+                token = variables.get('access_token', token)
+
+    async def run_open_loop(self, rate, duration, max_sessions):
+        """포아송 도착률 rate(세션/초)로 duration초 동안 세션 시작 - 응답을 기다리지 않는 개방형 부하"""
+        loop = asyncio.get_running_loop()
+        weights = [j.weight for j in self.journeys]
+        running = set()
+        start = loop.time()
+        next_arrival = start
+        while True:
+            next_arrival += self.rng.expovariate(rate)
+            if next_arrival - start >= duration:
+                break
+            delay = next_arrival - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(running) >= max_sessions:
+                self.metrics.dropped += 1
+                continue
+            journey = self.rng.choices(self.journeys, weights)[0]
+            task = loop.create_task(self.run_session(journey))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        if running:
+            await asyncio.gather(*running)
+        return loop.time() - start
+
+
+def load_journeys(path, catalog):
+    specs = DEFAULT_JOURNEYS
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            specs = json.load(f)['journeys']
+    return [Journey(spec, catalog) for spec in specs]
+
+
+def print_report(report):
+    print(f"\n실행 시간 {report['elapsed_s']}초, 세션 {sum(report['sessions'].values())}개 "
+          f"(초과로 버린 세션 {report['dropped_sessions']}개)")
+    for api_id, entry in report['endpoints'].items():
+        latency = entry['latency_ms']
+        print(f"  {api_id:>6} {entry['method']:<6} {entry['path']:<45} {entry['requests']:>7}건 "
+              f"{entry['rps']:>8} rps  p50={latency['p50']}ms p95={latency['p95']}ms "
+              f"p99={latency['p99']}ms  {entry['status_codes']}")
+    for error, count in report['errors'].items():
+        print(f"  ⚠️ {error}: {count}건")
+
+
+def parse_var(text):
+    name, _, value = text.partition('=')
+    return name, int(value) if value.isdigit() else value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API 카탈로그 기반 부하 테스트")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help=f"대상 서버 (기본값: {DEFAULT_BASE_URL})")
+    parser.add_argument('--journeys', metavar='JSON', help="사용자 여정 파일 (생략하면 기본 여정)")
+    parser.add_argument('--rate', type=float, default=10, help="초당 세션 시작 수 (기본값: 10)")
+    parser.add_argument('--duration', type=float, default=30, help="세션을 시작하는 시간(초, 기본값: 30)")
+    parser.add_argument('--max-sessions', type=int, default=1000, help="동시 세션 상한 (넘으면 버림)")
+    parser.add_argument('--connections', type=int, default=100, help="최대 동시 연결 수")
+    parser.add_argument('--timeout', type=float, default=30, help="요청 타임아웃(초)")
+    parser.add_argument('--token', help="로그인 단계가 없을 때 쓸 액세스 토큰")
+    parser.add_argument('--email', help="로그인 단계에서 쓸 이메일")
+    parser.add_argument('--password', help="로그인 단계에서 쓸 비밀번호")
+    parser.add_argument('--var', action='append', default=[], type=parse_var, metavar='NAME=VALUE',
+                        help="경로/쿼리 파라미터 초기값 (예: --var post_id=3)")
+    parser.add_argument('--seed', type=int, help="난수 시드 (재현용)")
+    parser.add_argument('--list', action='store_true', help="생성된 요청 템플릿만 출력하고 종료")
+    parser.add_argument('-o', '--output', help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog()
+    if args.list:
+        for template in build_templates(catalog).values():
+            print(json.dumps(template.describe(), ensure_ascii=False))
+        return
+
+    credentials = None
+    if args.email or args.password:
+        credentials = {k: v for k, v in (('email', args.email), ('password', args.password)) if v}
+
+    async def run():
+        client = AsyncHttpClient(args.base_url, max_connections=args.connections, timeout=args.timeout)
+        test = LoadTest(catalog, client, load_journeys(args.journeys, catalog), dict(args.var),
+                        args.token, credentials, args.seed)
+        print(f"부하 테스트 시작: {args.base_url}, 초당 {args.rate}세션, {args.duration}초")
+        try:
+            elapsed = await test.run_open_loop(args.rate, args.duration, args.max_sessions)
+        finally:
+            await client.close()
+        return test.metrics.report(catalog, elapsed)
+
+    report = asyncio.run(run())
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ 결과 저장 완료: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
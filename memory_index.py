@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+사용자 메모리 벡터 검색 로컬 구현 (근사 최근접 이웃)
+"사용자 메모리 검색"(GET /api/vector/user/memory - query, k 1-20, preference_type 필터)과
+"사용자 프로필 요약"/"사용자 메모리 통계"를 사용자별 샤드로 구현한다.
+
+메모리가 많은 사용자는 전체 스캔 비용이 메모리 수에 비례해 커지므로, 샤드가 IVF_MIN_MEMORIES 이상이면
+IVF(inverted file) 방식의 근사 인덱스를 만든다.
+- 구면 k-means로 메모리를 nlist개 군집으로 나누고, 벡터를 군집 순으로 연속 배치한다
+- 질의는 중심이 가까운 nprobe개 군집만 훑는다 - nprobe가 재현율/지연시간 조절 손잡이
+  (nprobe를 생략하거나 nlist 이상이면 전체를 정확히 스캔)
+- preference_type 필터는 훑은 후보에 마스크로 적용하고, 결과가 k개보다 적으면 군집을 더 연다
+사용자 샤드는 디렉토리에 user_id 해시로 나눈 .npz 파일로 저장하고, 필요할 때 읽어 LRU로 캐시한다.
+
+임베딩은 vector_index.HashingEmbedder를 쓴다. NumPy가 필요하다.
+
+사용법:
+    python memory_index.py bench                                   # 정확 검색 대비 recall@k, p99 비교
+    python memory_index.py bench --users 100 --max-memories 50000 --nprobe 1,4,16
+    python memory_index.py bench --save user_memory/ && python memory_index.py search user_memory/ 3 "야외 웨딩"
+"""
+
+import argparse
+import math
+import os
+import time
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from api_catalog import load_catalog
+from openapi_export import param_schema
+from vector_index import EMBEDDING_DIM, HashingEmbedder, normalize, success_message
+
+# 이 수 이상의 메모리를 가진 샤드만 IVF 인덱스를 만든다 (그보다 작으면 전체 스캔이 더 빠르다)
+IVF_MIN_MEMORIES = 1000
+
+# 기본 nprobe - 재현율/지연시간 조절값 (bench 결과를 보고 고른다)
+DEFAULT_NPROBE = 8
+
+KMEANS_ITERATIONS = 10
+# k-means 학습에 쓰는 군집당 최대 표본 수
+KMEANS_SAMPLE_PER_LIST = 64
+
+# 메모리에 올려 둘 사용자 샤드 수
+SHARD_CACHE_SIZE = 1024
+
+# 샤드 파일을 나눠 담는 하위 디렉토리 수 (한 디렉토리에 파일이 너무 많아지지 않도록)
+SHARD_FANOUT = 256
+
+# 10.5 설명의 요약 항목(예산 스타일, 선호 컨셉, 일정 패턴)을 따른 합성 데이터용 선호도 타입
+DEFAULT_PREFERENCE_TYPES = ('budget_style', 'concept', 'schedule_pattern', 'vendor', 'venue')
+
+SEARCH_API = 'GET /api/vector/user/memory'
+PROFILE_API = 'GET /api/vector/user/profile'
+STATS_API = 'GET /api/vector/user/stats'
+
+
+def default_nlist(count):
+    """메모리 수 -> 군집 수 (√n, 작은 샤드는 1 = 전체 스캔)"""
+    if count < IVF_MIN_MEMORIES:
+        return 1
+    return int(min(1024, max(8, round(math.sqrt(count)))))
+
+
+def spherical_kmeans(vectors, nlist, iterations=KMEANS_ITERATIONS, seed=0):
+    """정규화 벡터의 구면 k-means 중심 (nlist, dim) - 표본 nlist * KMEANS_SAMPLE_PER_LIST개로 학습"""
+    rng = np.random.default_rng(seed)
+    count = len(vectors)
+    sample = min(count, nlist * KMEANS_SAMPLE_PER_LIST)
+    train = np.asarray(vectors[np.sort(rng.choice(count, sample, replace=False))], dtype=np.float32)
+    centroids = train[rng.choice(sample, nlist, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(train @ centroids.T, axis=1)
+        order = np.argsort(assign, kind='stable')
+        counts = np.bincount(assign, minlength=nlist)
+        filled = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)))[filled]
+        centroids[filled] = np.add.reduceat(train[order], starts, axis=0)
+        empty = np.flatnonzero(counts == 0)
+        if empty.size:
+            # 빈 군집은 임의의 표본으로 다시 시작
+            centroids[empty] = train[rng.choice(sample, empty.size, replace=False)]
+        normalize(centroids)
+    return centroids
+
+
+def _top_k(scores, k):
+    """1차원 점수 -> 점수 내림차순 top-k 위치"""
+    if len(scores) > k:
+        top = np.argpartition(scores, -k)[-k:]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+class MemoryShard:
+    """사용자 한 명의 메모리 벡터 - 군집 순으로 정렬된 행렬 + 군집 경계 + 선호도 타입 코드
+
+    nlist == 1이면 IVF 없이 전체 스캔만 한다.
+    """
+
+    def __init__(self, vectors, ids, types, type_names, centroids, offsets):
+        self.vectors = vectors
+        self.ids = ids
+        self.types = types
+        self.type_names = list(type_names)
+        self.centroids = centroids
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, ids, vectors, types, nlist=None, seed=0):
+        ids = np.asarray(ids, dtype=np.int64)
+        vectors = normalize(np.array(vectors, dtype=np.float32))
+        type_names, codes = np.unique(np.asarray(types), return_inverse=True)
+        nlist = min(nlist or default_nlist(len(ids)), max(len(ids), 1))
+        if nlist > 1:
+            centroids = spherical_kmeans(vectors, nlist, seed=seed)
+            assign = np.argmax(vectors @ centroids.T, axis=1)
+            order = np.argsort(assign, kind='stable')
+            vectors, ids, codes = vectors[order], ids[order], codes[order]
+            offsets = np.concatenate(([0], np.cumsum(np.bincount(assign, minlength=nlist))))
+        else:
+            centroids = np.zeros((1, vectors.shape[1]), dtype=np.float32)
+            offsets = np.array([0, len(ids)])
+        return cls(np.ascontiguousarray(vectors), ids, codes.astype(np.int16), [str(t) for t in type_names],
+                   centroids, offsets.astype(np.int64))
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def nlist(self):
+        return len(self.centroids)
+
+    def _type_code(self, preference_type):
+        try:
+            return self.type_names.index(preference_type)
+        except ValueError:
+            return -1
+
+    def _probe_rows(self, probes):
+        """군집 번호 배열 -> 해당 군집들의 행 위치 (연속 구간들을 이어 붙인 것)"""
+        starts = self.offsets[probes]
+        lengths = self.offsets[probes + 1] - starts
+        ends = np.cumsum(lengths)
+        return np.arange(ends[-1] if len(ends) else 0) + np.repeat(starts - (ends - lengths), lengths)
+
+    def search(self, query, k, preference_type=None, nprobe=None):
+        """정규화된 질의 벡터 하나 -> (점수, 메모리 ID), 점수 내림차순
+
+        nprobe가 None이거나 nlist 이상이면 정확 검색, 아니면 가까운 nprobe개 군집만 훑는 근사 검색.
+        """
+        code = None
+        if preference_type is not None:
+            code = self._type_code(preference_type)
+            if code < 0:
+                return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+        if nprobe is None or nprobe >= self.nlist:
+            scores = self.vectors @ query
+            if code is not None:
+                scores = np.where(self.types == code, scores, -np.inf)
+                k = min(k, int(np.count_nonzero(self.types == code)))
+            top = _top_k(scores, k)
+            return scores[top], self.ids[top]
+
+        order = np.argsort(-(self.centroids @ query))
+        probes = nprobe
+        while True:
+            rows = self._probe_rows(order[:probes])
+            if code is not None:
+                rows = rows[self.types[rows] == code]
+            # 필터로 후보가 k개보다 적으면 군집을 두 배씩 더 연다
+            if len(rows) >= k or probes >= self.nlist:
+                break
+            probes = min(probes * 2, self.nlist)
+        scores = self.vectors[rows] @ query
+        top = _top_k(scores, k)
+        return scores[top], self.ids[rows[top]]
+
+    def type_counts(self):
+        counts = np.bincount(self.types, minlength=len(self.type_names))
+        return {name: int(n) for name, n in zip(self.type_names, counts, strict=True)}
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            np.savez(f, vectors=self.vectors, ids=self.ids, types=self.types, type_names=np.array(self.type_names),
+                     centroids=self.centroids, offsets=self.offsets)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data['vectors'], data['ids'], data['types'], data['type_names'].tolist(),
+                       data['centroids'], data['offsets'])
+
+
+class MemoryStore:
+    """user_id -> MemoryShard (directory가 있으면 샤드 파일에서 필요할 때 읽어 LRU 캐시)"""
+
+    def __init__(self, directory=None, nprobe=DEFAULT_NPROBE, cache_size=SHARD_CACHE_SIZE, embedder=None):
+        self.directory = directory
+        self.nprobe = nprobe
+        self.cache_size = cache_size
+        self.embedder = embedder or HashingEmbedder(EMBEDDING_DIM)
+        self.shards = OrderedDict()
+
+    def _path(self, user_id):
+        bucket = zlib.crc32(str(user_id).encode()) % SHARD_FANOUT
+        return os.path.join(self.directory, f"{bucket:02x}", f"{user_id}.npz")
+
+    def put(self, user_id, shard):
+        if self.directory:
+            shard.save(self._path(user_id))
+        self._cache(user_id, shard)
+
+    def _cache(self, user_id, shard):
+        self.shards[user_id] = shard
+        self.shards.move_to_end(user_id)
+        while len(self.shards) > self.cache_size:
+            self.shards.popitem(last=False)
+
+    def shard(self, user_id):
+        """사용자 샤드, 메모리가 없는 사용자는 None"""
+        shard = self.shards.get(user_id)
+        if shard is not None:
+            self.shards.move_to_end(user_id)
+            return shard
+        if not self.directory:
+            return None
+        path = self._path(user_id)
+        if not os.path.exists(path):
+            return None
+        shard = MemoryShard.load(path)
+        self._cache(user_id, shard)
+        return shard
+
+    def search(self, user_id, query, k, preference_type=None, nprobe=-1):
+        """nprobe: -1이면 저장소 기본값, None이면 정확 검색"""
+        shard = self.shard(user_id)
+        if shard is None:
+            return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+        return shard.search(query, k, preference_type, self.nprobe if nprobe == -1 else nprobe)
+
+
+class UserMemoryApi:
+    """사용자 메모리 검색/프로필 요약/통계 API를 카탈로그 계약대로 처리"""
+
+    def __init__(self, store, catalog=None):
+        self.store = store
+        self.catalog = catalog or load_catalog()
+        endpoint = self.catalog.resolve(SEARCH_API)
+        params = {p['name']: param_schema(p) for p in endpoint.query_params}
+        k_schema = params.get('k', {})
+        self.default_k = k_schema.get('default', 5)
+        self.min_k = k_schema.get('minimum', 1)
+        self.max_k = k_schema.get('maximum', 20)
+        self.messages = {
+            'search': success_message(endpoint, 'user_memory_retrieved'),
+            'profile': success_message(self.catalog.resolve(PROFILE_API), 'user_profile_retrieved'),
+            'stats': success_message(self.catalog.resolve(STATS_API), 'user_memory_stats_retrieved'),
+        }
+
+    def search(self, user_id, query, k=None, preference_type=None):
+        """(상태 코드, 응답 본문 dict)"""
+        k = self.default_k if k is None else k
+        if not query or not self.min_k <= k <= self.max_k:
+            return 422, {"message": "invalid_request", "data": None}
+        scores, ids = self.store.search(user_id, self.store.embedder.embed([query])[0], k, preference_type)
+        results = [{"memory_id": int(memory_id), "score": round(float(score), 4)}
+                   for score, memory_id in zip(scores, ids, strict=True)]
+        return 200, {"message": self.messages['search'],
+                     "data": {"query": query, "results": results, "total": len(results)}}
+
+    def _stats(self, shard):
+        if shard is None:
+            return {"total_memories": 0, "preference_types": {}, "index": None}
+        return {"total_memories": len(shard), "preference_types": shard.type_counts(),
+                "index": "ivf" if shard.nlist > 1 else "flat", "nlist": shard.nlist}
+
+    def profile(self, user_id):
+        """선호도 타입별 메모리 수와 대표 메모리(타입 평균 벡터에 가장 가까운 메모리)"""
+        shard = self.store.shard(user_id)
+        profile = {}
+        if shard is not None:
+            for code, name in enumerate(shard.type_names):
+                rows = np.flatnonzero(shard.types == code)
+                if not rows.size:
+                    continue
+                members = shard.vectors[rows]
+                center = members.mean(axis=0)
+                profile[name] = {"count": int(rows.size),
+                                 "representative_memory_id": int(shard.ids[rows[np.argmax(members @ center)]])}
+        return 200, {"message": self.messages['profile'], "data": {"profile": profile, "stats": self._stats(shard)}}
+
+    def stats(self, user_id):
+        return 200, {"message": self.messages['stats'], "data": {"stats": self._stats(self.store.shard(user_id))}}
+
+
+def synthetic_user(rng, count, dim, topics=48, spread=0.35, types=DEFAULT_PREFERENCE_TYPES):
+    """주제 군집이 있는 합성 사용자 메모리 (ids, vectors, types)"""
+    centers = normalize(rng.standard_normal((topics, dim), dtype=np.float32))
+    vectors = centers[rng.integers(0, topics, count)]
+    vectors += rng.standard_normal((count, dim), dtype=np.float32) * (spread / math.sqrt(dim) * 4)
+    normalize(vectors)
+    return np.arange(1, count + 1, dtype=np.int64), vectors, np.array(types)[rng.integers(0, len(types), count)]
+
+
+def _quantile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def bench(args):
+    rng = np.random.default_rng(args.seed)
+    store = MemoryStore(args.save, nprobe=DEFAULT_NPROBE)
+    # 메모리 수는 로그 균등 분포 - 소수의 파워 유저가 수천~수만 건
+    sizes = np.exp(rng.uniform(math.log(args.min_memories), math.log(args.max_memories), args.users)).astype(int)
+    started = time.perf_counter()
+    for user_id, size in enumerate(sizes, 1):
+        ids, vectors, types = synthetic_user(rng, int(size), args.dim)
+        store.put(user_id, MemoryShard.build(ids, vectors, types, seed=args.seed))
+    print(f"사용자 {args.users}명, 메모리 {int(sizes.sum()):,}건 (사용자당 {sizes.min():,}~{sizes.max():,}) "
+          f"샤드 생성 {time.perf_counter() - started:.1f}s")
+
+    # 질의: 메모리가 많은 사용자일수록 자주 (파워 유저 체감 지연시간이 목적), 기존 메모리 근처의 벡터
+    users = rng.choice(np.arange(1, args.users + 1), args.queries, p=sizes / sizes.sum())
+    queries = []
+    for user_id in users:
+        shard = store.shard(int(user_id))
+        query = shard.vectors[rng.integers(len(shard))] + rng.standard_normal(args.dim, dtype=np.float32) * 0.05
+        query /= np.linalg.norm(query)
+        kind = rng.choice(DEFAULT_PREFERENCE_TYPES) if rng.random() < args.filtered else None
+        queries.append((int(user_id), query, kind))
+
+    def run(nprobe):
+        results, latencies = [], []
+        for user_id, query, kind in queries:
+            t = time.perf_counter()
+            _, ids = store.search(user_id, query, args.k, kind, nprobe)
+            latencies.append(time.perf_counter() - t)
+            results.append(ids)
+        return results, latencies
+
+    exact, exact_latency = run(None)
+    large = [i for i, (user_id, _, _) in enumerate(queries) if len(store.shard(user_id)) >= args.power_user]
+    print(f"질의 {len(queries)}개 (필터 비율 {args.filtered:.0%}, "
+          f"메모리 {args.power_user:,}건 이상 사용자 대상 {len(large)}개), k={args.k}")
+    print(f"  {'모드':<12} {'recall@k':>9} {'p50':>9} {'p99':>9} {'파워 유저 p99':>13}")
+
+    def line(label, recall, latencies):
+        big = [latencies[i] for i in large] or [0.0]
+        print(f"  {label:<12} {recall:>9.3f} {_quantile(latencies, .5) * 1000:>7.3f}ms "
+              f"{_quantile(latencies, .99) * 1000:>7.3f}ms {_quantile(big, .99) * 1000:>11.3f}ms")
+
+    line("exact", 1.0, exact_latency)
+    for nprobe in args.nprobe:
+        approx, latencies = run(nprobe)
+        recall = np.mean([len(set(a) & set(e)) / len(e) for a, e in zip(approx, exact, strict=True) if len(e)])
+        line(f"nprobe={nprobe}", recall, latencies)
+
+
+def search_command(args):
+    import json
+
+    api = UserMemoryApi(MemoryStore(args.store, nprobe=args.nprobe))
+    status, body = api.search(args.user_id, args.query, args.k, args.preference_type)
+    print(json.dumps(body, ensure_ascii=False, indent=2))
+    return 0 if status == 200 else 1
+
+
+def _nprobe_list(text):
+    return [int(n) for n in text.split(',') if n]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="사용자 메모리 벡터 검색 (사용자별 샤드, IVF 근사 검색)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    bench_parser = commands.add_parser('bench', help="정확 검색 대비 근사 검색 recall@k / 지연시간 비교")
+    bench_parser.add_argument('--users', type=int, default=60, help="사용자 수 (기본값: 60)")
+    bench_parser.add_argument('--min-memories', type=int, default=100, help="사용자당 최소 메모리 수")
+    bench_parser.add_argument('--max-memories', type=int, default=20000, help="사용자당 최대 메모리 수")
+    bench_parser.add_argument('--dim', type=int, default=EMBEDDING_DIM, help=f"차원 (기본값: {EMBEDDING_DIM})")
+    bench_parser.add_argument('--queries', type=int, default=500, help="질의 수 (기본값: 500)")
+    bench_parser.add_argument('--k', type=int, default=10, help="top-k (기본값: 10)")
+    bench_parser.add_argument('--filtered', type=float, default=0.3, help="preference_type 필터 질의 비율")
+    bench_parser.add_argument('--nprobe', type=_nprobe_list, default=[1, 2, 4, 8, 16, 32],
+                              help="비교할 nprobe 목록 (기본값: 1,2,4,8,16,32)")
+    bench_parser.add_argument('--power-user', type=int, default=10000,
+                              help="따로 p99를 보는 파워 유저 기준 메모리 수 (기본값: 10000)")
+    bench_parser.add_argument('--seed', type=int, default=0, help="난수 시드")
+    bench_parser.add_argument('--save', metavar='DIR', help="사용자 샤드를 저장할 디렉토리")
+    search_parser = commands.add_parser('search', help="저장된 샤드로 검색 (API 응답 형식으로 출력)")
+    search_parser.add_argument('store', help="샤드 디렉토리")
+    search_parser.add_argument('user_id', type=int, help="사용자 ID")
+    search_parser.add_argument('query', help="검색 쿼리")
+    search_parser.add_argument('--k', type=int, help="반환할 결과 개수 (기본값: API 문서 기본값)")
+    search_parser.add_argument('--preference-type', help="선호도 타입 필터")
+    search_parser.add_argument('--nprobe', type=int, default=DEFAULT_NPROBE,
+                               help=f"훑을 군집 수 (기본값: {DEFAULT_NPROBE})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'bench':
+        bench(args)
+        return 0
+    return search_command(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+목 서버 지연시간/오류 주입 프로필
+API별 지연시간 분포(fixed, normal, long_tail), 문서에 적힌 non-2xx 응답 중에서 고르는 오류 주입,
+업로드 API 대역폭 제한을 프로필 파일(JSON)로 정의하고 실행 중에 바꿀 수 있다.
+
+프로필 파일 형식 (mock_profiles.example.json 참고):
+    {
+      "active": "realistic",
+      "profiles": {
+        "realistic": {
+          "default": {"latency": {"type": "normal", "mean_ms": 40, "stddev_ms": 15}},
+          "endpoints": {
+            "5.1": {"latency": {"type": "long_tail", "median_ms": 400, "p99_ms": 5000}},
+            "게시글 이미지 업로드": {"bandwidth_kbps": 2000, "error_rate": 0.02}
+          }
+        }
+      }
+    }
+
+endpoints의 키는 API ID("3.8"), API 이름("Excel Import"), "메서드 경로"("POST /api/posts/upload") 중 하나.
+"""
+
+import json
+import math
+import random
+
+# 표준정규분포의 99 분위수 (long_tail 분포의 p99 -> 로그 표준편차 변환용)
+Z_99 = 2.326
+
+LATENCY_TYPES = ('fixed', 'normal', 'long_tail')
+
+
+class LatencyModel:
+    """지연시간 분포 하나 (sample()은 초 단위)"""
+    __slots__ = ('kind', 'a', 'b')
+
+    def __init__(self, kind, a=0.0, b=0.0):
+        self.kind = kind
+        self.a = a
+        self.b = b
+
+    @classmethod
+    def from_spec(cls, spec):
+        if spec is None:
+            return cls('fixed', 0.0)
+        kind = spec.get('type', 'fixed')
+        if kind == 'fixed':
+            return cls('fixed', spec.get('ms', 0) / 1000)
+        if kind == 'normal':
+            return cls('normal', spec['mean_ms'] / 1000, spec.get('stddev_ms', 0) / 1000)
+        if kind == 'long_tail':
+            # 로그정규분포: 중앙값과 p99로 모수를 정한다
+            median, p99 = spec['median_ms'] / 1000, spec['p99_ms'] / 1000
+            if not 0 < median <= p99:
+                raise ValueError("long_tail 지연시간은 0 < median_ms <= p99_ms 이어야 합니다")
+            mu = math.log(median)
+            return cls('long_tail', mu, (math.log(p99) - mu) / Z_99)
+        raise ValueError(f"알 수 없는 지연시간 분포: {kind} (사용 가능: {', '.join(LATENCY_TYPES)})")
+
+    def sample(self, rng):
+        if self.kind == 'fixed':
+            return self.a
+        if self.kind == 'normal':
+            return max(0.0, rng.gauss(self.a, self.b))
+        return rng.lognormvariate(self.a, self.b)
+
+
+class EndpointProfile:
+    """API 하나에 적용할 지연시간, 오류율, 대역폭"""
+    __slots__ = ('latency', 'error_rate', 'error_codes', 'bandwidth_bps')
+
+    def __init__(self, latency, error_rate=0.0, error_codes=None, bandwidth_bps=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_codes = error_codes
+        self.bandwidth_bps = bandwidth_bps
+
+    @classmethod
+    def from_spec(cls, spec, base=None):
+        """spec에 없는 항목은 base(기본 프로필)에서 물려받는다"""
+        base = base or cls(LatencyModel.from_spec(None))
+        error_rate = spec.get('error_rate', base.error_rate)
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"error_rate는 0~1 사이여야 합니다: {error_rate}")
+        kbps = spec.get('bandwidth_kbps')
+        error_codes = base.error_codes
+        if 'error_codes' in spec:
+            # null이면 문서에 적힌 non-2xx 코드 전체에서 고른다
+            error_codes = tuple(spec['error_codes']) if spec['error_codes'] is not None else None
+        return cls(
+            latency=LatencyModel.from_spec(spec['latency']) if 'latency' in spec else base.latency,
+            error_rate=error_rate,
+            error_codes=error_codes,
+            bandwidth_bps=kbps * 1000 / 8 if kbps else base.bandwidth_bps,
+        )
+
+
+class Profile:
+    """이름 붙은 프로필 하나: 기본값 + API ID별 재정의"""
+
+    def __init__(self, name, spec, catalog):
+        self.name = name
+        self.default = EndpointProfile.from_spec(spec.get('default', {}))
+        self.endpoints = {}
+        for key, endpoint_spec in spec.get('endpoints', {}).items():
+            endpoint = catalog.resolve(key)
+            self.endpoints[endpoint.id] = EndpointProfile.from_spec(endpoint_spec, self.default)
+
+    def for_endpoint(self, api_id):
+        return self.endpoints.get(api_id, self.default)
+
+
+class Plan:
+    """요청 하나에 대한 주입 결정"""
+    __slots__ = ('delay', 'error_code', 'bandwidth_bps')
+
+    def __init__(self, delay, error_code, bandwidth_bps):
+        self.delay = delay
+        self.error_code = error_code
+        self.bandwidth_bps = bandwidth_bps
+
+
+class ProfileSet:
+    """프로필 파일에서 읽은 프로필 모음 - 실행 중 전환(switch)과 다시 읽기(reload) 지원"""
+
+    def __init__(self, path, catalog, seed=None):
+        self.path = path
+        self.catalog = catalog
+        self.rng = random.Random(seed)
+        self.profiles = {}
+        self.active = None
+        self.reload()
+
+    def reload(self):
+        """프로필 파일을 다시 읽는다 (현재 활성 프로필이 남아 있으면 유지)"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        profiles = {name: Profile(name, spec, self.catalog)
+                    for name, spec in data.get('profiles', {}).items()}
+        if not profiles:
+            raise ValueError(f"프로필이 하나도 없습니다: {self.path}")
+        previous = self.active.name if self.active else None
+        name = previous if previous in profiles else data.get('active') or next(iter(profiles))
+        if name not in profiles:
+            raise ValueError(f"활성 프로필이 정의되어 있지 않습니다: {name}")
+        self.profiles = profiles
+        self.active = profiles[name]
+
+    def switch(self, name):
+        if name not in self.profiles:
+            raise KeyError(name)
+        self.active = self.profiles[name]
+
+    def upload_rate(self, api_id):
+        """요청 본문 수신 속도 제한 (bytes/s), 없으면 None"""
+        return self.active.for_endpoint(api_id).bandwidth_bps
+
+    def plan(self, api_id, error_codes):
+        """지연시간, 주입할 오류 코드(없으면 None), 응답 전송 대역폭 결정
+
+        error_codes는 이 API 문서에 적힌 non-2xx 코드 목록.
+        """
+        profile = self.active.for_endpoint(api_id)
+        error_code = None
+        if profile.error_rate and self.rng.random() < profile.error_rate:
+            candidates = [c for c in error_codes if profile.error_codes is None or c in profile.error_codes]
+            if candidates:
+                error_code = self.rng.choice(candidates)
+        return Plan(profile.latency.sample(self.rng), error_code, profile.bandwidth_bps)
+
+    def describe(self):
+        return {"active": self.active.name, "profiles": sorted(self.profiles), "path": self.path}
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 카탈로그 기반 로컬 목(mock) 백엔드
+API_DATA의 모든 API를 문서에 적힌 2xx 응답 예시(status_codes[].body)로 응답한다.
+백엔드, 모델 서버, DB 없이 wedding-vue 프론트엔드(VITE_API_BASE_URL=http://localhost:8101/api)나
+부하 테스트를 돌릴 수 있다.
+
+응답은 시작할 때 상태 줄/헤더/본문까지 bytes로 한 번만 직렬화해 두고, 요청마다 그대로 전송한다.
+
+--profiles로 프로필 파일(mock_profiles.py 참고)을 주면 API별 지연시간, 오류, 업로드 대역폭 제한을 주입한다.
+실행 중 프로필 전환/다시 읽기:
+    curl localhost:8101/__mock/profile                       # 현재 프로필
+    curl -X PUT localhost:8101/__mock/profile/degraded       # 프로필 전환
+    curl -X POST localhost:8101/__mock/profile/reload        # 파일 다시 읽기 (SIGHUP도 동일)
+
+사용법:
+    python mock_server.py                 # 127.0.0.1:8101
+    python mock_server.py --host 0.0.0.0 --port 8101
+    python mock_server.py --profiles mock_profiles.example.json --profile degraded
+    python mock_server.py --validate      # 문서와 맞지 않는 요청은 422 (request_validator.py)
+    python mock_server.py --vector-index vector_posts/   # 게시글 벡터 검색/통계를 로컬 인덱스로 응답 (vector_index.py)
+"""
+
+import argparse
+import asyncio
+import json
+import signal
+from collections import deque
+from http import HTTPStatus
+from urllib.parse import unquote
+
+from api_catalog import load_catalog
+from mock_profiles import ProfileSet
+from request_validator import RequestValidator, error_body
+from route_trie import split_target
+
+DEFAULT_PORT = 8101
+
+# 요청 헤더 최대 크기 - 넘으면 431로 끊는다
+MAX_HEADER_SIZE = 64 * 1024
+
+# 프로필 관리용 경로 (카탈로그 API와 겹치지 않도록 /api 밖에 둔다)
+ADMIN_PREFIX = '/__mock/profile'
+
+# 대역폭 제한 시 한 번에 보내는 시간 단위 (초)
+THROTTLE_TICK = 0.05
+
+CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', 'GET, POST, PUT, PATCH, DELETE, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Authorization, Content-Type'),
+    ('Access-Control-Max-Age', '600'),
+)
+
+
+def build_response(code, body=b'', content_type='application/json', headers=()):
+    """상태 줄 + 헤더 + 본문을 한 번에 직렬화한 HTTP/1.1 응답 bytes"""
+    lines = [f"HTTP/1.1 {code} {HTTPStatus(code).phrase}",
+             f"Content-Type: {content_type}",
+             f"Content-Length: {len(body)}",
+             "Server: wedding-os-mock"]
+    lines.extend(f"{name}: {value}" for name, value in CORS_HEADERS)
+    lines.extend(f"{name}: {value}" for name, value in headers)
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def head_only(response):
+    """HEAD 응답: 헤더(실제 Content-Length 포함)만 남기고 본문은 뺀다"""
+    return response[:response.index(b'\r\n\r\n') + 4]
+
+
+def json_response(code, body):
+    return build_response(code, json.dumps(body, ensure_ascii=False).encode('utf-8'))
+
+
+def encode_example(endpoint, status):
+    """문서의 응답 예시 하나를 (Content-Type, 본문 bytes)로 변환"""
+    body = status.get('body')
+    if 'NDJSON' in (endpoint.response or '') and 200 <= status['code'] < 300:
+        # 스트리밍 API는 예시 청크를 NDJSON 한 줄로 보낸다
+        return 'application/x-ndjson', json.dumps(body, ensure_ascii=False).encode('utf-8') + b'\n'
+    if isinstance(body, str):
+        return 'text/plain; charset=utf-8', body.encode('utf-8')
+    return 'application/json', json.dumps(body, ensure_ascii=False).encode('utf-8')
+
+
+class CannedEndpoint:
+    """API 하나의 미리 직렬화된 응답들"""
+    __slots__ = ('endpoint', 'success', 'unauthorized', 'by_code', 'error_codes')
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.by_code = {}
+        for status in endpoint.status_codes:
+            content_type, body = encode_example(endpoint, status)
+            # 같은 코드의 예시가 여러 개면 문서에 먼저 나온 것을 쓴다
+            self.by_code.setdefault(status['code'], build_response(status['code'], body, content_type))
+        success_codes = sorted(code for code in self.by_code if 200 <= code < 300)
+        self.success = (self.by_code[success_codes[0]] if success_codes
+                        else json_response(200, {"message": "ok", "data": None}))
+        self.unauthorized = self.by_code.get(401) or json_response(
+            401, {"message": "unauthorized", "data": None})
+        self.error_codes = tuple(sorted(code for code in self.by_code if code >= 300))
+
+
+class MockApp:
+    """요청 (메서드, 대상, 헤더, 본문) -> 미리 만든 응답 bytes
+
+    validator(RequestValidator)를 주면 인증 확인 뒤 파라미터/본문을 검사해 맞지 않으면 422로 응답한다.
+    handlers({API ID: (경로 파라미터, 쿼리스트링, 본문) -> (상태 코드, 응답 dict)})에 있는 API는
+    예시 응답 대신 요청마다 handler가 만든 응답을 보낸다.
+    """
+
+    def __init__(self, catalog=None, check_auth=True, profiles=None, validator=None, handlers=None):
+        self.catalog = catalog or load_catalog()
+        self.router = self.catalog.router
+        self.check_auth = check_auth
+        self.profiles = profiles
+        self.validator = validator
+        self.handlers = handlers or {}
+        self.canned = {endpoint.id: CannedEndpoint(endpoint) for endpoint in self.catalog}
+        self.not_found = json_response(404, {"message": "not_found", "data": None})
+        self.preflight = build_response(204, content_type='text/plain')
+        self.requests = 0
+
+    def resolve(self, method, target, headers, body=b''):
+        """요청에 대한 (API ID 또는 None, 응답 bytes)"""
+        self.requests += 1
+        path, query = split_target(target)
+        if method == 'OPTIONS':
+            return None, self.preflight
+        if path.startswith(ADMIN_PREFIX):
+            return None, self.admin(method, path)
+        match = self.router.match(method, path)
+        if match is None:
+            allowed = self.router.allowed_methods(path)
+            if allowed:
+                return None, build_response(
+                    405, json.dumps({"message": "method_not_allowed", "data": None}).encode(),
+                    headers=(('Allow', ', '.join(allowed)),))
+            return None, self.not_found
+        canned = self.canned[match.endpoint.id]
+        if self.check_auth and match.endpoint.auth and 'authorization' not in headers:
+            return match.endpoint.id, canned.unauthorized
+        if self.validator is not None:
+            errors = self.validator.validate(match.endpoint, match.params, query, body,
+                                             headers.get('content-type', ''))
+            if errors:
+                return match.endpoint.id, json_response(422, error_body(errors))
+        handler = self.handlers.get(match.endpoint.id)
+        if handler is not None:
+            return match.endpoint.id, json_response(*handler(match.params, query, body))
+        return match.endpoint.id, canned.success
+
+    def upload_rate(self, method, target):
+        """요청 본문 수신 속도 제한 (bytes/s), 없으면 None"""
+        match = self.router.match(method, split_target(target)[0])
+        if match is None or self.profiles is None:
+            return None
+        return self.profiles.upload_rate(match.endpoint.id)
+
+    def admin(self, method, path):
+        """프로필 조회(GET), 전환(PUT /<name>), 다시 읽기(POST /reload)"""
+        if self.profiles is None:
+            return self.not_found
+        name = unquote(path[len(ADMIN_PREFIX):].strip('/'))
+        try:
+            if method == 'POST' and name == 'reload':
+                self.profiles.reload()
+            elif method == 'PUT' and name:
+                self.profiles.switch(name)
+            elif method != 'GET' or name:
+                return self.not_found
+        except KeyError:
+            return json_response(404, {"message": "profile_not_found", "data": {"name": name}})
+        except (OSError, ValueError) as exc:
+            return json_response(400, {"message": "profile_load_failed", "data": {"error": str(exc)}})
+        return json_response(200, {"message": "mock_profile", "data": self.profiles.describe()})
+
+
+class Request:
+    __slots__ = ('method', 'target', 'headers', 'body', 'keep_alive', 'upload_done')
+
+    def __init__(self, method, target, headers, body, keep_alive, upload_done=None):
+        self.method = method
+        self.target = target
+        self.headers = headers
+        self.body = body
+        self.keep_alive = keep_alive
+        self.upload_done = upload_done  # 업로드 대역폭 제한 시 본문 수신이 끝났어야 할 시각
+
+
+class HttpProtocol(asyncio.Protocol):
+    """최소한의 HTTP/1.1 서버 프로토콜 (keep-alive, 파이프라이닝, Content-Length 본문 지원)"""
+
+    def __init__(self, app):
+        self.app = app
+        self.transport = None
+        self.buffer = bytearray()
+        # 프로필 주입 시 응답 순서를 지키기 위한 대기열과 전송 태스크
+        self.outbox = deque()
+        self.writer = None
+        self.upload_rate = None
+        self.upload_started = None
+        self.continue_sent = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.buffer += data
+        if self.upload_rate:
+            # 업로드 대역폭 제한: 받은 만큼의 시간 동안 소켓 읽기를 멈춘다
+            self.transport.pause_reading()
+            asyncio.get_running_loop().call_later(len(data) / self.upload_rate, self._resume_reading)
+        while self.transport is not None:
+            request = self._parse_request()
+            if request is None:
+                return
+            self.handle(request)
+
+    def _parse_request(self):
+        """버퍼에서 완성된 요청 하나를 꺼내 Request로 반환, 아직 덜 왔으면 None"""
+        end = self.buffer.find(b'\r\n\r\n')
+        if end < 0:
+            if len(self.buffer) > MAX_HEADER_SIZE:
+                self._fail(431)
+            return None
+        head = bytes(self.buffer[:end]).decode('latin-1')
+        request_line, *header_lines = head.split('\r\n')
+        parts = request_line.split(' ')
+        if len(parts) != 3:
+            self._fail(400)
+            return None
+        method, target, version = parts
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            self._fail(411)
+            return None
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            self._fail(400)
+            return None
+        total = end + 4 + length
+        rate = None
+        if length and self.app.profiles is not None:
+            rate = self.app.upload_rate(method, target)
+        if rate and self.upload_started is None:
+            self.upload_started = asyncio.get_running_loop().time()
+        if len(self.buffer) < total:
+            self.upload_rate = rate
+            if not self.continue_sent and headers.get('expect', '').lower() == '100-continue':
+                self.transport.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+                self.continue_sent = True
+            return None
+        self.continue_sent = False
+        # 본문이 한 번에 다 들어와도 제한된 대역폭으로 받았을 시각까지는 응답하지 않는다
+        upload_done = self.upload_started + length / rate if rate else None
+        self.upload_rate = None
+        self.upload_started = None
+        body = bytes(self.buffer[end + 4:total])
+        del self.buffer[:total]
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+        return Request(method.upper(), target, headers, body, keep_alive, upload_done)
+
+    def handle(self, request):
+        api_id, response = self.app.resolve(request.method, request.target, request.headers, request.body)
+        profiles = self.app.profiles
+        head = request.method == 'HEAD'
+        if (profiles is None or api_id is None) and not self.outbox:
+            self.transport.write(head_only(response) if head else response)
+            if not request.keep_alive:
+                self.transport.close()
+                self.transport = None
+            return
+        delay, rate = 0.0, None
+        if profiles is not None and api_id is not None:
+            canned = self.app.canned[api_id]
+            plan = profiles.plan(api_id, canned.error_codes)
+            if plan.error_code is not None:
+                response = canned.by_code[plan.error_code]
+            delay, rate = plan.delay, plan.bandwidth_bps
+        if head:
+            # 본문을 보내면 keep-alive/파이프라이닝 연결에서 다음 응답의 시작으로 읽힌다
+            response = head_only(response)
+        loop = asyncio.get_running_loop()
+        due = max(loop.time(), request.upload_done or 0) + delay
+        self.outbox.append((due, response, rate, request.keep_alive))
+        if self.writer is None:
+            self.writer = loop.create_task(self._drain_outbox())
+
+    async def _drain_outbox(self):
+        """지연시간이 지난 응답부터 요청 순서대로 전송 (HTTP/1.1 파이프라이닝 순서 보장)"""
+        loop = asyncio.get_running_loop()
+        try:
+            while self.outbox and self.transport is not None:
+                due, response, rate, keep_alive = self.outbox.popleft()
+                wait = due - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                if self.transport is None:
+                    break
+                if rate:
+                    await self._write_throttled(response, rate)
+                else:
+                    self.transport.write(response)
+                if not keep_alive and self.transport is not None:
+                    self.transport.close()
+                    self.transport = None
+        finally:
+            self.writer = None
+
+    async def _write_throttled(self, response, rate):
+        chunk_size = max(1024, int(rate * THROTTLE_TICK))
+        view = memoryview(response)
+        for offset in range(0, len(view), chunk_size):
+            if self.transport is None:
+                return
+            chunk = view[offset:offset + chunk_size]
+            self.transport.write(chunk)
+            await asyncio.sleep(len(chunk) / rate)
+
+    def _resume_reading(self):
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.resume_reading()
+
+    def _fail(self, code):
+        self.transport.write(build_response(code, b'', 'text/plain', (('Connection', 'close'),)))
+        self.transport.close()
+        self.transport = None
+
+    def connection_lost(self, exc):
+        self.transport = None
+        self.outbox.clear()
+
+
+def install_uvloop():
+    """uvloop이 설치되어 있으면 이벤트 루프로 사용 (선택 사항)"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def reload_profiles(profiles):
+    try:
+        profiles.reload()
+        print(f"프로필 다시 읽기 완료: {profiles.active.name}")
+    except (OSError, ValueError) as exc:
+        print(f"⚠️ 프로필 다시 읽기 실패 (기존 프로필 유지): {exc}")
+
+
+async def serve(app, host, port, protocol_factory=None):
+    loop = asyncio.get_running_loop()
+    factory = protocol_factory or (lambda: HttpProtocol(app))
+    server = await loop.create_server(factory, host, port, reuse_address=True, backlog=1024)
+    if app.profiles is not None and hasattr(signal, 'SIGHUP'):
+        loop.add_signal_handler(signal.SIGHUP, reload_profiles, app.profiles)
+    print(f"✅ 목 서버 실행 중: http://{host}:{port}/api (API {len(app.canned)}개)")
+    if app.profiles is not None:
+        print(f"   주입 프로필: {app.profiles.active.name} ({app.profiles.path})")
+    async with server:
+        await server.serve_forever()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="API 카탈로그 기반 로컬 목 백엔드")
+    parser.add_argument('--host', default='127.0.0.1', help="바인딩 주소 (기본값: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f"포트 (기본값: {DEFAULT_PORT})")
+    parser.add_argument('--no-auth-check', action='store_true',
+                        help="인증 필요 API도 Authorization 헤더 없이 2xx로 응답")
+    parser.add_argument('--profiles', metavar='JSON',
+                        help="지연시간/오류/대역폭 주입 프로필 파일 (예: mock_profiles.example.json)")
+    parser.add_argument('--profile', help="시작할 때 사용할 프로필 이름 (기본값: 파일의 active)")
+    parser.add_argument('--seed', type=int, help="주입 난수 시드 (재현용)")
+    parser.add_argument('--validate', action='store_true',
+                        help="요청 파라미터/본문을 API 명세로 검사해 맞지 않으면 422로 응답")
+    parser.add_argument('--vector-index', metavar='DIR',
+                        help="게시글 벡터 검색/통계 API를 vector_index.py로 저장한 인덱스로 응답 (NumPy 필요)")
+    parser.add_argument('--no-uvloop', action='store_true', help="uvloop이 있어도 기본 이벤트 루프 사용")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not args.no_uvloop and install_uvloop():
+        print("uvloop 이벤트 루프 사용")
+    catalog = load_catalog()
+    profiles = None
+    if args.profiles:
+        profiles = ProfileSet(args.profiles, catalog, seed=args.seed)
+        if args.profile:
+            profiles.switch(args.profile)
+    validator = RequestValidator(catalog) if args.validate else None
+    handlers = {}
+    if args.vector_index:
+        from vector_index import PostSearchApi, VectorIndex
+        index = VectorIndex.load(args.vector_index)
+        handlers.update(PostSearchApi(index, catalog).handlers())
+        print(f"게시글 벡터 인덱스 {len(index):,}건 사용: {args.vector_index}")
+    app = MockApp(catalog, check_auth=not args.no_auth_check, profiles=profiles, validator=validator,
+                  handlers=handlers)
+    try:
+        asyncio.run(serve(app, args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\n목 서버 종료 (처리한 요청 {app.requests}건)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 카탈로그 -> OpenAPI 3.1 명세 내보내기
+코드 생성기나 API 게이트웨이 설정에 쓸 수 있도록 api_data.json의 각 API를 OpenAPI operation으로 바꾼다.
+
+- 경로/쿼리 파라미터, 헤더(Content-Type 제외), 요청 본문(body, body_required), 응답 코드별 예시를 옮긴다
+- 요청/응답 모델 이름(request, response)은 components.schemas로, 응답 스키마는 예시 값에서 추론한다
+- {"message", "data": null} 오류 응답은 ErrorResponse 스키마 하나를 참조하고,
+  여러 API에 똑같이 나오는 응답(500 서버 오류 등)은 components.responses에 한 번만 넣는다
+- "string (YYYY-MM-DD) | null" 같은 타입 문자열은 JSON Schema로 한 번만 변환해 캐시한다
+
+같은 카탈로그면 항상 같은 파일이 나오므로 커밋마다 --check로 최신인지 확인할 수 있다.
+
+사용법:
+    python openapi_export.py                    # openapi.json 생성
+    python openapi_export.py -o build/openapi.json --server https://api.example.com
+    python openapi_export.py --check            # openapi.json이 카탈로그와 다르면 종료 코드 1
+"""
+
+import argparse
+import json
+import re
+import sys
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from api_catalog import API_DATA_PATH, load_catalog
+
+OPENAPI_VERSION = '3.1.0'
+DEFAULT_OUTPUT = 'openapi.json'
+DEFAULT_TITLE = 'Wedding OS API'
+DEFAULT_VERSION = '0.1.0'
+
+JSON_MEDIA_TYPE = 'application/json'
+MULTIPART_MEDIA_TYPE = 'multipart/form-data'
+
+SECURITY_SCHEME = 'bearerAuth'
+ERROR_SCHEMA = 'ErrorResponse'
+
+# OpenAPI가 파라미터로 허용하지 않는 헤더 (요청 본문 미디어 타입/보안 스킴으로 표현됨)
+IGNORED_HEADERS = frozenset({'content-type', 'accept', 'authorization'})
+
+PARAM_TYPES = {'integer': 'integer', 'string': 'string', 'boolean': 'boolean', 'float': 'number',
+               'number': 'number'}
+
+FIELD_TYPES = {'string': 'string', 'integer': 'integer', 'number': 'number', 'float': 'number',
+               'boolean': 'boolean', 'object': 'object', 'array': 'array'}
+
+BASE_TYPE_RE = re.compile(r'\s*(array\[(\w+)\]|\w+)', re.IGNORECASE)
+NULLABLE_RE = re.compile(r'\|\s*null\b', re.IGNORECASE)
+PAREN_RE = re.compile(r'\(([^()]*)\)')
+DEFAULT_RE = re.compile(r"기본값:\s*'?([^',]+?)'?\s*$")
+ENUM_RE = re.compile(r'[A-Z_]+(?:\s*[|,]\s*[A-Z_]+)+')
+MAX_LENGTH_RE = re.compile(r'max\s+(\d+)', re.IGNORECASE)
+RANGE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)')
+# 쉼표로 나눈 식별자 목록 (각 항목 뒤에 ": 설명"이 붙어도 된다)
+PARAM_ENUM_RE = re.compile(r'\w+(?::[^,]*)?(?:\s*,\s*\w+(?::[^,]*)?)+', re.ASCII)
+MEDIA_TYPE_RE = re.compile(r'^[a-z]+/[\w.+-]+$')
+COMPONENT_NAME_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+
+def _coerce(raw, json_type):
+    """문서에 문자열로 적힌 기본값을 JSON 타입에 맞게 변환"""
+    if json_type == 'boolean':
+        return raw.lower() == 'true'
+    if json_type in ('integer', 'number'):
+        try:
+            return float(raw) if '.' in raw or json_type == 'number' else int(raw)
+        except ValueError:
+            return raw
+    return raw
+
+
+@lru_cache(maxsize=None)
+def _field_schema(type_text):
+    base = BASE_TYPE_RE.match(type_text)
+    word = base.group(1).lower() if base else 'string'
+    notes = []
+    media_types = []
+    if word == 'file':
+        schema = {"type": "string", "contentMediaType": "application/octet-stream"}
+    elif base and base.group(2):
+        schema = {"type": "array", "items": {"type": FIELD_TYPES.get(base.group(2).lower(), 'string')}}
+    else:
+        schema = {"type": FIELD_TYPES.get(word, 'string')}
+    json_type = schema["type"]
+
+    for note in PAREN_RE.findall(type_text):
+        parts = [part.strip() for part in note.split(',')]
+        if word == 'file':
+            media_types.extend(part for part in parts if MEDIA_TYPE_RE.match(part) and part != MULTIPART_MEDIA_TYPE)
+            parts = [part for part in parts if not MEDIA_TYPE_RE.match(part)]
+        else:
+            default = DEFAULT_RE.search(note)
+            if default:
+                schema["default"] = _coerce(default.group(1).strip(), json_type)
+                parts = [part for part in parts if '기본값' not in part]
+            if ENUM_RE.fullmatch(note.strip()):
+                schema["enum"] = re.split(r'\s*[|,]\s*', note.strip())
+                continue
+        for part in parts:
+            lowered = part.lower()
+            if lowered == 'yyyy-mm-dd':
+                schema["format"] = "date"
+            elif lowered == 'hh:mm':
+                schema["pattern"] = r'^\d{2}:\d{2}$'
+            elif lowered == 'httpurl':
+                schema["format"] = "uri"
+            elif 'base64' in lowered:
+                schema["contentEncoding"] = "base64"
+            elif MAX_LENGTH_RE.match(part):
+                schema["maxLength"] = int(MAX_LENGTH_RE.match(part).group(1))
+            elif part and lowered not in ('float', 'multipart/form-data'):
+                notes.append(part)
+
+    if NULLABLE_RE.search(type_text):
+        schema["type"] = [json_type, "null"]
+        if "enum" in schema:
+            schema["enum"] = schema["enum"] + [None]
+    if notes:
+        schema["description"] = ', '.join(notes)
+    return schema, tuple(media_types)
+
+
+def field_schema(type_text):
+    """본문 필드 타입 문자열 -> (JSON Schema, 파일 필드의 허용 MIME 타입 튜플)
+
+    "string (YYYY-MM-DD) | null" -> {"type": ["string", "null"], "format": "date"}
+    "File (multipart/form-data, image/jpeg, image/png)" -> 파일 스키마, ("image/jpeg", "image/png")
+    같은 문자열은 한 번만 변환한다 (반환값은 공유되므로 수정하지 말 것).
+    """
+    return _field_schema(str(type_text))
+
+
+def param_schema(param):
+    """쿼리/경로 파라미터 -> JSON Schema
+
+    설명에 적힌 제약도 옮긴다: "(1-20)" -> minimum/maximum, "(YYYY-MM-DD)" -> format date,
+    "(score_desc, price_asc)" / "(couple: 예비부부 게시판, planner: 플래너 리뷰)" -> enum
+    """
+    json_type = PARAM_TYPES.get(str(param.get('type', 'String')).lower(), 'string')
+    schema = {"type": json_type}
+    default = param.get('default')
+    if default not in (None, '-', ''):
+        schema["default"] = _coerce(str(default), json_type) if isinstance(default, str) else default
+    for note in PAREN_RE.findall(str(param.get('description') or '')):
+        note = note.strip()
+        bounds = RANGE_RE.fullmatch(note)
+        if bounds and json_type in ('integer', 'number'):
+            schema["minimum"], schema["maximum"] = (_coerce(bound, json_type) for bound in bounds.groups())
+        elif note.upper() == 'YYYY-MM-DD' and json_type == 'string':
+            schema["format"] = "date"
+        elif json_type == 'string' and PARAM_ENUM_RE.fullmatch(note):
+            schema["enum"] = [choice.split(':')[0].strip() for choice in note.split(',')]
+    return schema
+
+
+def example_schema(value):
+    """응답 예시 값에서 추론한 JSON Schema (배열은 첫 원소 기준)"""
+    if value is None:
+        return {"type": "null"}
+    if isinstance(value, bool):
+        return {"type": "boolean"}
+    if isinstance(value, int):
+        return {"type": "integer"}
+    if isinstance(value, float):
+        return {"type": "number"}
+    if isinstance(value, str):
+        return {"type": "string"}
+    if isinstance(value, list):
+        return {"type": "array", "items": example_schema(value[0])} if value else {"type": "array"}
+    return {"type": "object", "properties": {key: example_schema(item) for key, item in value.items()}}
+
+
+def component_name(text):
+    """모델 이름을 components 키로 쓸 수 있는 형태로 ("StreamingResponse (NDJSON)" -> "StreamingResponse")"""
+    return COMPONENT_NAME_RE.sub('', PAREN_RE.sub('', str(text)).strip().replace(' ', '_'))
+
+
+def _camel(text):
+    return ''.join(part[:1].upper() + part[1:] for part in re.split(r'[^A-Za-z0-9]+', text) if part)
+
+
+def _ref(section, name):
+    return {"$ref": f"#/components/{section}/{name}"}
+
+
+def _canonical(obj):
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+class Components:
+    """이름 -> 스키마/응답 등록부 (같은 이름에 다른 내용이 오면 이름 뒤에 API ID를 붙인다)"""
+
+    def __init__(self):
+        self.schemas = {}
+        self.responses = {}
+        self._keys = {}
+
+    def add_schema(self, name, schema, api_id):
+        """스키마 등록 후 참조 반환"""
+        key = _canonical(schema)
+        existing = self.schemas.get(name)
+        if existing is not None and self._keys[('schemas', name)] != key:
+            name = f"{name}_{api_id.replace('.', '_')}"
+        self.schemas[name] = schema
+        self._keys[('schemas', name)] = key
+        return _ref('schemas', name)
+
+    def add_response(self, name, response):
+        """응답 등록 후 참조 반환 (내용이 같으면 같은 이름을 재사용)"""
+        key = _canonical(response)
+        existing = self._keys.get(('response', key))
+        if existing is not None:
+            return _ref('responses', existing)
+        candidate, counter = name, 2
+        while candidate in self.responses:
+            candidate, counter = f"{name}{counter}", counter + 1
+        self.responses[candidate] = response
+        self._keys[('response', key)] = candidate
+        return _ref('responses', candidate)
+
+
+def operation_id(endpoint):
+    """"GET /api/posts/{post_id}" -> "get_posts_post_id" (카탈로그가 메서드+경로 중복을 막으므로 유일)"""
+    segments = [segment.strip('{}') for segment in endpoint.path.split('/') if segment and segment != 'api']
+    words = [re.sub(r'\W+', '_', segment).strip('_') for segment in segments]
+    return '_'.join([endpoint.method.lower()] + [word for word in words if word])
+
+
+def _parameters(endpoint):
+    params = []
+    for location, items in (('path', endpoint.path_params), ('query', endpoint.query_params)):
+        for param in items:
+            entry = {"name": param['name'], "in": location}
+            if param.get('description'):
+                entry["description"] = param['description']
+            entry["required"] = True if location == 'path' else bool(param.get('required'))
+            entry["schema"] = param_schema(param)
+            params.append(entry)
+    for header in endpoint.headers:
+        if not isinstance(header, dict) or header.get('name', '').lower() in IGNORED_HEADERS:
+            continue
+        entry = {"name": header['name'], "in": "header", "required": bool(header.get('required'))}
+        if header.get('description'):
+            entry["description"] = header['description']
+        entry["schema"] = param_schema(header)
+        params.append(entry)
+    return params
+
+
+def _request_body(endpoint, components):
+    properties, encoding = {}, {}
+    for field, type_text in endpoint.body.items():
+        schema, media_types = field_schema(type_text)
+        properties[field] = schema
+        if media_types:
+            encoding[field] = {"contentType": ', '.join(media_types)}
+    schema = {"type": "object", "properties": properties}
+    required = [field for field in endpoint.body_required if field in properties]
+    if required:
+        schema["required"] = required
+    multipart = any(str(type_text).lower().startswith('file') for type_text in endpoint.body.values())
+    media = {"schema": schema}
+    if multipart:
+        if encoding:
+            media["encoding"] = encoding
+        # 업로드 폼은 API마다 필드가 달라 이름(MultipartFormData)이 겹치므로 인라인으로 둔다
+        return {"required": True, "content": {MULTIPART_MEDIA_TYPE: media}}
+    if endpoint.request:
+        media["schema"] = components.add_schema(component_name(endpoint.request), schema, endpoint.id)
+    return {"required": bool(required), "content": {JSON_MEDIA_TYPE: media}}
+
+
+def _response_content(endpoint, status, components):
+    body = status['body']
+    model = endpoint.response or ''
+    success = 200 <= status['code'] < 300
+    if isinstance(body, str):
+        media_type = 'application/pdf' if 'pdf' in model.lower() else 'application/octet-stream'
+        return {media_type: {"schema": {"type": "string", "contentMediaType": media_type, "description": body}}}
+    if 'ndjson' in model.lower():
+        # 줄마다 JSON 객체 하나 - 스키마는 한 줄 기준
+        schema = example_schema(body)
+        if success:
+            schema = components.add_schema(component_name(model), schema, endpoint.id)
+        return {"application/x-ndjson": {"schema": schema, "example": body}}
+    if isinstance(body, dict) and set(body) == {'message', 'data'}:
+        if body['data'] is None and not success:
+            schema = _ref('schemas', ERROR_SCHEMA)
+        else:
+            data = example_schema(body['data'])
+            if success and model:
+                data = components.add_schema(component_name(model), data, endpoint.id)
+            schema = {"type": "object", "required": ["message", "data"],
+                      "properties": {"message": {"type": "string"}, "data": data}}
+    else:
+        schema = example_schema(body)
+    return {JSON_MEDIA_TYPE: {"schema": schema, "example": body}}
+
+
+def _responses(endpoint, components, counts):
+    responses = {}
+    for status in endpoint.status_codes:
+        response = {"description": status.get('msg') or status.get('message') or str(status['code'])}
+        if status.get('body') is not None:
+            response["content"] = _response_content(endpoint, status, components)
+        # 여러 API에 똑같이 나오는 응답은 components.responses로
+        if counts.get(_canonical(response), 0) > 1:
+            name = _camel(status.get('message') or '') or f"Status{status['code']}"
+            response = components.add_response(name, response)
+        responses[str(status['code'])] = response
+    return responses
+
+
+def _response_counts(catalog):
+    """응답 객체별 등장 횟수 - 스키마 참조 전의 원본 (코드, 설명, 예시) 기준으로 센다"""
+    counts = {}
+    scratch = Components()
+    for endpoint in catalog:
+        for status in endpoint.status_codes:
+            response = {"description": status.get('msg') or status.get('message') or str(status['code'])}
+            if status.get('body') is not None:
+                response["content"] = _response_content(endpoint, status, scratch)
+            key = _canonical(response)
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def _server_url(base_url, catalog):
+    """API 경로에 이미 /api가 들어 있으므로 base_url에서 공통 접두어를 뺀다"""
+    parts = urlsplit(base_url)
+    prefix = parts.path.rstrip('/')
+    if prefix and all(endpoint.path.startswith(prefix + '/') for endpoint in catalog):
+        return f"{parts.scheme}://{parts.netloc}"
+    return base_url
+
+
+def build_openapi(catalog, title=DEFAULT_TITLE, version=DEFAULT_VERSION, server=None):
+    """ApiCatalog -> OpenAPI 3.1 문서 dict (경로 순서는 카탈로그의 ID 순서)"""
+    components = Components()
+    # 가장 먼저 등록해 이름을 선점한다 - 같은 이름의 카탈로그 모델은 add_schema가 API ID를 붙여 구분
+    components.add_schema(ERROR_SCHEMA, {
+        "type": "object",
+        "required": ["message", "data"],
+        "properties": {"message": {"type": "string"}, "data": {"type": "null"}},
+    }, api_id=None)
+    counts = _response_counts(catalog)
+    paths = {}
+    for endpoint in catalog:
+        section = catalog.section(endpoint.section_id)
+        operation = {
+            "operationId": operation_id(endpoint),
+            "summary": endpoint.name,
+            "tags": [section.name],
+            "x-api-id": endpoint.id,
+        }
+        if endpoint.description:
+            operation["description"] = endpoint.description
+        parameters = _parameters(endpoint)
+        if parameters:
+            operation["parameters"] = parameters
+        if endpoint.body:
+            operation["requestBody"] = _request_body(endpoint, components)
+        operation["responses"] = _responses(endpoint, components, counts)
+        if endpoint.auth:
+            operation["security"] = [{SECURITY_SCHEME: []}]
+        paths.setdefault(endpoint.path, {})[endpoint.method.lower()] = operation
+    return {
+        "openapi": OPENAPI_VERSION,
+        "info": {"title": title, "version": version},
+        "servers": [{"url": server or _server_url(catalog.base_url, catalog)}],
+        "tags": [{"name": section.name} for section in catalog.sections],
+        "paths": paths,
+        "components": {
+            "schemas": dict(sorted(components.schemas.items())),
+            "responses": dict(sorted(components.responses.items())),
+            "securitySchemes": {SECURITY_SCHEME: {"type": "http", "scheme": "bearer", "bearerFormat": "JWT"}},
+        },
+    }
+
+
+def dump_openapi(spec):
+    return json.dumps(spec, ensure_ascii=False, indent=2) + '\n'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="API 카탈로그 -> OpenAPI 3.1 명세")
+    parser.add_argument('--data', default=API_DATA_PATH, help="API 정의 JSON 파일 (기본값: api_data.json)")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                        help=f"출력 파일 (기본값: {DEFAULT_OUTPUT}, -면 표준 출력)")
+    parser.add_argument('--title', default=DEFAULT_TITLE, help=f"info.title (기본값: {DEFAULT_TITLE})")
+    parser.add_argument('--version', default=DEFAULT_VERSION, help=f"info.version (기본값: {DEFAULT_VERSION})")
+    parser.add_argument('--server', help="servers[0].url (기본값: 카탈로그 base_url에서 경로 접두어를 뺀 주소)")
+    parser.add_argument('--check', action='store_true',
+                        help="파일을 쓰지 않고 기존 출력 파일이 최신인지 확인 (다르면 종료 코드 1)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    catalog = load_catalog(args.data)
+    spec = build_openapi(catalog, title=args.title, version=args.version, server=args.server)
+    text = dump_openapi(spec)
+    if args.check:
+        try:
+            with open(args.output, 'r', encoding='utf-8') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != text:
+            print(f"⚠️ {args.output}이(가) 카탈로그와 다릅니다 - python openapi_export.py로 다시 생성하세요")
+            return 1
+        print(f"✅ {args.output} 최신 상태")
+        return 0
+    if args.output == '-':
+        sys.stdout.write(text)
+        return 0
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(text)
+    components = spec['components']
+    print(f"✅ OpenAPI {OPENAPI_VERSION} 명세 생성 완료: {args.output} "
+          f"(API {len(catalog)}개, 스키마 {len(components['schemas'])}개, 공유 응답 {len(components['responses'])}개, "
+          f"{len(text.encode('utf-8')):,} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 카탈로그 기반 요청 검증기
+API마다 경로/쿼리 파라미터(type, required, 설명의 "(1-20)" 같은 제약)와 본문(body, body_required,
+"string (YYYY-MM-DD) | null" 같은 타입 문자열)을 검사하는 파이썬 함수 소스를 만들어 한 번 컴파일한다.
+요청마다 스키마를 해석하지 않고 API별로 펼쳐진 비교문만 실행하므로 요청당 수 µs 안에 끝난다.
+
+게이트웨이나 목 서버(mock_server.py --validate)가 백엔드 앞에서 잘못된 요청을 422로 돌려보낼 수 있다.
+FastAPI/pydantic이 받아들이는 요청을 거절하지 않도록 타입 검사는 pydantic의 lax 모드 변환 규칙을 따른다
+(정수 필드에 "3", 3.0, true 허용 / 문자열 필드에는 문자열만). 문서에 없는 필드는 무시한다.
+스키마(타입 문자열 해석, 설명의 제약)는 openapi_export와 같은 것을 쓴다.
+
+사용법:
+    python request_validator.py --dump 10.1           # API 10.1의 생성된 검증 함수 출력
+    python request_validator.py --bench               # 부하 테스트 요청 틀로 오탐 확인 + 요청당 시간 측정
+"""
+
+import argparse
+import json
+import re
+import time
+from datetime import date
+from urllib.parse import parse_qsl
+
+from api_catalog import load_catalog
+from openapi_export import MULTIPART_MEDIA_TYPE, field_schema, param_schema
+from route_trie import split_target
+
+INVALID_REQUEST = 'invalid_request'
+
+# pydantic lax 모드에서 bool로 받아들이는 문자열
+BOOL_STRINGS = frozenset({'0', 'off', 'f', 'false', 'n', 'no', '1', 'on', 't', 'true', 'y', 'yes'})
+
+INT_STRING_RE = re.compile(r'\s*[+-]?\d+\s*')
+
+
+def _lax_int(value):
+    """pydantic lax 모드의 int 허용 여부 (bool, 소수부 없는 float, 정수 문자열)"""
+    if type(value) is bool:
+        return True
+    if type(value) is float:
+        return value.is_integer()
+    return type(value) is str and INT_STRING_RE.fullmatch(value) is not None
+
+
+def _lax_number(value):
+    if type(value) in (int, float, bool):
+        return True
+    if type(value) is str:
+        try:
+            float(value)
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+def _lax_bool(value):
+    if type(value) is int:
+        return value in (0, 1)
+    return type(value) is str and value.lower() in BOOL_STRINGS
+
+
+def _is_date(value):
+    try:
+        date.fromisoformat(value)
+        return len(value) == 10
+    except ValueError:
+        return False
+
+
+def _parse_query(query):
+    """쿼리스트링 -> dict (같은 이름이 여러 번이면 마지막 값, FastAPI와 같음)"""
+    return dict(parse_qsl(query, keep_blank_values=True))
+
+
+# 생성된 코드가 쓰는 이름들
+_RUNTIME = {
+    '_lax_int': _lax_int,
+    '_lax_number': _lax_number,
+    '_lax_bool': _lax_bool,
+    '_is_date': _is_date,
+    '_loads': json.loads,
+    '_MISSING': object(),
+}
+
+
+class _FunctionBuilder:
+    """검증 함수 하나의 소스 작성기"""
+
+    def __init__(self, constants):
+        self.lines = []
+        self.level = 1
+        self.constants = constants
+
+    def emit(self, line):
+        self.lines.append('    ' * self.level + line)
+
+    def const(self, value):
+        """값을 모듈 상수로 등록하고 이름 반환 (같은 값은 같은 이름)"""
+        key = repr(value)
+        entry = self.constants.get(key)
+        if entry is None:
+            entry = self.constants[key] = (f"_C{len(self.constants)}", value)
+        return entry[0]
+
+    def error(self, loc, msg):
+        self.emit(f"errors.append({{'loc': {list(loc)!r}, 'msg': {msg!r}}})")
+
+    def block(self, header):
+        self.emit(header)
+        self.level += 1
+
+    def end(self):
+        self.level -= 1
+
+
+def _emit_string_checks(fb, schema, loc):
+    """value가 str로 확인된 뒤의 검사 (형식, 길이, enum)"""
+    fmt = schema.get('format')
+    if fmt == 'date':
+        fb.block("if not _is_date(value):")
+        fb.error(loc, "YYYY-MM-DD 형식의 날짜여야 합니다")
+        fb.end()
+    elif fmt == 'uri':
+        fb.block("if not value.startswith(('http://', 'https://')):")
+        fb.error(loc, "http(s) URL이어야 합니다")
+        fb.end()
+    if 'pattern' in schema:
+        fb.block(f"if {fb.const(re.compile(schema['pattern']))}.match(value) is None:")
+        fb.error(loc, f"형식이 맞지 않습니다 ({schema['pattern']})")
+        fb.end()
+    if 'maxLength' in schema:
+        fb.block(f"if len(value) > {schema['maxLength']}:")
+        fb.error(loc, f"{schema['maxLength']}자 이하여야 합니다")
+        fb.end()
+    choices = [choice for choice in schema.get('enum', ()) if choice is not None]
+    if choices:
+        fb.block(f"if value not in {fb.const(frozenset(choices))}:")
+        fb.error(loc, f"다음 중 하나여야 합니다: {', '.join(choices)}")
+        fb.end()
+
+
+def _emit_value_check(fb, schema, loc):
+    """JSON 본문 값 value 검사 (None은 호출자가 처리)"""
+    json_type = schema['type'][0] if isinstance(schema['type'], list) else schema['type']
+    if json_type == 'string':
+        fb.block("if type(value) is not str:")
+        fb.error(loc, "문자열이어야 합니다")
+        fb.end()
+        if set(schema) & {'format', 'pattern', 'maxLength', 'enum'}:
+            fb.block("else:")
+            _emit_string_checks(fb, schema, loc)
+            fb.end()
+    elif json_type == 'integer':
+        fb.block("if type(value) is not int and not _lax_int(value):")
+        fb.error(loc, "정수여야 합니다")
+        fb.end()
+    elif json_type == 'number':
+        fb.block("if type(value) is not float and type(value) is not int and not _lax_number(value):")
+        fb.error(loc, "숫자여야 합니다")
+        fb.end()
+    elif json_type == 'boolean':
+        fb.block("if type(value) is not bool and not _lax_bool(value):")
+        fb.error(loc, "true/false여야 합니다")
+        fb.end()
+    elif json_type == 'object':
+        fb.block("if type(value) is not dict:")
+        fb.error(loc, "객체여야 합니다")
+        fb.end()
+    elif json_type == 'array':
+        item_type = schema.get('items', {}).get('type')
+        if item_type == 'integer':
+            fb.block("if type(value) is not list or not all(type(item) is int or _lax_int(item) for item in value):")
+            fb.error(loc, "정수 배열이어야 합니다")
+        else:
+            fb.block("if type(value) is not list:")
+            fb.error(loc, "배열이어야 합니다")
+        fb.end()
+
+
+def _emit_param(fb, source, param, location):
+    """경로/쿼리 파라미터 하나 (값은 항상 문자열)"""
+    name = param['name']
+    schema = param_schema(param)
+    loc = (location, name)
+    required = location == 'path' or bool(param.get('required'))
+    json_type = schema['type']
+    simple = json_type == 'string' and not set(schema) & {'format', 'enum'}
+    if simple and not required:
+        return
+    fb.emit(f"value = {source}.get({name!r})")
+    if required:
+        fb.block("if value is None:")
+        fb.error(loc, "필수 값입니다")
+        fb.end()
+        if simple:
+            return
+        fb.block("else:")
+    else:
+        fb.block("if value is not None:")
+    if json_type in ('integer', 'number'):
+        parse = 'int' if json_type == 'integer' else 'float'
+        fb.block("try:")
+        fb.emit(f"number = {parse}(value)")
+        fb.end()
+        fb.block("except ValueError:")
+        fb.error(loc, "정수여야 합니다" if json_type == 'integer' else "숫자여야 합니다")
+        fb.end()
+        if 'minimum' in schema:
+            fb.block("else:")
+            fb.block(f"if number < {schema['minimum']!r} or number > {schema['maximum']!r}:")
+            fb.error(loc, f"{schema['minimum']} 이상 {schema['maximum']} 이하여야 합니다")
+            fb.end()
+            fb.end()
+    elif json_type == 'boolean':
+        fb.block(f"if value.lower() not in {fb.const(BOOL_STRINGS)}:")
+        fb.error(loc, "true/false여야 합니다")
+        fb.end()
+    else:
+        _emit_string_checks(fb, schema, loc)
+    fb.end()
+
+
+def _emit_json_body(fb, endpoint):
+    required = [field for field in endpoint.body_required if field in endpoint.body]
+    fb.block("if not body:")
+    if required:
+        fb.error(('body',), "요청 본문이 필요합니다")
+    fb.emit("return errors")
+    fb.end()
+    fb.block("if content_type and 'json' not in content_type:")
+    fb.error(('header', 'content-type'), "application/json 본문이어야 합니다")
+    fb.emit("return errors")
+    fb.end()
+    fb.block("try:")
+    fb.emit("data = _loads(body)")
+    fb.end()
+    fb.block("except ValueError:")
+    fb.error(('body',), "JSON 형식이 아닙니다")
+    fb.emit("return errors")
+    fb.end()
+    fb.block("if type(data) is not dict:")
+    fb.error(('body',), "JSON 객체여야 합니다")
+    fb.emit("return errors")
+    fb.end()
+    for field, type_text in endpoint.body.items():
+        schema, _ = field_schema(type_text)
+        loc = ('body', field)
+        nullable = isinstance(schema['type'], list)
+        fb.emit(f"value = data.get({field!r}, _MISSING)")
+        fb.block("if value is _MISSING:")
+        if field in required:
+            fb.error(loc, "필수 값입니다")
+        else:
+            fb.emit("pass")
+        fb.end()
+        fb.block("elif value is None:")
+        if nullable:
+            fb.emit("pass")
+        else:
+            fb.error(loc, "null일 수 없습니다")
+        fb.end()
+        fb.block("else:")
+        _emit_value_check(fb, schema, loc)
+        fb.end()
+
+
+def _emit_multipart_body(fb, endpoint):
+    """multipart 본문은 Content-Type과 필수 필드 이름 존재만 확인 (파트를 파싱하지 않음)"""
+    fb.block(f"if not content_type.startswith({MULTIPART_MEDIA_TYPE!r}):")
+    fb.error(('header', 'content-type'), "multipart/form-data 본문이어야 합니다")
+    fb.emit("return errors")
+    fb.end()
+    for field in endpoint.body_required:
+        marker = f'name="{field}"'.encode('utf-8')
+        fb.block(f"if {marker!r} not in body:")
+        fb.error(('body', field), "필수 값입니다")
+        fb.end()
+
+
+def function_source(endpoint, constants):
+    """API 하나의 검증 함수 소스, 검사할 것이 없으면 None
+
+    함수 시그니처: (params, query, body, content_type) -> 오류 목록 (통과하면 빈 리스트)
+    params는 경로 파라미터 dict, query는 쿼리 dict, body는 bytes, content_type은 소문자 문자열.
+    """
+    fb = _FunctionBuilder(constants)
+    fb.emit("errors = []")
+    for param in endpoint.path_params:
+        _emit_param(fb, 'params', param, 'path')
+    for param in endpoint.query_params:
+        _emit_param(fb, 'query', param, 'query')
+    if endpoint.body:
+        multipart = any(str(type_text).lower().startswith('file') for type_text in endpoint.body.values())
+        (_emit_multipart_body if multipart else _emit_json_body)(fb, endpoint)
+    fb.emit("return errors")
+    if len(fb.lines) == 2:
+        return None
+    name = f"validate_{endpoint.id.replace('.', '_')}"
+    header = f"def {name}(params, query, body, content_type):\n"
+    return name, header + '\n'.join(fb.lines) + '\n'
+
+
+class RequestValidator:
+    """카탈로그의 모든 API 검증 함수를 한 모듈로 생성, 컴파일해 보관"""
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog or load_catalog()
+        constants = {}
+        sources = {}
+        for endpoint in self.catalog:
+            result = function_source(endpoint, constants)
+            if result is not None:
+                sources[endpoint.id] = result
+        namespace = dict(_RUNTIME)
+        namespace.update(constants.values())
+        self.sources = {api_id: source for api_id, (_, source) in sources.items()}
+        self.source = '\n\n'.join(self.sources.values())
+        exec(compile(self.source, '<request_validator>', 'exec'), namespace)
+        self.functions = {api_id: namespace[name] for api_id, (name, _) in sources.items()}
+        # 쿼리 파라미터를 검사하는 API만 쿼리스트링을 파싱한다
+        self.uses_query = frozenset(endpoint.id for endpoint in self.catalog
+                                    if endpoint.id in self.functions and endpoint.query_params)
+
+    def validate(self, endpoint, params, query='', body=b'', content_type=''):
+        """매칭된 API 요청 검사 -> 오류 목록 [{"loc": [...], "msg": ...}] (통과하면 빈 튜플)
+
+        query는 쿼리스트링 또는 이미 파싱한 dict.
+        """
+        func = self.functions.get(endpoint.id)
+        if func is None:
+            return ()
+        if type(query) is str:
+            query = _parse_query(query) if query and endpoint.id in self.uses_query else {}
+        return func(params, query, body or b'', content_type.lower())
+
+    def validate_request(self, method, target, body=b'', content_type=''):
+        """(API 또는 None, 오류 목록) - 게이트웨이처럼 경로 매칭부터 할 때"""
+        path, query = split_target(target)
+        match = self.catalog.match(method, path)
+        if match is None:
+            return None, ()
+        return match.endpoint, self.validate(match.endpoint, match.params, query, body, content_type)
+
+
+def error_body(errors):
+    """422 응답 본문 (API 명세의 invalid_request 형식 + 오류 목록)"""
+    return {"message": INVALID_REQUEST, "data": {"errors": list(errors)}}
+
+
+def sample_requests(catalog):
+    """부하 테스트 요청 틀로 만든 API별 정상 요청 (API, 경로, 쿼리스트링, 본문 bytes, Content-Type)"""
+    from urllib.parse import urlencode
+
+    from load_test import build_templates
+
+    requests = []
+    for template in build_templates(catalog).values():
+        method, path, query, headers, body = template.build({}, 'token')
+        content_type = headers.get('Content-Type', '')
+        if isinstance(body, dict):
+            body = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json'
+        requests.append((method, path + ('?' + urlencode(query) if query else ''), body or b'', content_type))
+    return requests
+
+
+def bench(validator, repeat):
+    requests = sample_requests(validator.catalog)
+    rejected = 0
+    for method, target, body, content_type in requests:
+        endpoint, errors = validator.validate_request(method, target, body, content_type)
+        if errors:
+            rejected += 1
+            print(f"  ⚠️ 정상 요청 거절: {endpoint.id} {method} {target} {errors}")
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for method, target, body, content_type in requests:
+            validator.validate_request(method, target, body, content_type)
+    elapsed = time.perf_counter() - started
+    total = repeat * len(requests)
+    print(f"정상 요청 {len(requests)}개 중 거절 {rejected}개, "
+          f"요청당 {elapsed / total * 1e6:.2f}µs (경로 매칭 포함, {total:,}회)")
+    return rejected
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="API 카탈로그 기반 요청 검증기")
+    parser.add_argument('--dump', nargs='*', metavar='API_ID',
+                        help="생성된 검증 함수 소스 출력 (API ID를 주면 해당 API만)")
+    parser.add_argument('--bench', action='store_true', help="정상 요청 오탐 확인 및 요청당 검증 시간 측정")
+    parser.add_argument('--repeat', type=int, default=2000, help="--bench 반복 횟수 (기본값: 2000)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    started = time.perf_counter()
+    validator = RequestValidator()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"검증 함수 {len(validator.functions)}개 컴파일 ({elapsed:.1f}ms, API {len(validator.catalog)}개)")
+    if args.dump is not None:
+        for api_id, source in validator.sources.items():
+            if not args.dump or api_id in args.dump:
+                print(source)
+    if args.bench:
+        return 1 if bench(validator, args.repeat) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
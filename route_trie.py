@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 경로 매칭 트라이
+카탈로그의 템플릿 경로(/api/posts/{post_id}/comments/{comment_id})를 세그먼트 단위 트라이로 컴파일해서
+실제 요청 경로를 API와 경로 파라미터로 경로 길이에 비례하는 시간에 되돌린다
+"""
+
+from collections import namedtuple
+from urllib.parse import unquote
+
+RouteMatch = namedtuple('RouteMatch', ['endpoint', 'params'])
+
+
+class _Node:
+    __slots__ = ('static', 'param', 'endpoints')
+
+    def __init__(self):
+        self.static = {}      # 고정 세그먼트 -> _Node
+        self.param = None     # {name} 세그먼트 -> _Node (이름은 API별로 다를 수 있어 따로 보관)
+        self.endpoints = {}   # 메서드 -> (endpoint, 파라미터 이름 튜플)
+
+
+def _split(path):
+    """'/api/posts/3/' -> ['api', 'posts', '3'] (앞뒤 슬래시 무시)"""
+    return path.strip('/').split('/') if path.strip('/') else []
+
+
+def split_target(target):
+    """요청 대상에서 쿼리스트링/프래그먼트를 떼어 (경로, 쿼리스트링) 반환"""
+    path, _, query = target.partition('?')
+    path = path.partition('#')[0]
+    # 프록시 형식의 절대 URL(GET http://host/api/...)도 허용
+    if '://' in path:
+        path = '/' + path.split('://', 1)[1].partition('/')[2]
+    return path, query
+
+
+class RouteTrie:
+    """(메서드, 경로) -> API 매칭기
+
+    같은 위치에 고정 세그먼트와 파라미터가 모두 있으면 고정 세그먼트를 먼저 시도한다
+    (/api/vendors/my-vendor 가 /api/vendors/{vendor_id} 보다 우선).
+    """
+
+    def __init__(self, endpoints=()):
+        self._root = _Node()
+        self._size = 0
+        for endpoint in endpoints:
+            self.add(endpoint)
+
+    def add(self, endpoint):
+        """method/path 속성을 가진 API 레코드 등록"""
+        node = self._root
+        names = []
+        for segment in _split(endpoint.path):
+            if segment.startswith('{') and segment.endswith('}'):
+                names.append(segment[1:-1])
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+        method = endpoint.method.upper()
+        if method in node.endpoints:
+            raise ValueError(f"중복된 API 경로: {method} {endpoint.path}")
+        node.endpoints[method] = (endpoint, tuple(names))
+        self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def _search(self, node, segments, index, method, values):
+        if index == len(segments):
+            return node.endpoints.get(method)
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._search(child, segments, index + 1, method, values)
+            if found is not None:
+                return found
+        if node.param is not None and segment:
+            values.append(segment)
+            found = self._search(node.param, segments, index + 1, method, values)
+            if found is not None:
+                return found
+            values.pop()
+        return None
+
+    def match(self, method, path):
+        """경로에 맞는 RouteMatch(endpoint, params) 반환, 없으면 None
+
+        HEAD 요청은 같은 경로의 GET API로도 매칭한다.
+        """
+        method = method.upper()
+        segments = _split(path)
+        values = []
+        found = self._search(self._root, segments, 0, method, values)
+        if found is None and method == 'HEAD':
+            found = self._search(self._root, segments, 0, 'GET', values)
+        if found is None:
+            return None
+        endpoint, names = found
+        return RouteMatch(endpoint, dict(zip(names, (unquote(v) for v in values), strict=True)))
+
+    def allowed_methods(self, path):
+        """경로는 맞지만 메서드가 다를 때(405) 허용되는 메서드 목록"""
+        segments = _split(path)
+        allowed = set()
+        stack = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            if index == len(segments):
+                allowed.update(node.endpoints)
+                continue
+            child = node.static.get(segments[index])
+            if child is not None:
+                stack.append((child, index + 1))
+            if node.param is not None and segments[index]:
+                stack.append((node.param, index + 1))
+        return sorted(allowed)
+
+    def classify(self, request_line):
+        """'GET /api/posts/3?page=1 HTTP/1.1' 같은 요청 라인을 RouteMatch로 분류, 실패하면 None"""
+        parts = request_line.split()
+        if len(parts) < 2:
+            return None
+        path, _ = split_target(parts[1])
+        return self.match(parts[0], path)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정적 빌드 산출물 기록기
+명세서 빌드 결과를 내용 해시가 붙은 파일 이름(section-3.1a2b3c4d5e.html)으로 쓰고,
+nginx gzip_static / brotli_static이 그대로 내보낼 수 있게 .gz / .br 사전 압축 파일을 옆에 만든다.
+기록한 파일은 manifest.json에 (논리 이름 -> 실제 파일, 크기, sha256) 으로 남긴다.
+
+HTML 조각을 문자열 이터레이터로 받아 파일, 해시, 압축기에 동시에 흘려 보내므로
+전체 페이지를 메모리에 만들지 않는다.
+
+brotli는 선택 의존성이다 (pip install brotli). 없으면 .gz만 만든다.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+# 파일 이름에 붙이는 내용 해시 길이 (hex)
+FINGERPRINT_LENGTH = 10
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+# 출력 파일 버퍼 크기 - 작은 HTML 조각을 모아서 큰 단위로 기록
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# mkstemp는 0600으로 만드므로 웹 서버가 읽을 수 있게 보통 파일과 같은 권한으로 바꾼다
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+
+def fingerprint_name(name, digest):
+    """'sections/section-3.html' + sha256 hex -> 'sections/section-3.<해시 앞 10자리>.html'"""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest[:FINGERPRINT_LENGTH]}{ext}"
+
+
+def remove_compressed(path):
+    """path의 .gz/.br 사본 삭제 (압축 없이 다시 쓴 파일의 오래된 사본을 nginx가 내보내지 않도록)"""
+    for suffix in COMPRESSED_SUFFIXES:
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+class _Sink:
+    """임시 파일 하나 + (선택) 압축기"""
+
+    def __init__(self, directory, kind):
+        fd, self.tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        os.fchmod(fd, FILE_MODE)
+        self.file = os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE)
+        self.kind = kind
+        if kind == 'gz':
+            # filename/mtime을 비워 같은 내용이면 같은 .gz가 나오게 한다
+            self.stream = gzip.GzipFile(filename='', mode='wb', fileobj=self.file,
+                                        compresslevel=GZIP_LEVEL, mtime=0)
+        elif kind == 'br':
+            self.stream = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self.stream = None
+        self.size = 0
+
+    def write(self, data):
+        if self.kind == 'br':
+            self.file.write(self.stream.process(data))
+        elif self.stream is not None:
+            self.stream.write(data)
+        else:
+            self.file.write(data)
+
+    def close(self):
+        if self.kind == 'br':
+            self.file.write(self.stream.finish())
+        elif self.stream is not None:
+            self.stream.close()
+        self.size = self.file.tell()
+        self.file.close()
+
+    def discard(self):
+        if not self.file.closed:
+            self.file.close()
+        try:
+            os.remove(self.tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+class ArtifactWriter:
+    """빌드 산출물을 root 아래에 기록
+
+    fingerprint: 파일 이름에 내용 해시를 붙인다 (write의 fingerprint 인자로 파일별 재정의, 진입 페이지는 False)
+    precompress: .gz(와 brotli가 있으면 .br) 사본을 함께 쓴다. 끄면 예전 사본을 지운다.
+    """
+
+    def __init__(self, root, fingerprint=False, precompress=False):
+        self.root = root
+        self.fingerprint = fingerprint
+        self.precompress = precompress
+        self.entries = {}
+        os.makedirs(root, exist_ok=True)
+
+    @property
+    def compressions(self):
+        if not self.precompress:
+            return ()
+        return ('gz', 'br') if brotli is not None else ('gz',)
+
+    def write(self, name, chunks, fingerprint=None):
+        """chunks(문자열/bytes 하나 또는 그 이터레이터)를 논리 이름 name으로 기록, 실제 상대 경로 반환
+
+        임시 파일에 쓴 뒤 바꿔치기하므로 쓰는 도중의 파일이 서비스되지 않는다.
+        """
+        if isinstance(chunks, (str, bytes)):
+            chunks = (chunks,)
+        fingerprint = self.fingerprint if fingerprint is None else fingerprint
+        directory = os.path.join(self.root, os.path.dirname(name))
+        os.makedirs(directory, exist_ok=True)
+        sinks = [_Sink(directory, None)] + [_Sink(directory, kind) for kind in self.compressions]
+        digest = hashlib.sha256()
+        try:
+            for chunk in chunks:
+                data = chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+                digest.update(data)
+                for sink in sinks:
+                    sink.write(data)
+            for sink in sinks:
+                sink.close()
+        except BaseException:
+            for sink in sinks:
+                sink.discard()
+            raise
+
+        sha256 = digest.hexdigest()
+        relative = fingerprint_name(name, sha256) if fingerprint else name
+        path = os.path.join(self.root, relative)
+        raw, compressed = sinks[0], sinks[1:]
+        os.replace(raw.tmp_path, path)
+        entry = {"file": relative.replace(os.sep, '/'), "bytes": raw.size, "sha256": sha256}
+        remove_compressed(path)
+        for sink in compressed:
+            # 압축해도 작아지지 않으면 사본을 두지 않는다 (nginx는 원본을 내보낸다)
+            if sink.size < raw.size:
+                os.replace(sink.tmp_path, f"{path}.{sink.kind}")
+                entry[f"{sink.kind}_bytes"] = sink.size
+            else:
+                sink.discard()
+        self.entries[name] = entry
+        return entry["file"]
+
+    def written(self):
+        """이번에 쓴 파일의 root 기준 경로 집합 (압축 사본 포함)"""
+        files = set()
+        for entry in self.entries.values():
+            files.add(entry["file"])
+            files.update(f"{entry['file']}.{kind}" for kind in ('gz', 'br') if f"{kind}_bytes" in entry)
+        return files
+
+    def prune(self, directory, prefix):
+        """directory(root 기준)에서 prefix로 시작하는 파일 중 이번에 쓰지 않은 것 삭제, 삭제 개수 반환
+
+        내용 해시 이름을 쓰면 내용이 바뀔 때마다 이름이 바뀌므로 예전 파일을 치워야 한다.
+        """
+        written = self.written()
+        removed = 0
+        base = os.path.join(self.root, directory)
+        for name in os.listdir(base):
+            relative = os.path.join(directory, name).replace(os.sep, '/') if directory else name
+            if name.startswith(prefix) and not name.endswith('.tmp') and relative not in written:
+                os.remove(os.path.join(base, name))
+                removed += 1
+        return removed
+
+    def write_manifest(self, name='manifest.json'):
+        """논리 이름 -> 실제 파일 정보 manifest 기록 (내용이 같으면 같은 파일이 나오도록 시각은 넣지 않는다)"""
+        manifest = {
+            "fingerprint": self.fingerprint,
+            "compression": list(self.compressions),
+            "files": dict(sorted(self.entries.items())),
+        }
+        path = os.path.join(self.root, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return path
+
+    def remove_manifest(self, name='manifest.json'):
+        """예전 빌드의 manifest 삭제 (manifest 없이 다시 빌드하면 지워진 파일을 가리키게 되므로)"""
+        try:
+            os.remove(os.path.join(self.root, name))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,90 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+import generate_api_docs as g
+from api_catalog import load_catalog
+from api_search_index import build_search_index, search, tokenize
+
+QUERIES = ['예산을', '사용자', '게시글을', '을예산', '예산', '벡터 검색을', 'posts', '3.2', '게', 'user_id 예산']
+
+
+@pytest.fixture(scope='module')
+def index():
+    return build_search_index(load_catalog())
+
+
+def _ids(index, query):
+    return {api_id for _, api_id in search(index, query, limit=len(index['docs']))}
+
+
+def test_tokenize_hangul_bigrams():
+    assert tokenize('게시글') == ['게시', '시글']
+    assert tokenize('글') == ['글']
+
+
+def test_tokenize_words():
+    tokens = tokenize('GET /api/posts/{post_id} (3.2)')
+    assert {'get', 'api', 'posts', 'post_id', 'post', 'id', '3.2'} <= set(tokens)
+    assert 'PostDetailResponse'.lower() in tokenize('PostDetailResponse')
+    assert {'post', 'detail', 'response'} <= set(tokenize('PostDetailResponse'))
+    assert tokenize('_') == []
+
+
+def test_index_postings_follow_terms(index):
+    assert index['terms'] == sorted(index['terms'])
+    assert len(index['postings']) == len(index['terms'])
+    assert all(entry >> 2 < len(index['docs']) for postings in index['postings'] for entry in postings)
+
+
+def test_trailing_particle_is_ignored(index):
+    assert _ids(index, '예산을')
+    assert _ids(index, '예산을') == _ids(index, '예산')
+
+
+def test_only_trailing_bigram_may_be_missing(index):
+    # "을예"가 없으므로 "예산"이 있어도 일치하지 않는다
+    assert _ids(index, '을예산') == set()
+    assert _ids(index, '사용자') <= _ids(index, '사용')
+
+
+def test_two_syllable_word_needs_its_bigram(index):
+    assert search(index, '쀍쀍') == []
+
+
+def test_words_are_anded(index):
+    both = _ids(index, 'user_id 예산')
+    assert both <= _ids(index, 'user_id') & _ids(index, '예산')
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="node가 없음")
+def test_page_script_matches_python(index):
+    html = g.generate_html(load_catalog(), search_src='search-index.js')
+    script = html[html.index('const WORD_RE'):]
+    consts = script[:script.index('\n', script.index('const HANGUL_RE'))]
+    functions = script[script.index('function lookup'):script.index('function search()')]
+    runner = '''
+const index = %s;
+const out = [];
+for (const query of %s) {
+  let scores = null;
+  for (const word of query.toLowerCase().match(WORD_RE) || []) {
+    const found = match(word);
+    if (scores === null) { scores = found; } else {
+      const next = new Map();
+      for (const [doc, score] of scores) if (found.has(doc)) next.set(doc, score + found.get(doc));
+      scores = next;
+    }
+    if (!scores.size) break;
+  }
+  const ranked = Array.from(scores || []).sort((a, b) => b[1] - a[1] || a[0] - b[0]).slice(0, 20);
+  out.push(ranked.map(([doc, score]) => [score, index.docs[doc][0]]));
+}
+console.log(JSON.stringify(out));
+''' % (json.dumps(index, ensure_ascii=False), json.dumps(QUERIES, ensure_ascii=False))
+    result = subprocess.run(['node', '-e', consts + '\n' + functions + runner],
+                            capture_output=True, text=True, check=True)
+    for query, ranked in zip(QUERIES, json.loads(result.stdout), strict=True):
+        assert ranked == [list(hit) for hit in search(index, query)], query
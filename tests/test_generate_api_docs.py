@@ -0,0 +1,79 @@
+import copy
+import json
+
+import pytest
+
+import generate_api_docs as g
+from api_catalog import API_DATA_PATH
+
+
+@pytest.fixture(scope='module')
+def api_data():
+    with open(API_DATA_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _edit_first_api(api_data):
+    data = copy.deepcopy(api_data)
+    data['sections'][0]['apis'][0]['description'] += ' (수정)'
+    return data
+
+
+def test_fragment_cache_reuses_unchanged_fragments(api_data, tmp_path):
+    first = g.FragmentCache(str(tmp_path))
+    html = g.generate_html(api_data, cache=first)
+    assert first.hits == 0 and first.misses > 0
+
+    second = g.FragmentCache(str(tmp_path))
+    assert g.generate_html(api_data, cache=second) == html
+    assert second.hits == first.misses and second.misses == 0
+
+
+def test_fragment_cache_rerenders_only_edited_api(api_data, tmp_path):
+    g.generate_html(api_data, cache=g.FragmentCache(str(tmp_path)))
+    edited = _edit_first_api(api_data)
+
+    cache = g.FragmentCache(str(tmp_path))
+    html = g.generate_html(edited, cache=cache)
+    assert html == g.generate_html(edited)
+    assert '(수정)' in html
+    # 목록 행과 상세 조각 하나씩만 다시 렌더링
+    assert cache.misses == 2
+    # 수정 전 조각 두 개가 이번 빌드에서 쓰이지 않았다
+    assert cache.prune() == 2
+
+
+def test_memory_fragment_cache_matches_disk_cache(api_data):
+    cache = g.MemoryFragmentCache()
+    html = g.generate_html(api_data, cache=cache)
+    assert html == g.generate_html(api_data)
+
+    cache.reset()
+    g.generate_html(_edit_first_api(api_data), cache=cache)
+    assert cache.misses == 2
+    assert cache.prune() == 2
+
+
+@pytest.mark.parametrize('options', [{}, {'shared': True}])
+def test_parallel_output_matches_serial(api_data, options):
+    assert g.generate_html(api_data, jobs=3, **options) == g.generate_html(api_data, **options)
+
+
+def test_parallel_output_with_cache_matches_serial(api_data, tmp_path):
+    serial = g.generate_html(api_data)
+    # 처음(전부 미스)과 두 번째(전부 적중) 빌드 모두 같아야 한다
+    for _ in range(2):
+        cache = g.FragmentCache(str(tmp_path))
+        assert g.generate_html(api_data, cache=cache, jobs=2) == serial
+    assert cache.misses == 0
+
+
+def test_parallel_split_output_matches_serial(api_data, tmp_path):
+    serial_dir, parallel_dir = tmp_path / 'serial', tmp_path / 'parallel'
+    g.write_split(api_data, str(serial_dir))
+    g.write_split(api_data, str(parallel_dir), jobs=3)
+    serial = sorted(p.relative_to(serial_dir) for p in serial_dir.rglob('*') if p.is_file())
+    parallel = sorted(p.relative_to(parallel_dir) for p in parallel_dir.rglob('*') if p.is_file())
+    assert serial == parallel
+    for name in serial:
+        assert (serial_dir / name).read_bytes() == (parallel_dir / name).read_bytes()
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from api_catalog import load_catalog
+from request_validator import RequestValidator, error_body, sample_requests
+
+
+@pytest.fixture(scope='module')
+def validator():
+    return RequestValidator(load_catalog())
+
+
+def test_generated_functions_are_compiled(validator):
+    assert validator.functions
+    assert set(validator.functions) == set(validator.sources)
+    for api_id, func in validator.functions.items():
+        assert func.__name__ in validator.sources[api_id]
+
+
+def test_sample_requests_pass(validator):
+    for method, target, body, content_type in sample_requests(validator.catalog):
+        endpoint, errors = validator.validate_request(method, target, body, content_type)
+        assert endpoint is not None, target
+        assert not errors, (method, target, errors)
+
+
+def test_missing_required_body_fields(validator):
+    endpoint, errors = validator.validate_request('POST', '/api/posts', b'{}', 'application/json')
+    assert endpoint.id == '3.3'
+    assert [error['loc'] for error in errors] == [['body', 'title'], ['body', 'content']]
+
+
+def test_invalid_query_param(validator):
+    _, errors = validator.validate_request('GET', '/api/posts?page=abc')
+    assert [error['loc'] for error in errors] == [['query', 'page']]
+
+
+def test_query_dict_is_accepted(validator):
+    endpoint = validator.catalog.resolve('GET /api/posts')
+    assert not validator.validate(endpoint, {}, {'page': '2'})
+
+
+def test_malformed_json_body_is_rejected(validator):
+    _, errors = validator.validate_request('POST', '/api/posts', b'{"title":', 'application/json')
+    assert errors and errors[0]['loc'][0] == 'body'
+
+
+def test_unknown_route(validator):
+    assert validator.validate_request('GET', '/api/does-not-exist') == (None, ())
+
+
+def test_error_body_is_json_serializable(validator):
+    _, errors = validator.validate_request('POST', '/api/posts', b'{}', 'application/json')
+    body = json.loads(json.dumps(error_body(errors), ensure_ascii=False))
+    assert body['data']['errors'] == list(errors)
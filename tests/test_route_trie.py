@@ -0,0 +1,75 @@
+from collections import namedtuple
+
+import pytest
+
+from route_trie import RouteTrie, split_target
+
+Api = namedtuple('Api', ['method', 'path'])
+
+
+@pytest.fixture
+def trie():
+    return RouteTrie([
+        Api('GET', '/api/vendors/{vendor_id}'),
+        Api('GET', '/api/vendors/my-vendor'),
+        Api('PUT', '/api/vendors/{vendor_id}'),
+        Api('GET', '/api/posts/{post_id}/comments'),
+        Api('GET', '/api/posts/{post_id}/comments/{comment_id}'),
+    ])
+
+
+def test_static_segment_wins_over_param(trie):
+    match = trie.match('GET', '/api/vendors/my-vendor')
+    assert match.endpoint.path == '/api/vendors/my-vendor'
+    assert match.params == {}
+
+
+def test_param_matches_other_values(trie):
+    match = trie.match('GET', '/api/vendors/12')
+    assert match.endpoint.path == '/api/vendors/{vendor_id}'
+    assert match.params == {'vendor_id': '12'}
+
+
+def test_falls_back_to_param_when_static_branch_has_no_method(trie):
+    # my-vendor에는 PUT이 없으므로 {vendor_id}로 되돌아가야 한다
+    match = trie.match('PUT', '/api/vendors/my-vendor')
+    assert match.endpoint == Api('PUT', '/api/vendors/{vendor_id}')
+    assert match.params == {'vendor_id': 'my-vendor'}
+
+
+def test_nested_params_are_unquoted(trie):
+    match = trie.match('GET', '/api/posts/3/comments/a%20b')
+    assert match.params == {'post_id': '3', 'comment_id': 'a b'}
+
+
+def test_head_falls_back_to_get(trie):
+    match = trie.match('HEAD', '/api/vendors/my-vendor')
+    assert match.endpoint == Api('GET', '/api/vendors/my-vendor')
+
+
+def test_head_prefers_explicit_head_route():
+    trie = RouteTrie([Api('GET', '/api/files/{file_id}'), Api('HEAD', '/api/files/{file_id}')])
+    assert trie.match('head', '/api/files/1').endpoint.method == 'HEAD'
+
+
+def test_no_match(trie):
+    assert trie.match('GET', '/api/vendors') is None
+    assert trie.match('GET', '/api/vendors//') is None
+    assert trie.match('DELETE', '/api/vendors/12') is None
+    assert trie.match('POST', '/api/vendors/12') is None
+
+
+def test_allowed_methods(trie):
+    assert trie.allowed_methods('/api/vendors/12') == ['GET', 'PUT']
+
+
+def test_duplicate_route_is_rejected(trie):
+    with pytest.raises(ValueError):
+        trie.add(Api('GET', '/api/vendors/{id}'))
+
+
+def test_classify_request_line(trie):
+    assert split_target('/api/posts/3/comments?page=2') == ('/api/posts/3/comments', 'page=2')
+    match = trie.classify('GET /api/posts/3/comments?page=2 HTTP/1.1')
+    assert match.params == {'post_id': '3'}
+    assert trie.classify('garbage') is None
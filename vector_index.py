@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+게시글 벡터 검색 로컬 구현 (Vector DB 대용)
+운영에서는 외부 Vector DB가 맡는 "게시글 벡터 검색"(GET /api/vector/posts/search)과
+"게시글 벡터 통계"(GET /api/vector/posts/stats)를 같은 계약(query, k 1-20, board_type 필터)으로
+NumPy 행렬 하나로 구현한다. 실제 벡터 저장소 없이 RAG 검색 부하 테스트를 돌리는 용도다.
+
+- 정규화한 임베딩을 float32 행렬 하나에 board_type 순으로 정렬해 두고, 게시판별 구간(start, stop)을 기록한다.
+  board_type 필터는 해당 구간의 뷰만 훑으므로 복사도, 걸러낸 뒤 다시 자르는 과정도 없다.
+- 질의 여러 개를 한 번에 행렬 곱으로 계산하고, 행 블록마다 argpartition으로 top-k 후보만 남겨 합친다
+  (전체 점수 행렬을 만들지 않아 메모리는 블록 크기에만 비례).
+- 디렉토리에 .npy로 저장하고 mmap으로 다시 열어, 100만 건 인덱스도 읽기 전용으로 바로 띄운다.
+
+임베딩 모델 대신 토큰/글자 bigram 해싱 임베더(HashingEmbedder)를 쓴다. 의미 검색 품질이 아니라
+검색 경로의 지연시간/처리량을 재는 것이 목적이다. NumPy가 필요하다.
+
+사용법:
+    python vector_index.py bench --posts 1000000                   # 합성 100만 건 검색 벤치마크
+    python vector_index.py bench --posts 200000 --save vector_posts/  # 벤치 후 인덱스 저장
+    python vector_index.py search vector_posts/ "예식장 추천" --k 5 --board-type venue_review
+    python mock_server.py --vector-index vector_posts/               # 목 서버의 10.1/10.2를 이 인덱스로 응답
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import zlib
+from urllib.parse import parse_qsl
+
+import numpy as np
+
+from api_catalog import load_catalog
+from openapi_export import param_schema
+
+EMBEDDING_DIM = 384
+
+# 검색 시 한 번에 점수를 계산하는 행 수 (질의 수 x 블록 행 수 크기의 점수 행렬만 만든다)
+BLOCK_ROWS = 65536
+
+# board_type 열거값을 카탈로그에서 찾지 못할 때 쓰는 기본값
+DEFAULT_BOARD_TYPES = ('couple', 'planner', 'venue_review', 'private', 'vault')
+
+COLLECTION_NAME = 'posts'
+
+VECTORS_FILE = 'vectors.npy'
+IDS_FILE = 'ids.npy'
+META_FILE = 'index.json'
+
+SEARCH_API = 'GET /api/vector/posts/search'
+STATS_API = 'GET /api/vector/posts/stats'
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def board_types(catalog):
+    """카탈로그 쿼리 파라미터 board_type 설명에 적힌 열거값 (게시글 목록 조회 등)"""
+    for endpoint in catalog:
+        for param in endpoint.query_params:
+            if param['name'] == 'board_type':
+                choices = param_schema(param).get('enum')
+                if choices:
+                    return tuple(choices)
+    return DEFAULT_BOARD_TYPES
+
+
+def normalize(vectors):
+    """행마다 L2 정규화 (제자리, 0벡터는 그대로)"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    vectors /= norms
+    return vectors
+
+
+class HashingEmbedder:
+    """토큰과 토큰 안 글자 bigram을 crc32로 해싱해 dim 차원에 부호와 함께 더하는 임베더
+
+    학습이 필요 없고 같은 텍스트는 항상 같은 벡터가 된다. 한국어는 어절 단위 토큰만으로는 조사 때문에
+    겹치지 않으므로 글자 bigram을 함께 쓴다.
+    """
+    name = 'hashing'
+
+    def __init__(self, dim=EMBEDDING_DIM):
+        self.dim = dim
+
+    def _features(self, text):
+        for token in TOKEN_RE.findall(text.lower()):
+            yield token
+            for i in range(len(token) - 1):
+                yield token[i:i + 2]
+
+    def embed(self, texts):
+        """텍스트 목록 -> (len(texts), dim) 정규화된 float32 행렬"""
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            hashes = np.fromiter((zlib.crc32(f.encode('utf-8')) for f in self._features(text)), dtype=np.uint32)
+            if not hashes.size:
+                continue
+            signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+            np.add.at(out[row], hashes % self.dim, signs)
+        return normalize(out)
+
+
+class VectorIndex:
+    """board_type 순으로 정렬된 정규화 임베딩 행렬 + 게시판별 구간
+
+    vectors: (N, dim) float32, ids: (N,) int64 게시글 ID, partitions: {board_type: (start, stop)}
+    """
+
+    def __init__(self, vectors, ids, partitions, embedder=None):
+        self.vectors = vectors
+        self.ids = ids
+        self.partitions = partitions
+        self.embedder = embedder or HashingEmbedder(vectors.shape[1])
+
+    @classmethod
+    def build(cls, ids, vectors, boards, embedder=None):
+        """게시글 ID, 임베딩, board_type 목록으로 인덱스 생성 (벡터는 정규화해 복사)"""
+        ids = np.asarray(ids, dtype=np.int64)
+        vectors = normalize(np.array(vectors, dtype=np.float32))
+        names, codes = np.unique(np.asarray(boards), return_inverse=True)
+        order = np.argsort(codes, kind='stable')
+        if not np.array_equal(order, np.arange(len(order))):
+            vectors, ids, codes = vectors[order], ids[order], codes[order]
+        bounds = np.searchsorted(codes, np.arange(len(names) + 1))
+        partitions = {str(name): (int(bounds[i]), int(bounds[i + 1])) for i, name in enumerate(names)}
+        return cls(np.ascontiguousarray(vectors), ids, partitions, embedder)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def dim(self):
+        return self.vectors.shape[1]
+
+    def _rows(self, board_type):
+        if board_type is None:
+            return 0, len(self.ids)
+        return self.partitions.get(board_type, (0, 0))
+
+    def search_rows(self, queries, k, board_type=None, block_rows=BLOCK_ROWS):
+        """질의 벡터 (B, dim) -> (점수 (B, k'), 행 위치 (B, k')), 점수 내림차순
+
+        k'는 min(k, 검색 구간 크기). 질의 벡터는 정규화돼 있어야 한다 (점수 = 코사인 유사도).
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        start, stop = self._rows(board_type)
+        k = min(k, stop - start)
+        if k <= 0:
+            return np.empty((len(queries), 0), dtype=np.float32), np.empty((len(queries), 0), dtype=np.int64)
+
+        best_scores, best_rows = [], []
+        for lo in range(start, stop, block_rows):
+            hi = min(lo + block_rows, stop)
+            scores = queries @ self.vectors[lo:hi].T
+            if hi - lo > k:
+                top = np.argpartition(scores, -k, axis=1)[:, -k:]
+                scores = np.take_along_axis(scores, top, axis=1)
+                rows = top + lo
+            else:
+                rows = np.broadcast_to(np.arange(lo, hi), scores.shape)
+            best_scores.append(scores)
+            best_rows.append(rows)
+        scores = np.concatenate(best_scores, axis=1)
+        rows = np.concatenate(best_rows, axis=1)
+        if scores.shape[1] > k:
+            top = np.argpartition(scores, -k, axis=1)[:, -k:]
+            scores = np.take_along_axis(scores, top, axis=1)
+            rows = np.take_along_axis(rows, top, axis=1)
+        order = np.argsort(-scores, axis=1, kind='stable')
+        return np.take_along_axis(scores, order, axis=1), np.take_along_axis(rows, order, axis=1)
+
+    def search(self, queries, k, board_type=None):
+        """질의 벡터 (B, dim) 또는 (dim,) -> (점수, 게시글 ID), 점수 내림차순"""
+        queries = np.asarray(queries, dtype=np.float32)
+        single = queries.ndim == 1
+        scores, rows = self.search_rows(queries[None, :] if single else queries, k, board_type)
+        ids = self.ids[rows]
+        return (scores[0], ids[0]) if single else (scores, ids)
+
+    def search_text(self, texts, k, board_type=None):
+        return self.search(self.embedder.embed(texts), k, board_type)
+
+    def boards_of(self, rows):
+        """행 위치 배열 -> board_type 목록"""
+        names = list(self.partitions)
+        starts = np.array([self.partitions[name][0] for name in names])
+        return [names[i] for i in np.searchsorted(starts, rows, side='right') - 1]
+
+    def stats(self):
+        return {
+            "total_documents": len(self),
+            "collection_name": COLLECTION_NAME,
+            "dimension": self.dim,
+            "partitions": {name: stop - start for name, (start, stop) in self.partitions.items()},
+        }
+
+    def save(self, directory):
+        """directory에 vectors.npy / ids.npy / index.json 저장 (임시 파일에 쓴 뒤 바꿔치기)"""
+        os.makedirs(directory, exist_ok=True)
+        for name, array in ((VECTORS_FILE, self.vectors), (IDS_FILE, self.ids)):
+            path = os.path.join(directory, name)
+            with open(path + '.tmp', 'wb') as f:
+                np.save(f, array)
+            os.replace(path + '.tmp', path)
+        meta = {"dimension": self.dim, "count": len(self), "embedder": self.embedder.name,
+                "partitions": {name: list(bounds) for name, bounds in self.partitions.items()}}
+        with open(os.path.join(directory, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, directory, mmap=True, embedder=None):
+        """save로 저장한 인덱스 열기 (mmap이면 읽기 전용 메모리 매핑 - 필요한 페이지만 읽는다)"""
+        with open(os.path.join(directory, META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        mode = 'r' if mmap else None
+        vectors = np.load(os.path.join(directory, VECTORS_FILE), mmap_mode=mode)
+        ids = np.load(os.path.join(directory, IDS_FILE), mmap_mode=mode)
+        partitions = {name: tuple(bounds) for name, bounds in meta['partitions'].items()}
+        return cls(vectors, ids, partitions, embedder or HashingEmbedder(meta['dimension']))
+
+
+def success_message(endpoint, default):
+    """API 문서의 첫 2xx 응답 message"""
+    for status in endpoint.status_codes:
+        if 200 <= status['code'] < 300:
+            return status.get('message') or default
+    return default
+
+
+class PostSearchApi:
+    """게시글 벡터 검색/통계 API를 카탈로그 계약대로 처리 (응답 형식, k 기본값/범위, message)"""
+
+    def __init__(self, index, catalog=None):
+        self.index = index
+        self.catalog = catalog or load_catalog()
+        self.search_endpoint = self.catalog.resolve(SEARCH_API)
+        self.stats_endpoint = self.catalog.resolve(STATS_API)
+        params = {p['name']: param_schema(p) for p in self.search_endpoint.query_params}
+        k_schema = params.get('k', {})
+        self.default_k = k_schema.get('default', 5)
+        self.max_k = k_schema.get('maximum', 20)
+        self.min_k = k_schema.get('minimum', 1)
+        self.search_message = success_message(self.search_endpoint, 'posts_searched')
+        self.stats_message = success_message(self.stats_endpoint, 'vector_stats_retrieved')
+
+    def search(self, query, k=None, board_type=None):
+        """(상태 코드, 응답 본문 dict)"""
+        k = self.default_k if k is None else k
+        if not query or not self.min_k <= k <= self.max_k:
+            return 422, {"message": "invalid_request", "data": None}
+        scores, rows = self.index.search_rows(self.index.embedder.embed([query]), k, board_type)
+        scores, rows = scores[0], rows[0]
+        boards = self.index.boards_of(rows)
+        results = [{"post_id": int(post_id), "score": round(float(score), 4), "board_type": board}
+                   for post_id, score, board in zip(self.index.ids[rows], scores, boards, strict=True)]
+        return 200, {"message": self.search_message,
+                     "data": {"query": query, "results": results, "total": len(results)}}
+
+    def stats(self):
+        return 200, {"message": self.stats_message, "data": self.index.stats()}
+
+    def handlers(self):
+        """목 서버용 {API ID: (경로 파라미터, 쿼리스트링, 본문) -> (상태 코드, 응답 본문)}"""
+        def search(params, query, body):
+            args = dict(parse_qsl(query, keep_blank_values=True))
+            try:
+                k = int(args['k']) if 'k' in args else None
+            except ValueError:
+                return 422, {"message": "invalid_request", "data": None}
+            return self.search(args.get('query', ''), k, args.get('board_type') or None)
+
+        return {self.search_endpoint.id: search, self.stats_endpoint.id: lambda params, query, body: self.stats()}
+
+
+def synthetic_index(posts, dim=EMBEDDING_DIM, boards=DEFAULT_BOARD_TYPES, clusters=256, seed=0):
+    """군집 구조가 있는 합성 게시글 임베딩 인덱스 (게시판별 비율은 앞쪽 게시판일수록 크게)"""
+    rng = np.random.default_rng(seed)
+    centers = normalize(rng.standard_normal((clusters, dim), dtype=np.float32))
+    weights = np.arange(len(boards), 0, -1, dtype=np.float64)
+    counts = rng.multinomial(posts, weights / weights.sum())
+    vectors = np.empty((posts, dim), dtype=np.float32)
+    chunk = 65536
+    for lo in range(0, posts, chunk):
+        hi = min(lo + chunk, posts)
+        vectors[lo:hi] = centers[rng.integers(0, clusters, hi - lo)]
+        vectors[lo:hi] += rng.standard_normal((hi - lo, dim), dtype=np.float32) * 0.08
+    normalize(vectors)
+    # build가 다시 정렬(행렬 복사)하지 않도록 이름순으로 배치한다
+    order = np.argsort(boards)
+    board_names = np.repeat(np.array(boards)[order], counts[order])
+    ids = rng.permutation(posts).astype(np.int64) + 1
+    return VectorIndex.build(ids, vectors, board_names), centers
+
+
+def bench(args):
+    started = time.perf_counter()
+    index, centers = synthetic_index(args.posts, args.dim, board_types(load_catalog()), seed=args.seed)
+    print(f"합성 인덱스 {len(index):,}건 x {index.dim}차원 생성 ({time.perf_counter() - started:.1f}s, "
+          f"{index.vectors.nbytes / 2**20:,.0f}MB) 게시판별 {index.stats()['partitions']}")
+    if args.save:
+        started = time.perf_counter()
+        index.save(args.save)
+        index = VectorIndex.load(args.save)
+        print(f"저장 후 mmap으로 다시 열기: {args.save} ({time.perf_counter() - started:.1f}s)")
+
+    rng = np.random.default_rng(args.seed + 1)
+    queries = centers[rng.integers(0, len(centers), args.queries)]
+    queries = normalize(queries + rng.standard_normal(queries.shape, dtype=np.float32) * 0.08)
+    boards = list(index.partitions)
+    for label, board_type in (("전체", None), (f"board_type={boards[-1]}", boards[-1])):
+        for batch in (1, args.batch):
+            index.search(queries[:batch], args.k, board_type)  # 페이지 캐시/BLAS 준비
+            latencies = []
+            started = time.perf_counter()
+            for lo in range(0, len(queries), batch):
+                t = time.perf_counter()
+                index.search(queries[lo:lo + batch], args.k, board_type)
+                latencies.append(time.perf_counter() - t)
+            elapsed = time.perf_counter() - started
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(f"  {label:<24} 배치 {batch:>3}: 질의 {len(queries) / elapsed:>8,.0f}/s, "
+                  f"배치당 p50={latencies[len(latencies) // 2] * 1000:.1f}ms p99={p99 * 1000:.1f}ms")
+
+    # 결과 검증 - 블록 top-k 병합이 전체 정렬과 같은지
+    sample = queries[:8]
+    _, got = index.search(sample, args.k)
+    exact = index.ids[np.argsort(-(sample @ np.asarray(index.vectors).T), axis=1)[:, :args.k]]
+    print(f"  전체 정렬 대비 top-{args.k} 일치: {np.mean([set(a) == set(b) for a, b in zip(got, exact, strict=True)]):.0%}")
+
+
+def search_command(args):
+    index = VectorIndex.load(args.index)
+    api = PostSearchApi(index)
+    status, body = api.search(args.query, args.k, args.board_type)
+    print(json.dumps(body, ensure_ascii=False, indent=2))
+    return 0 if status == 200 else 1
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="게시글 벡터 검색 로컬 구현 (NumPy)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    bench_parser = commands.add_parser('bench', help="합성 인덱스 검색 벤치마크")
+    bench_parser.add_argument('--posts', type=int, default=1_000_000, help="게시글 수 (기본값: 1000000)")
+    bench_parser.add_argument('--dim', type=int, default=EMBEDDING_DIM, help=f"차원 (기본값: {EMBEDDING_DIM})")
+    bench_parser.add_argument('--queries', type=int, default=256, help="질의 수 (기본값: 256)")
+    bench_parser.add_argument('--batch', type=int, default=32, help="배치 질의 크기 (기본값: 32)")
+    bench_parser.add_argument('--k', type=int, default=5, help="top-k (기본값: 5)")
+    bench_parser.add_argument('--seed', type=int, default=0, help="난수 시드")
+    bench_parser.add_argument('--save', metavar='DIR', help="생성한 인덱스를 저장하고 mmap으로 다시 열어 측정")
+    search_parser = commands.add_parser('search', help="저장된 인덱스로 검색 (API 응답 형식으로 출력)")
+    search_parser.add_argument('index', help="인덱스 디렉토리")
+    search_parser.add_argument('query', help="검색 쿼리")
+    search_parser.add_argument('--k', type=int, help="반환할 결과 개수 (기본값: API 문서 기본값)")
+    search_parser.add_argument('--board-type', help="게시판 타입 필터")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'bench':
+        bench(args)
+        return 0
+    return search_command(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())